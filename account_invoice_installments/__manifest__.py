@@ -13,6 +13,7 @@
     "depends": ['sale', 'product'],
     "data": [
         "data/ir_sequence.xml",
+        "data/ir_cron.xml",
         "views/menu_views.xml",
         "views/sales_orders_view.xml",
     ],
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for order-type sequence allocation
+Creates sale orders of one order type from several workers at the same time
+and reports the throughput and the slowest worker.
+
+Usage:
+    python3 bench_order_sequences.py -c /etc/odoo/odoo.conf -d mydb --workers 16
+"""
+
+import argparse
+import threading
+import time
+
+import odoo
+from odoo import api, SUPERUSER_ID
+from odoo.modules.registry import Registry
+
+
+def run_worker(dbname, partner_id, order_type, orders, batch, rollback, barrier, results, index):
+    """Create `orders` sale orders in transactions of `batch` orders"""
+    threading.current_thread().dbname = dbname
+    registry = Registry(dbname)
+    barrier.wait()
+    start = time.perf_counter()
+    created = 0
+    while created < orders:
+        size = min(batch, orders - created)
+        with registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env['sale.order'].create([
+                {'partner_id': partner_id, 'order_type': order_type}
+                for _i in range(size)
+            ])
+            if rollback:
+                cr.rollback()
+        created += size
+    results[index] = time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark order-type sequence allocation")
+    parser.add_argument('-c', '--config', required=True, help="Odoo configuration file")
+    parser.add_argument('-d', '--database', required=True, help="Database name")
+    parser.add_argument('--workers', type=int, default=16, help="Concurrent workers")
+    parser.add_argument('--orders', type=int, default=200, help="Orders created by each worker")
+    parser.add_argument('--batch', type=int, default=10, help="Orders created per transaction")
+    parser.add_argument('--order-type', default='wholesale',
+                        choices=['standard', 'custom', 'wholesale', 'subscription'])
+    parser.add_argument('--rollback', action='store_true', help="Roll back every transaction")
+    args = parser.parse_args()
+
+    odoo.tools.config.parse_config(['-c', args.config, '-d', args.database])
+    registry = Registry(args.database)
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        partner = env['res.partner'].search([('customer_rank', '>', 0)], limit=1) \
+            or env['res.partner'].search([], limit=1)
+        partner_id = partner.id
+
+    print(f"🔍 {args.workers} workers x {args.orders} '{args.order_type}' orders "
+          f"(batch of {args.batch})")
+    barrier = threading.Barrier(args.workers)
+    results = [0.0] * args.workers
+    threads = [
+        threading.Thread(target=run_worker, args=(
+            args.database, partner_id, args.order_type, args.orders, args.batch,
+            args.rollback, barrier, results, index,
+        ))
+        for index in range(args.workers)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = args.workers * args.orders
+    print(f"✅ {total} orders in {elapsed:.2f}s ({total / elapsed:.1f} orders/s)")
+    print(f"   slowest worker: {max(results):.2f}s, fastest worker: {min(results):.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,6 @@
-from . import  sales_order
\ No newline at end of file
+from . import  sales_order
+from . import ir_sequence
+from . import account_payment_term
+from . import installment_period_mixin
+from . import account_move
+from . import account_partial_reconcile
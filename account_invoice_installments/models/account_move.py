@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields
+from collections import defaultdict
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AccountMove(models.Model):
+    _inherit = 'account.move'
+
+    def _sync_installments_from_payments(self):
+        """Follow the reconciled amount of the invoices on their installments, extended by the installment modules"""
+
+    def _sync_installment_records_from_payments(self, model_name):
+        """
+        Allocate the paid amount of the invoices to their records of model_name,
+        oldest first, and return the (paid, reopened) records. Each record
+        tells what it covers through _get_reconciled_coverage(available).
+        """
+        Record = self.env[model_name]
+        invoices = self.filtered(lambda m: m.state == 'posted' and m.move_type in ('out_invoice', 'out_receipt'))
+        if not invoices:
+            return Record, Record
+        records = Record.search([
+            ('invoice_id', 'in', invoices.ids),
+            ('state', '!=', 'cancelled'),
+        ], order='invoice_id, due_date, sequence, id')
+        if not records:
+            return Record, Record
+
+        today = fields.Date.context_today(self)
+        available = {invoice.id: invoice.amount_total - invoice.amount_residual for invoice in invoices}
+        to_pay = Record
+        to_reopen = defaultdict(lambda: Record)
+        for record in records:
+            # Records settled elsewhere (statement import, allocation engine, by
+            # hand) are not backed by the reconciled amount and are left alone
+            if record.state == 'paid' and not record.paid_by_reconciliation:
+                continue
+            invoice = record.invoice_id
+            covered, consumed = record._get_reconciled_coverage(available[invoice.id])
+            available[invoice.id] -= consumed
+            if covered and record.state != 'paid':
+                to_pay |= record
+            elif not covered and record.state == 'paid':
+                to_reopen['overdue' if record.due_date < today else 'pending'] |= record
+
+        if to_pay:
+            to_pay.write({'state': 'paid', 'paid_date': today, 'paid_by_reconciliation': True})
+        reopened = Record
+        for state, group in to_reopen.items():
+            group.write({'state': state, 'paid_date': False, 'paid_by_reconciliation': False})
+            reopened |= group
+        if to_pay or reopened:
+            _logger.info(f"Synced {Record._description} of {len(invoices)} invoices: "
+                         f"{len(to_pay)} paid, {len(reopened)} reopened")
+        return to_pay, reopened
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api
+
+
+class AccountPartialReconcile(models.Model):
+    _inherit = 'account.partial.reconcile'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        partials = super().create(vals_list)
+        (partials.debit_move_id.move_id | partials.credit_move_id.move_id)._sync_installments_from_payments()
+        return partials
+
+    def unlink(self):
+        moves = self.debit_move_id.move_id | self.credit_move_id.move_id
+        result = super().unlink()
+        moves.exists()._sync_installments_from_payments()
+        return result
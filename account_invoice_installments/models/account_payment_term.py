@@ -0,0 +1,84 @@
+# models/account_payment_term.py
+import hashlib
+
+from odoo import models, fields, api
+
+
+class AccountPaymentTerm(models.Model):
+    _inherit = 'account.payment.term'
+
+    installment_signature = fields.Char(
+        string="Installment Signature",
+        index=True,
+        copy=False,
+        readonly=True,
+        help="Hash of the installment lines, used to reuse identical installment payment terms",
+    )
+
+    @api.model
+    def _get_installment_term_digits(self):
+        return self.env['decimal.precision'].precision_get('Payment Terms')
+
+    @api.model
+    def _prepare_installment_term_lines(self, lines):
+        """Round the line percentages the way they are stored"""
+        digits = self._get_installment_term_digits()
+        return [
+            dict(line, value_amount=round(line['value_amount'], digits))
+            for line in lines
+        ]
+
+    @api.model
+    def _installment_term_signature(self, lines, vals=None):
+        """
+        Canonical hash of installment lines: installment count, first payment
+        percentage, day offsets and the rounding the percentages were stored with,
+        plus the other values of the term so that terms differing on them are not shared.
+        """
+        digits = self._get_installment_term_digits()
+        canonical = ';'.join(
+            f"{line['value']}:{line['value_amount']:.{digits}f}:{line.get('nb_days', 0)}:{line.get('delay_type', 'days_after')}"
+            for line in lines
+        )
+        signature = f"{digits}|{len(lines)}|{canonical}"
+        if vals:
+            signature += '|' + ';'.join(f"{fname}:{value!r}" for fname, value in sorted(vals.items()))
+        return hashlib.sha1(signature.encode()).hexdigest()
+
+    @api.model
+    def _get_installment_term(self, lines, name, vals=None):
+        """Return the payment term with these installment lines, creating it only if none exists yet"""
+        lines = self._prepare_installment_term_lines(lines)
+        signature = self._installment_term_signature(lines, vals)
+        term = self.with_context(active_test=False).search([
+            ('installment_signature', '=', signature),
+            ('company_id', 'in', [False, self.env.company.id]),
+        ], order='active desc, id', limit=1)
+        if term:
+            if not term.active:
+                term.active = True
+            return term
+        return self.create(dict(
+            vals or {},
+            name=name,
+            installment_signature=signature,
+            line_ids=[(0, 0, line) for line in lines],
+        ))
+
+    @api.model
+    def _cron_archive_unused_installment_terms(self):
+        """Archive installment payment terms no invoice or sale order refers to anymore"""
+        self.env.cr.execute("""
+            SELECT term.id
+              FROM account_payment_term term
+             WHERE term.installment_signature IS NOT NULL
+               AND term.active
+               AND NOT EXISTS (SELECT 1 FROM account_move move
+                                WHERE move.invoice_payment_term_id = term.id)
+               AND NOT EXISTS (SELECT 1 FROM sale_order sale
+                                WHERE sale.payment_term_id = term.id)
+        """)
+        term_ids = [row[0] for row in self.env.cr.fetchall()]
+        if term_ids:
+            self.browse(term_ids).write({'active': False})
+        return len(term_ids)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, tools
+
+# Period keys of the pivots, as filled in SQL on install
+PERIOD_KEY_SQL = {
+    'due_month': "to_char(due_date, 'YYYY-MM')",
+    'due_week': "to_char(due_date, 'IYYY-\"W\"IW')",
+    'paid_month': "to_char(paid_date, 'YYYY-MM')",
+}
+
+
+class InstallmentPeriodMixin(models.AbstractModel):
+    """
+    Stored period keys of installment rows with a due date and a paid date.
+    Pivots group on these plain columns instead of truncating the dates, and
+    covering indexes on (period key, state) answer them: inheriting models
+    must store a ``state`` and the amounts of ``_period_index_include``.
+    """
+    _name = 'installment.period.mixin'
+    _description = 'Installment Period Keys'
+
+    # Amount columns carried by the period indexes, stored by the inheriting model
+    _period_index_include = ('amount',)
+
+    due_date = fields.Date(string='Due Date')
+    paid_date = fields.Date(string='Paid Date', readonly=True)
+
+    # Period Keys, grouped on as plain columns instead of truncating the dates
+    due_month = fields.Char(string='Due Month', compute='_compute_period_keys', store=True)
+    due_week = fields.Char(string='Due Week', compute='_compute_period_keys', store=True)
+    paid_month = fields.Char(string='Paid Month', compute='_compute_period_keys', store=True)
+
+    @api.depends('due_date', 'paid_date')
+    def _compute_period_keys(self):
+        for record in self:
+            due_date = record.due_date
+            record.due_month = due_date.strftime('%Y-%m') if due_date else False
+            record.due_week = due_date.strftime('%G-W%V') if due_date else False
+            record.paid_month = record.paid_date.strftime('%Y-%m') if record.paid_date else False
+
+    def _auto_init(self):
+        self._init_period_keys()
+        res = super()._auto_init()
+        self._create_period_indexes()
+        return res
+
+    def _init_period_keys(self):
+        """Fill the period keys of existing rows in one statement rather than through the ORM"""
+        if not self._auto:
+            return
+        cr = self._cr
+        if not tools.table_exists(cr, self._table):
+            return
+        missing = [column for column in PERIOD_KEY_SQL if not tools.column_exists(cr, self._table, column)]
+        for column in missing:
+            tools.create_column(cr, self._table, column, 'varchar')
+        if missing:
+            assignments = ', '.join(f"{column} = {PERIOD_KEY_SQL[column]}" for column in missing)
+            cr.execute(f"UPDATE {self._table} SET {assignments}")
+
+    def _create_period_indexes(self):
+        """Covering indexes answering the period pivots from the index alone"""
+        if not self._auto:
+            return
+        include = ', '.join(self._period_index_include)
+        for column in PERIOD_KEY_SQL:
+            self._cr.execute(f"""
+                CREATE INDEX IF NOT EXISTS {self._table}_{column}_state_index
+                    ON {self._table} ({column}, state) INCLUDE ({include})
+            """)
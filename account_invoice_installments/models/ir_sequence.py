@@ -0,0 +1,41 @@
+# models/ir_sequence.py
+from odoo import models, api
+
+
+class IrSequence(models.Model):
+    _inherit = 'ir.sequence'
+
+    @api.model
+    def _get_sequence_by_code(self, sequence_code):
+        """Return the sequence next_by_code would use for this code"""
+        company_ids = [self.env.company.id, False]
+        return self.search([
+            ('code', '=', sequence_code),
+            ('company_id', 'in', company_ids),
+        ], order='company_id', limit=1)
+
+    def _next_batch(self, count, sequence_date=None):
+        """
+        Return `count` consecutive values of this sequence.
+        Standard sequences without date ranges reserve all the numbers with a
+        single nextval() round trip, other implementations fall back to _next().
+        """
+        self.ensure_one()
+        if count <= 0:
+            return []
+        if self.implementation != 'standard' or self.use_date_range or count == 1:
+            return [self._next(sequence_date=sequence_date) for _i in range(count)]
+
+        self.env.cr.execute(
+            "SELECT nextval(%s) FROM generate_series(1, %s) ORDER BY 1",
+            ['ir_sequence_%03d' % self.id, count],
+        )
+        return [self.get_next_char(row[0]) for row in self.env.cr.fetchall()]
+
+    @api.model
+    def next_batch_by_code(self, sequence_code, count, sequence_date=None):
+        """Batch counterpart of next_by_code()"""
+        sequence = self._get_sequence_by_code(sequence_code)
+        if not sequence:
+            return [False] * count
+        return sequence._next_batch(count, sequence_date=sequence_date)
@@ -1,6 +1,14 @@
 # models/sale_order.py
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from collections import defaultdict
+
+ORDER_TYPE_SEQUENCES = {
+    'standard': 'sale.order',
+    'custom': 'custom.sale.order',
+    'wholesale': 'wholesale.sale.order',
+    'subscription': 'subscription.sale.order',
+}
 
 
 class SaleOrder(models.Model):
@@ -30,30 +38,49 @@ class SaleOrder(models.Model):
     @api.model_create_multi
     def create(self, vals_list):
         """Override create to generate sequence based on order type"""
+        # Determine sequence based on order type
+        vals_by_code = defaultdict(list)
         for vals in vals_list:
             if vals.get('name', _('New')) == _('New'):
-                # Determine sequence based on order type
                 order_type = vals.get('order_type', 'standard')
-                sequence_map = {
-                    'standard': 'sale.order',
-                    'custom': 'custom.sale.order',
-                    'wholesale': 'wholesale.sale.order',
-                    'subscription': 'subscription.sale.order',
-                }
-                seq_code = sequence_map.get(order_type, 'sale.order')
+                seq_code = ORDER_TYPE_SEQUENCES.get(order_type, 'sale.order')
+                vals_by_code[seq_code].append(vals)
 
-                try:
-                    seq_date = fields.Datetime.context_timestamp(
-                        self, fields.Datetime.to_datetime(vals.get('date_order'))
-                    ) if vals.get('date_order') else None
-                    vals['name'] = self.env['ir.sequence'].next_by_code(
-                        seq_code, sequence_date=seq_date
-                    ) or _('New')
-                except Exception as e:
-                    # Fallback to default sequence if custom sequence fails
-                    vals['name'] = self.env['ir.sequence'].next_by_code('sale.order') or _('New')
+        # Reserve the names of each order type in one call
+        for seq_code, code_vals_list in vals_by_code.items():
+            try:
+                names = self._reserve_order_names(seq_code, code_vals_list)
+            except Exception as e:
+                # Fallback to default sequence if custom sequence fails
+                names = self.env['ir.sequence'].next_batch_by_code('sale.order', len(code_vals_list))
+            for vals, name in zip(code_vals_list, names):
+                vals['name'] = name or _('New')
         return super().create(vals_list)
 
+    def _reserve_order_names(self, seq_code, vals_list):
+        """Return one sequence value per vals of the batch"""
+        sequence = self.env['ir.sequence']._get_sequence_by_code(seq_code)
+        if not sequence:
+            return [False] * len(vals_list)
+        if not sequence.use_date_range:
+            return sequence._next_batch(len(vals_list))
+
+        # Date range sequences: one reservation per order date
+        seq_dates = {}
+        vals_by_date = defaultdict(list)
+        for index, vals in enumerate(vals_list):
+            date_order = vals.get('date_order')
+            if date_order and date_order not in seq_dates:
+                seq_dates[date_order] = fields.Datetime.context_timestamp(
+                    self, fields.Datetime.to_datetime(date_order)
+                )
+            vals_by_date[seq_dates.get(date_order)].append(index)
+        names = [False] * len(vals_list)
+        for seq_date, indexes in vals_by_date.items():
+            for index, name in zip(indexes, sequence._next_batch(len(indexes), sequence_date=seq_date)):
+                names[index] = name
+        return names
+
     def action_create_standard(self):
         """Create a new standard sale order"""
         return {
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import logging
+import time
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+_logger = logging.getLogger(__name__)
+
+
+class InstallmentPerformanceCase(AccountTestInvoicingCommon):
+    """
+    Base class of the installment performance suites.
+
+    Every hot path runs on a small and a large data set. The queries the
+    large run adds are checked against a budget per extra record, so a
+    batched operation (budget 0) fails as soon as it starts querying once
+    per record. The large run must also fit in a wall-clock budget.
+    """
+
+    SMALL_SIZE = 5
+    LARGE_SIZE = 50
+    # Queries tolerated between the two runs (sequences, cache misses...)
+    QUERY_SLACK = 10
+
+    def _run_measured(self, operation):
+        """Run operation() on cold caches, return (query count, seconds)"""
+        self.env.flush_all()
+        self.env.invalidate_all()
+        query_count = self.cr.sql_log_count
+        start = time.perf_counter()
+        operation()
+        self.env.flush_all()
+        return self.cr.sql_log_count - query_count, time.perf_counter() - start
+
+    def assertScales(self, setup, operation, per_record=0, time_budget=5.0):
+        """
+        Run operation(records) with records = setup(size), for the small and
+        the large size, and check the large run against the budgets.
+        """
+        measures = []
+        for size in (self.SMALL_SIZE, self.LARGE_SIZE):
+            records = setup(size)
+            measures.append(self._run_measured(lambda: operation(records)))
+        (small_queries, _small_time), (large_queries, large_time) = measures
+        # Measured cost, to pin the budgets on
+        _logger.info(
+            "%s: %.1f queries per extra record, %.2fs for %s records",
+            self._testMethodName, (large_queries - small_queries) / (self.LARGE_SIZE - self.SMALL_SIZE),
+            large_time, self.LARGE_SIZE,
+        )
+
+        allowed = small_queries + per_record * (self.LARGE_SIZE - self.SMALL_SIZE) + self.QUERY_SLACK
+        self.assertLessEqual(
+            large_queries, allowed,
+            f"{large_queries} queries for {self.LARGE_SIZE} records against {small_queries} for "
+            f"{self.SMALL_SIZE}, over the budget of {per_record} queries per record",
+        )
+        self.assertLessEqual(
+            large_time, time_budget,
+            f"{large_time:.2f}s for {self.LARGE_SIZE} records, over the budget of {time_budget}s",
+        )
+        return measures
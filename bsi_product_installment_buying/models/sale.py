@@ -166,19 +166,17 @@ class SaleOrder(models.Model):
                         "invoice_line_ids": installable_inv_value,
                         "bsi_sale_order_id": self.id,
                     }
-                    new_inv = self.env["account.move"].create(installment_invoice_vals)
-                    # Edit: Removed extra created 0.0 value lines from new invoices
-                    if new_inv and new_inv.invoice_line_ids:
-                        for new_inv_line in new_inv.invoice_line_ids:
-                            if (
-                                not new_inv_line.product_id
-                                and new_inv_line.price_unit == 0.0
-                            ):
-                                new_inv_line.unlink()
+                    installment_invoice_vals_list.append(installment_invoice_vals)
 
                     # installment date increment
                     invoice_date = invoice_date + timedelta(days=days_in_month1)
 
+                new_invs = self.env["account.move"].create(installment_invoice_vals_list)
+                # Edit: Removed extra created 0.0 value lines from new invoices
+                new_invs.invoice_line_ids.filtered(
+                    lambda l: not l.product_id and l.price_unit == 0.0
+                ).unlink()
+
         # EDIT: Added 'not installable_order_lines' for only Installable invoice process
         if not invoice_vals_list and not installable_order_lines:
             raise self._nothing_to_invoice_error()
@@ -417,24 +415,10 @@ class SaleOrderLine(models.Model):
          selected installment
         """
         for record in self:
-            if record.installment_id:
-                installment_ids = self.env["installment.config"].search(
-                    [("id", "=", record.installment_id.id)]
-                )
-
-                total_amt = 0
-                installment_amt = 0
-
-                for i in installment_ids:
-                    if record.is_installment_invoice is True:
-                        if i.id == record.installment_id.id:
-                            total_amt = record.product_uom_qty * record.price_unit + (
-                                record.product_uom_qty * record.price_unit * i.emi / 100
-                            )
-                            installment_amt = total_amt / i.months
-                        record.installment_amt = installment_amt
-                    else:
-                        record.installment_amt = 0
+            config = record.installment_id
+            if config and record.is_installment_invoice and config.months:
+                subtotal = record.product_uom_qty * record.price_unit
+                record.installment_amt = (subtotal + subtotal * config.emi / 100) / config.months
             else:
                 record.installment_amt = 0
 
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+import logging
+import time
+
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('post_install', '-at_install', 'performance')
+class TestInstallmentBuyingPerformance(AccountTestInvoicingCommon):
+    """Query and time budgets of the installment buying hot paths, at a small and a large size"""
+
+    # Same measure as account_invoice_installments' InstallmentPerformanceCase,
+    # kept here since this module does not depend on it
+    SMALL_SIZE = 5
+    LARGE_SIZE = 50
+    QUERY_SLACK = 10
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product_a.invoice_policy = 'order'
+
+    def _measure(self, operation):
+        """Run operation() on cold caches, return (query count, seconds)"""
+        self.env.flush_all()
+        self.env.invalidate_all()
+        query_count = self.cr.sql_log_count
+        start = time.perf_counter()
+        operation()
+        self.env.flush_all()
+        return self.cr.sql_log_count - query_count, time.perf_counter() - start
+
+    def assertScales(self, setup, operation, per_record=0, time_budget=5.0):
+        """Run operation(setup(size)) at both sizes and check the large run against the budgets"""
+        measures = []
+        for size in (self.SMALL_SIZE, self.LARGE_SIZE):
+            records = setup(size)
+            measures.append(self._measure(lambda: operation(records)))
+        (small_queries, _small_time), (large_queries, large_time) = measures
+        # Measured cost, to pin the budgets on
+        _logger.info(
+            "%s: %.1f queries per extra record, %.2fs for %s records",
+            self._testMethodName, (large_queries - small_queries) / (self.LARGE_SIZE - self.SMALL_SIZE),
+            large_time, self.LARGE_SIZE,
+        )
+        allowed = small_queries + per_record * (self.LARGE_SIZE - self.SMALL_SIZE) + self.QUERY_SLACK
+        self.assertLessEqual(
+            large_queries, allowed,
+            f"{large_queries} queries for {self.LARGE_SIZE} records against {small_queries} for "
+            f"{self.SMALL_SIZE}, over the budget of {per_record} queries per record",
+        )
+        self.assertLessEqual(large_time, time_budget, f"{large_time:.2f}s, over the budget of {time_budget}s")
+
+    def _create_order(self, line_count, months):
+        config = self.env['installment.config'].create({'months': months, 'emi': 10.0})
+        order = self.env['sale.order'].create({
+            'partner_id': self.partner_a.id,
+            'order_line': [(0, 0, {
+                'product_id': self.product_a.id,
+                'product_uom_qty': 2.0,
+                'price_unit': 600.0,
+                'is_installment_invoice': True,
+                'installment_id': config.id,
+            }) for _line in range(line_count)],
+        })
+        order.action_confirm()
+        return order
+
+    def test_compute_installment_amt(self):
+        self.assertScales(
+            lambda size: self._create_order(size, months=12).order_line,
+            lambda lines: lines.mapped('installment_amt'),
+        )
+
+    def test_create_invoices(self):
+        """One installment invoice per month, the cost must stay linear in the months"""
+        self.assertScales(
+            lambda size: self._create_order(1, months=size),
+            lambda order: order._create_invoices(),
+            # One draft invoice per month, each with its own line, sale line
+            # link and dynamic lines (receivable, taxes) synced on creation
+            per_record=80,
+            time_budget=30.0,
+        )
@@ -46,8 +46,12 @@
         'security/ir.model.access.csv',
         'data/installment_data.xml',
         'views/installment_views.xml',
+        'views/payment_adjustment_views.xml',
         'views/installment_wizard_views.xml',
         'views/payment_adjustment_wizard_views.xml',
+        'views/allocation_wizard_views.xml',
+        'views/reschedule_wizard_views.xml',
+        'views/partition_wizard_views.xml',
         'views/account_move_views.xml',
         'views/menu_views.xml',
     ],
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 
 from . import installment_payment
+from . import installment_payment_partition
 from . import installment_schedule
+from . import installment_schedule_revision
+from . import installment_payment_adjustment
 from . import installment_template
 from . import installment_reminder
 from . import account_move
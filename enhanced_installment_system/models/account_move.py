@@ -71,3 +71,33 @@ class AccountMove(models.Model):
             'domain': [('installment_schedule_id', '=', self.installment_schedule_id.id)],
             'target': 'current',
         }
+
+    def _allocate_installment_amount(self, amount, strategy='oldest', paid_date=None):
+        """Allocate a received amount to the installment schedule of this invoice"""
+        self.ensure_one()
+        if not self.installment_schedule_id:
+            raise UserError(_("No installment schedule found for this invoice"))
+        return self.installment_schedule_id._allocate_amount(amount, strategy, paid_date)
+
+    @api.model
+    def _allocate_installment_receipts(self, receipts):
+        """
+        Allocate a batch of receipts given per invoice (move_id, amount, strategy, date).
+        Return {move_id: unallocated amount}.
+        """
+        moves = self.browse({receipt['move_id'] for receipt in receipts})
+        schedule_by_move = {move.id: move.installment_schedule_id.id for move in moves}
+        missing = moves.filtered(lambda m: not m.installment_schedule_id)
+        if missing:
+            raise UserError(_("No installment schedule found for: %s", ', '.join(missing.mapped('name'))))
+        unallocated = self.env['installment.schedule']._allocate_receipts([
+            dict(receipt, schedule_id=schedule_by_move[receipt['move_id']]) for receipt in receipts
+        ])
+        return {move_id: unallocated[schedule_id] for move_id, schedule_id in schedule_by_move.items()}
+
+    def _sync_installments_from_payments(self):
+        super()._sync_installments_from_payments()
+        paid, reopened = self._sync_installment_records_from_payments('installment.payment')
+        if paid:
+            paid._complete_schedules()
+        reopened.installment_schedule_id.filtered(lambda s: s.state == 'completed').write({'state': 'active'})
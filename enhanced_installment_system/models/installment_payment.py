@@ -1,15 +1,17 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import UserError, ValidationError
 from datetime import datetime, timedelta
 import logging
 
-_logger = logging.getLogger(__name__)
+from .installment_payment_partition import is_payment_table_partitioned
 
+_logger = logging.getLogger(__name__)
 
 class InstallmentPayment(models.Model):
     _name = 'installment.payment'
+    _inherit = ['installment.period.mixin']
     _description = 'Individual Installment Payment'
     _order = 'due_date, sequence'
     _rec_name = 'display_name'
@@ -30,6 +32,8 @@ class InstallmentPayment(models.Model):
     
     due_date = fields.Date(string='Due Date', required=True)
     paid_date = fields.Date(string='Paid Date', readonly=True)
+    paid_by_reconciliation = fields.Boolean(string='Paid by Reconciliation', readonly=True, copy=False,
+                                            help="Settled by the payments reconciled with the invoice, reopened if they are unreconciled")
     
     # Status and Tracking
     state = fields.Selection([
@@ -56,6 +60,15 @@ class InstallmentPayment(models.Model):
     display_name = fields.Char(string='Display Name', compute='_compute_display_name', store=True)
     total_amount = fields.Monetary(string='Total Amount', currency_field='currency_id', compute='_compute_total_amount', store=True)
     
+    # Partial Payments
+    principal_paid = fields.Monetary(string='Principal Paid', currency_field='currency_id', default=0.0, copy=False, readonly=True)
+    charges_paid = fields.Monetary(string='Charges Paid', currency_field='currency_id', default=0.0, copy=False, readonly=True, help="Late fee and interest already paid")
+    amount_paid = fields.Monetary(string='Amount Paid', currency_field='currency_id', compute='_compute_amount_paid', store=True)
+    amount_residual = fields.Monetary(string='Amount Due', currency_field='currency_id', compute='_compute_amount_paid', store=True)
+    
+    # Adjustment History
+    adjustment_ids = fields.One2many('installment.payment.adjustment', 'payment_id', string='Adjustments', readonly=True)
+    
     # Related Information
     partner_id = fields.Many2one('res.partner', string='Customer', related='installment_schedule_id.partner_id', store=True)
     invoice_id = fields.Many2one('account.move', string='Invoice', related='installment_schedule_id.invoice_id', store=True)
@@ -65,6 +78,17 @@ class InstallmentPayment(models.Model):
         for payment in self:
             payment.total_amount = payment.amount + payment.late_fee + payment.interest_amount
     
+    @api.depends('state', 'principal_paid', 'charges_paid', 'total_amount')
+    def _compute_amount_paid(self):
+        for payment in self:
+            # Payments marked paid outside the allocation engine are settled in full
+            if payment.state == 'paid':
+                payment.amount_paid = payment.total_amount
+                payment.amount_residual = 0.0
+            else:
+                payment.amount_paid = payment.principal_paid + payment.charges_paid
+                payment.amount_residual = payment.total_amount - payment.amount_paid
+    
     @api.depends('due_date', 'state')
     def _compute_is_late(self):
         today = fields.Date.today()
@@ -99,6 +123,33 @@ class InstallmentPayment(models.Model):
         for payment in self:
             payment.display_name = f"Payment {payment.sequence} - {payment.amount:,.2f} - {payment.due_date}"
     
+    # Period keys also index the amount due
+    _period_index_include = ('amount', 'amount_residual')
+
+    def _auto_init(self):
+        if not is_payment_table_partitioned(self._cr):
+            return super()._auto_init()
+        # The ORM only knows ordinary tables and would create the partitioned
+        # one again: only update its columns, which the partitions inherit
+        self._init_period_keys()
+        columns = tools.table_columns(self._cr, self._table)
+        fields_to_compute = []
+        for field in sorted(self._fields.values(), key=lambda f: f.column_order):
+            if not field.store or field.manual:
+                continue
+            if field.update_db(self, columns) and field.compute:
+                fields_to_compute.append(field)
+        self._add_sql_constraints()
+        # Created on the partitions as well
+        self._create_period_indexes()
+
+        if fields_to_compute:
+            @self.pool.post_init
+            def mark_fields_to_compute():
+                payments = self.search([], order='id')
+                for field in fields_to_compute:
+                    self.env.add_to_compute(field, payments)
+
     @api.model
     def create(self, vals):
         # Ensure currency_id is set during creation
@@ -118,14 +169,41 @@ class InstallmentPayment(models.Model):
         if self.state != 'pending':
             raise UserError(_("Only pending payments can be marked as paid"))
         
-        self.write({
+        self._mark_paid_batch()
+
+    def _get_reconciled_coverage(self, available):
+        """Return whether the reconciled amount available on the invoice covers
+        this payment, and how much of it the payment takes"""
+        # Receipts allocated to the principal are not reconciled
+        due = self.amount - self.principal_paid
+        covered = self.invoice_id.currency_id.compare_amounts(available, due) >= 0
+        # Oldest first: an uncovered payment absorbs what is left
+        return covered, due if covered else available
+
+    def _mark_paid_batch(self, paid_date=None):
+        """Mark the payable payments of the recordset as paid and complete their schedules"""
+        payments = self.filtered(lambda p: p.state in ('pending', 'overdue'))
+        if not payments:
+            return payments
+        payments.write({
             'state': 'paid',
-            'paid_date': fields.Date.today(),
+            'paid_date': paid_date or fields.Date.today(),
         })
-        
-        # Check if all payments are paid
-        if all(p.state == 'paid' for p in self.installment_schedule_id.installment_payment_ids):
-            self.installment_schedule_id.state = 'completed'
+        payments._complete_schedules()
+        return payments
+
+    def _complete_schedules(self):
+        """Complete the schedules of these payments left without any unpaid payment, in one pass"""
+        schedules = self.installment_schedule_id
+        unpaid = self._read_group(
+            [('installment_schedule_id', 'in', schedules.ids), ('state', '!=', 'paid')],
+            ['installment_schedule_id'],
+        )
+        completed = schedules - self.env['installment.schedule'].union(*(schedule for schedule, in unpaid))
+        completed = completed.filtered(lambda s: s.state != 'completed')
+        if completed:
+            completed.write({'state': 'completed'})
+        return completed
     
     def action_mark_overdue(self):
         """Mark payment as overdue"""
@@ -161,20 +239,23 @@ class InstallmentPayment(models.Model):
     
     @api.model
     def _cron_check_overdue_payments(self):
-        """Cron job to check for overdue payments"""
+        """Cron job to check for overdue payments, returns the scanned and changed row counts"""
         today = fields.Date.today()
-        overdue_payments = self.search([
+        domain = [
             ('state', '=', 'pending'),
             ('due_date', '<', today)
-        ])
+        ]
+        # Every pending payment past due, back-dated, reopened and rescheduled
+        # ones included: on a partitioned table, only the future partitions are skipped
+        overdue_payments = self.search(domain)
         
-        for payment in overdue_payments:
-            payment.action_mark_overdue()
-            _logger.info(f"Payment {payment.name} marked as overdue")
+        overdue_payments.write({'state': 'overdue'})
+        _logger.info(f"{len(overdue_payments)} payments marked as overdue")
+        return {'scanned': len(overdue_payments), 'changed': len(overdue_payments)}
     
     @api.model
     def _cron_send_payment_reminders(self):
-        """Cron job to send payment reminders"""
+        """Cron job to send payment reminders, returns the scanned and changed row counts"""
         # Send reminders 7 days before due date
         reminder_date = fields.Date.today() + timedelta(days=7)
         payments_to_remind = self.search([
@@ -185,6 +266,8 @@ class InstallmentPayment(models.Model):
         for payment in payments_to_remind:
             # Send reminder email
             payment._send_payment_reminder()
+        reminded = payments_to_remind.filtered(lambda p: p.partner_id.email)
+        return {'scanned': len(payments_to_remind), 'changed': len(reminded)}
     
     def _send_payment_reminder(self):
         """Send payment reminder email"""
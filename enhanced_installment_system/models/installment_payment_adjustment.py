@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
+
+
+class InstallmentPaymentAdjustment(models.Model):
+    _name = 'installment.payment.adjustment'
+    _description = 'Installment Payment Adjustment'
+    _order = 'date desc, id desc'
+    _rec_name = 'payment_name'
+
+    # Adjusted Payment
+    payment_id = fields.Many2one('installment.payment', string='Payment', index=True, ondelete='set null', readonly=True)
+    payment_name = fields.Char(string='Payment Reference', readonly=True, help="Kept when the payment is deleted")
+    schedule_id = fields.Many2one('installment.schedule', string='Payment Schedule', index=True, ondelete='set null', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+
+    # Change
+    source = fields.Selection([
+        ('adjustment', 'Payment Adjustment'),
+        ('reschedule', 'Rescheduling'),
+    ], string='Source', required=True, default='adjustment', readonly=True)
+    revision_id = fields.Many2one('installment.schedule.revision', string='Revision', index='btree_not_null', ondelete='set null', readonly=True)
+    old_amount = fields.Monetary(string='Old Amount', currency_field='currency_id', readonly=True)
+    new_amount = fields.Monetary(string='New Amount', currency_field='currency_id', readonly=True)
+    old_due_date = fields.Date(string='Old Due Date', readonly=True)
+    new_due_date = fields.Date(string='New Due Date', readonly=True)
+    reason = fields.Char(string='Reason', readonly=True)
+
+    # Audit
+    user_id = fields.Many2one('res.users', string='Done By', default=lambda self: self.env.user, readonly=True)
+    date = fields.Datetime(string='Date', default=fields.Datetime.now, required=True, index=True, readonly=True)
+
+    def _auto_init(self):
+        res = super()._auto_init()
+        # Per payment history ordered by date
+        tools.create_index(self._cr, 'installment_payment_adjustment_payment_date_index',
+                           self._table, ['payment_id', 'date'])
+        return res
+
+    @api.model
+    def _prepare_adjustments(self, changes, source='adjustment', reason=None, revision=None):
+        """
+        Return the create values of a list of changes.
+        Each change is a (payment, old_due_date, new_due_date, old_amount, new_amount) tuple.
+        """
+        return [{
+            'payment_id': payment.id,
+            'payment_name': payment.name,
+            'schedule_id': payment.installment_schedule_id.id,
+            'partner_id': payment.partner_id.id,
+            'currency_id': payment.currency_id.id,
+            'source': source,
+            'revision_id': revision.id if revision else False,
+            'old_amount': old_amount,
+            'new_amount': new_amount,
+            'old_due_date': old_due_date,
+            'new_due_date': new_due_date,
+            'reason': reason,
+        } for payment, old_due_date, new_due_date, old_amount, new_amount in changes]
+
+    @api.model
+    def _log_adjustments(self, changes, source='adjustment', reason=None, revision=None):
+        """Append one row per change in a single create"""
+        return self.create(self._prepare_adjustments(changes, source, reason, revision))
+
+    def write(self, vals):
+        raise UserError(_("Payment adjustments are an audit log and cannot be modified"))
+
+    def unlink(self):
+        raise UserError(_("Payment adjustments are an audit log and cannot be deleted"))
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
+from dateutil.relativedelta import relativedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+PAYMENT_TABLE = 'installment_payment'
+DEFAULT_PARTITION = 'installment_payment_default'
+INTERVAL_PARAM = 'enhanced_installment_system.partition_interval'
+PERIODS_AHEAD_PARAM = 'enhanced_installment_system.partition_periods_ahead'
+# Session setting telling the reference trigger that rows only change partition
+MOVING_ROWS_SETTING = 'installment_payment.moving_rows'
+
+PARTITION_INTERVALS = [
+    ('year', 'Year'),
+    ('quarter', 'Quarter'),
+]
+INTERVAL_MONTHS = {'year': 12, 'quarter': 3}
+
+
+def is_payment_table_partitioned(cr):
+    """Whether installment_payment is a declarative partitioned table"""
+    cr.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [PAYMENT_TABLE])
+    row = cr.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+class InstallmentPaymentPartition(models.AbstractModel):
+    _name = 'installment.payment.partition'
+    _description = 'Installment Payment Partitioning'
+
+    # Periods
+
+    @api.model
+    def _get_period_start(self, date, interval):
+        """First day of the year or quarter of the date"""
+        if interval == 'year':
+            return date.replace(month=1, day=1)
+        return date.replace(month=(date.month - 1) // 3 * 3 + 1, day=1)
+
+    @api.model
+    def _get_partition_name(self, start, interval):
+        if interval == 'year':
+            return f'{PAYMENT_TABLE}_y{start.year}'
+        return f'{PAYMENT_TABLE}_y{start.year}q{(start.month - 1) // 3 + 1}'
+
+    @api.model
+    def _get_partitions(self):
+        """Names of the existing partitions"""
+        self.env.cr.execute("""
+            SELECT c.relname
+              FROM pg_inherits i
+              JOIN pg_class c ON c.oid = i.inhrelid
+             WHERE i.inhparent = %s::regclass
+             ORDER BY c.relname
+        """, [PAYMENT_TABLE])
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _get_settings(self):
+        params = self.env['ir.config_parameter'].sudo()
+        interval = params.get_param(INTERVAL_PARAM, 'quarter')
+        periods_ahead = int(params.get_param(PERIODS_AHEAD_PARAM, 4))
+        return interval, periods_ahead
+
+    # Partitions
+
+    @api.model
+    def _create_partition(self, start, interval):
+        """Create the partition of the period, moving its rows out of the default partition"""
+        cr = self.env.cr
+        name = self._get_partition_name(start, interval)
+        end = start + relativedelta(months=INTERVAL_MONTHS[interval])
+        cr.execute(f"""
+            CREATE TABLE {name} (LIKE {PAYMENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        """)
+        # Rows outside the partitioned periods wait in the default partition,
+        # which must not hold rows of the new period when it is attached
+        cr.execute(f"SET LOCAL {MOVING_ROWS_SETTING} = 'on'")
+        cr.execute(f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                 WHERE due_date >= %(start)s AND due_date < %(end)s
+             RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+        """, {'start': start, 'end': end})
+        moved = cr.rowcount
+        cr.execute(f"SET LOCAL {MOVING_ROWS_SETTING} = 'off'")
+        cr.execute(f"""
+            ALTER TABLE {PAYMENT_TABLE} ATTACH PARTITION {name}
+            FOR VALUES FROM (%s) TO (%s)
+        """, [start, end])
+        _logger.info(f"Created partition {name} ({moved} rows moved from the default partition)")
+        return name
+
+    @api.model
+    def _ensure_partitions(self, date_from, date_to, interval):
+        """Create the missing partitions of the periods from date_from to date_to"""
+        existing = set(self._get_partitions())
+        created = []
+        start = self._get_period_start(date_from, interval)
+        while start <= date_to:
+            if self._get_partition_name(start, interval) not in existing:
+                created.append(self._create_partition(start, interval))
+            start += relativedelta(months=INTERVAL_MONTHS[interval])
+        return created
+
+    # References
+
+    @api.model
+    def _get_referencing_fields(self):
+        """Stored many2one fields pointing to installment.payment from ordinary tables"""
+        referencing = []
+        for model_name in self.env.registry:
+            model = self.env[model_name]
+            if not model._auto or model._abstract or model._transient:
+                continue
+            for field in model._fields.values():
+                if (field.type == 'many2one' and field.store and field.comodel_name == 'installment.payment'
+                        and field.ondelete in ('cascade', 'set null', 'restrict')):
+                    referencing.append((model._table, field.name, field.ondelete))
+        return sorted(referencing)
+
+    @api.model
+    def _update_reference_trigger(self):
+        """
+        Partitioned tables cannot be referenced by foreign keys without their
+        partition key, and the ORM skips the foreign keys of non ordinary
+        tables: a trigger applies the ondelete rules of the referencing fields.
+        """
+        statements = []
+        for table, column, ondelete in self._get_referencing_fields():
+            tools.create_index(self.env.cr, f'{table}__{column}_index', table, [column])
+            if ondelete == 'cascade':
+                statements.append(f"DELETE FROM {table} WHERE {column} = OLD.id;")
+            elif ondelete == 'set null':
+                statements.append(f"UPDATE {table} SET {column} = NULL WHERE {column} = OLD.id;")
+            else:
+                statements.append(f"""
+                    IF EXISTS (SELECT 1 FROM {table} WHERE {column} = OLD.id) THEN
+                        RAISE foreign_key_violation USING MESSAGE = 'installment_payment ' || OLD.id || ' is referenced by {table}';
+                    END IF;""")
+        body = '\n'.join(statements)
+        self.env.cr.execute(f"""
+            CREATE OR REPLACE FUNCTION {PAYMENT_TABLE}_delete_references() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                IF current_setting('{MOVING_ROWS_SETTING}', true) = 'on' THEN
+                    RETURN OLD;
+                END IF;
+                -- An update moving the row to another partition deletes it
+                -- from the old one: the payment still exists
+                IF EXISTS (SELECT 1 FROM {PAYMENT_TABLE} WHERE id = OLD.id) THEN
+                    RETURN OLD;
+                END IF;
+                {body}
+                RETURN OLD;
+            END
+            $$
+        """)
+        self.env.cr.execute(f"""
+            DROP TRIGGER IF EXISTS {PAYMENT_TABLE}_delete_references ON {PAYMENT_TABLE};
+            CREATE TRIGGER {PAYMENT_TABLE}_delete_references
+                AFTER DELETE ON {PAYMENT_TABLE}
+                FOR EACH ROW EXECUTE FUNCTION {PAYMENT_TABLE}_delete_references()
+        """)
+
+    # Conversion
+
+    @api.model
+    def _convert_to_partitioned(self, interval, periods_ahead):
+        """
+        Turn installment_payment into a table partitioned by due date ranges.
+        The whole table is rewritten under an exclusive lock: run it in a
+        maintenance window on large databases.
+
+        Queries filtering on literal due dates only read the partitions of
+        those dates. The overdue sweep reads every past due date, so it only
+        skips the partitions of the coming periods.
+        """
+        cr = self.env.cr
+        if is_payment_table_partitioned(cr):
+            raise UserError(_("The installment payments are already partitioned."))
+        if interval not in INTERVAL_MONTHS:
+            raise UserError(_("Unknown partition interval: %s", interval))
+
+        self.env.flush_all()
+        cr.execute(f"LOCK TABLE {PAYMENT_TABLE} IN ACCESS EXCLUSIVE MODE")
+        legacy_table = f'{PAYMENT_TABLE}_legacy'
+
+        # Views reading the table are recreated on the new one
+        cr.execute("""
+            SELECT DISTINCT v.relname, pg_get_viewdef(v.oid)
+              FROM pg_depend d
+              JOIN pg_rewrite r ON r.oid = d.objid
+              JOIN pg_class v ON v.oid = r.ev_class
+             WHERE d.refobjid = %s::regclass
+               AND v.oid != d.refobjid
+        """, [PAYMENT_TABLE])
+        views = cr.fetchall()
+        for view_name, _definition in views:
+            cr.execute(f"DROP VIEW {view_name}")
+
+        # Foreign keys to the table are replaced by the reference trigger
+        cr.execute("""
+            SELECT conname, conrelid::regclass::text
+              FROM pg_constraint
+             WHERE contype = 'f' AND confrelid = %s::regclass
+        """, [PAYMENT_TABLE])
+        for constraint, table in cr.fetchall():
+            cr.execute(f"ALTER TABLE {table} DROP CONSTRAINT {constraint}")
+
+        # Foreign keys and indexes of the table, kept on the partitioned one
+        cr.execute("""
+            SELECT conname, pg_get_constraintdef(oid)
+              FROM pg_constraint
+             WHERE contype = 'f' AND conrelid = %s::regclass
+        """, [PAYMENT_TABLE])
+        foreign_keys = cr.fetchall()
+        cr.execute("""
+            SELECT i.relname, pg_get_indexdef(x.indexrelid), x.indisunique,
+                   x.indpred IS NULL AND x.indexprs IS NULL AND x.indnatts = x.indnkeyatts,
+                   ARRAY(SELECT a.attname
+                           FROM unnest(x.indkey::int2[]) WITH ORDINALITY AS k(attnum, position)
+                           JOIN pg_attribute a ON a.attrelid = x.indrelid AND a.attnum = k.attnum
+                       ORDER BY k.position)
+              FROM pg_index x
+              JOIN pg_class i ON i.oid = x.indexrelid
+             WHERE x.indrelid = %s::regclass
+               AND NOT x.indisprimary
+        """, [PAYMENT_TABLE])
+        indexes = []
+        for index_name, definition, is_unique, is_plain, columns in cr.fetchall():
+            if is_unique:
+                # Unique indexes of a partitioned table must hold the partition key
+                if not is_plain:
+                    raise UserError(_(
+                        "The unique index %s of the installment payments cannot be partitioned: "
+                        "only unique indexes on plain columns can get the due date added.", index_name))
+                if 'due_date' not in columns:
+                    columns.append('due_date')
+                definition = f"CREATE UNIQUE INDEX {index_name} ON {PAYMENT_TABLE} ({', '.join(columns)})"
+            indexes.append((index_name, definition))
+
+        cr.execute(f"SELECT MIN(due_date) FROM {PAYMENT_TABLE}")
+        first_due_date = cr.fetchone()[0] or fields.Date.today()
+
+        cr.execute(f"ALTER TABLE {PAYMENT_TABLE} RENAME TO {legacy_table}")
+        cr.execute(f"""
+            CREATE TABLE {PAYMENT_TABLE} (LIKE {legacy_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS)
+            PARTITION BY RANGE (due_date)
+        """)
+        cr.execute(f"ALTER SEQUENCE {PAYMENT_TABLE}_id_seq OWNED BY {PAYMENT_TABLE}.id")
+        cr.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PAYMENT_TABLE} DEFAULT")
+        last_date = fields.Date.today() + relativedelta(months=INTERVAL_MONTHS[interval] * periods_ahead)
+        self._ensure_partitions(first_due_date, last_date, interval)
+
+        cr.execute(f"INSERT INTO {PAYMENT_TABLE} SELECT * FROM {legacy_table}")
+        _logger.info(f"Copied {cr.rowcount} installment payments to the partitioned table")
+        cr.execute(f"DROP TABLE {legacy_table}")
+
+        # The primary key must hold the partition key
+        cr.execute(f"ALTER TABLE {PAYMENT_TABLE} ADD CONSTRAINT {PAYMENT_TABLE}_pkey PRIMARY KEY (id, due_date)")
+        for index_name, definition in indexes:
+            cr.execute(definition.replace(f' ON {legacy_table} ', f' ON {PAYMENT_TABLE} ', 1)
+                                 .replace(f' ON public.{legacy_table} ', f' ON {PAYMENT_TABLE} ', 1))
+        tools.create_index(cr, f'{PAYMENT_TABLE}_state_due_date_index', PAYMENT_TABLE, ['state', 'due_date'])
+        for constraint, definition in foreign_keys:
+            cr.execute(f"ALTER TABLE {PAYMENT_TABLE} ADD CONSTRAINT {constraint} {definition}")
+        self._update_reference_trigger()
+
+        for view_name, definition in views:
+            cr.execute(f"CREATE VIEW {view_name} AS {definition}")
+
+        params = self.env['ir.config_parameter'].sudo()
+        params.set_param(INTERVAL_PARAM, interval)
+        params.set_param(PERIODS_AHEAD_PARAM, periods_ahead)
+        self.env.invalidate_all()
+        cr.execute(f"ANALYZE {PAYMENT_TABLE}")
+        return self._get_partitions()
+
+    # Cron
+
+    @api.model
+    def _cron_create_future_partitions(self):
+        """Cron job creating the partitions of the coming periods, returns the number created"""
+        if not is_payment_table_partitioned(self.env.cr):
+            return 0
+        interval, periods_ahead = self._get_settings()
+        today = fields.Date.today()
+        created = self._ensure_partitions(
+            today, today + relativedelta(months=INTERVAL_MONTHS[interval] * periods_ahead), interval)
+        # Fields referencing the payments may have been added since
+        self._update_reference_trigger()
+        return len(created)
@@ -93,7 +93,7 @@ class InstallmentReminder(models.Model):
     
     @api.model
     def _cron_send_payment_reminders(self):
-        """Cron job to send payment reminders"""
+        """Cron job to send payment reminders, returns the scanned, changed and failed row counts"""
         # Send reminders 7 days before due date
         reminder_date = fields.Date.today() + timedelta(days=7)
         
@@ -102,32 +102,46 @@ class InstallmentReminder(models.Model):
             ('due_date', '=', reminder_date)
         ])
         
-        for payment in payments_to_remind:
-            # Create reminder record
-            reminder = self.create({
-                'installment_payment_id': payment.id,
-                'reminder_type': 'due_soon',
-                'reminder_date': fields.Date.today(),
-            })
-            
-            # Send reminder
-            reminder.action_send_reminder()
+        return self._send_reminders(payments_to_remind, 'due_soon')
     
     @api.model
     def _cron_send_overdue_reminders(self):
-        """Cron job to send overdue payment reminders"""
+        """Cron job to send overdue payment reminders, returns the scanned, changed and failed row counts"""
         overdue_payments = self.env['installment.payment'].search([
             ('state', '=', 'overdue'),
             ('due_date', '<', fields.Date.today())
         ])
         
-        for payment in overdue_payments:
-            # Create overdue reminder
-            reminder = self.create({
+        return self._send_reminders(overdue_payments, 'overdue')
+    
+    @api.model
+    def _send_reminders(self, payments, reminder_type):
+        """Create and send one reminder per payment, a failing reminder does not stop the others"""
+        sent = 0
+        failed_payments = self.env['installment.payment']
+        for payment in payments:
+            try:
+                with self.env.cr.savepoint():
+                    # Create reminder record
+                    reminder = self.create({
+                        'installment_payment_id': payment.id,
+                        'reminder_type': reminder_type,
+                        'reminder_date': fields.Date.today(),
+                    })
+                    
+                    # Send reminder
+                    reminder.action_send_reminder()
+                sent += 1
+            except UserError as e:
+                failed_payments |= payment
+                _logger.error(f"Reminder for payment {payment.name} failed: {e}")
+        
+        # The savepoint rolled the failed reminders back, keep a trace of them
+        if failed_payments:
+            self.create([{
                 'installment_payment_id': payment.id,
-                'reminder_type': 'overdue',
+                'reminder_type': reminder_type,
                 'reminder_date': fields.Date.today(),
-            })
-            
-            # Send reminder
-            reminder.action_send_reminder()
+                'state': 'failed',
+            } for payment in failed_payments])
+        return {'scanned': len(payments), 'changed': sent, 'errors': len(failed_payments)}
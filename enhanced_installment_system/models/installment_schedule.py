@@ -2,10 +2,35 @@
 
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from collections import defaultdict
+from dateutil.relativedelta import relativedelta
 import logging
 
 _logger = logging.getLogger(__name__)
 
+ALLOCATION_STRATEGIES = [
+    ('oldest', 'Oldest First'),
+    ('pro_rata', 'Pro Rata'),
+    ('interest_first', 'Interest First'),
+]
+
+# Payment states that can still receive money
+OPEN_PAYMENT_STATES = ('pending', 'overdue', 'adjusted')
+
+# Indexes of the (charges, principal) balances used by the allocation engine
+CHARGES, PRINCIPAL = 0, 1
+
+RESCHEDULE_OPERATIONS = [
+    ('shift', 'Shift Due Dates'),
+    ('respread', 'Re-spread Remaining Amount'),
+]
+
+# Payment frequency -> step between two due dates
+FREQUENCY_STEPS = {
+    'monthly': relativedelta(months=1),
+    'quarterly': relativedelta(months=3),
+}
+
 
 class InstallmentSchedule(models.Model):
     _name = 'installment.schedule'
@@ -55,16 +80,21 @@ class InstallmentSchedule(models.Model):
     paid_amount = fields.Monetary(string='Paid Amount', currency_field='currency_id', compute='_compute_paid_amount', store=True)
     remaining_amount = fields.Monetary(string='Remaining Amount', currency_field='currency_id', compute='_compute_remaining_amount', store=True)
     
+    # Revisions
+    revision_ids = fields.One2many('installment.schedule.revision', 'schedule_id', string='Revisions')
+    revision = fields.Integer(string='Revision', default=0, readonly=True, copy=False)
+    
     # Computed Fields
     paid_count = fields.Integer(string='Paid Payments', compute='_compute_payment_counts', store=True)
     pending_count = fields.Integer(string='Pending Payments', compute='_compute_payment_counts', store=True)
     overdue_count = fields.Integer(string='Overdue Payments', compute='_compute_payment_counts', store=True)
     
-    @api.depends('installment_payment_ids.state', 'installment_payment_ids.amount')
+    @api.depends('installment_payment_ids.state', 'installment_payment_ids.amount', 'installment_payment_ids.principal_paid')
     def _compute_paid_amount(self):
         for schedule in self:
             paid_payments = schedule.installment_payment_ids.filtered(lambda p: p.state == 'paid')
-            schedule.paid_amount = sum(paid_payments.mapped('amount'))
+            partial_payments = schedule.installment_payment_ids.filtered(lambda p: p.state in OPEN_PAYMENT_STATES)
+            schedule.paid_amount = sum(paid_payments.mapped('amount')) + sum(partial_payments.mapped('principal_paid'))
     
     @api.depends('total_amount', 'paid_amount')
     def _compute_remaining_amount(self):
@@ -103,6 +133,21 @@ class InstallmentSchedule(models.Model):
         self.state = 'cancelled'
         self.installment_payment_ids.filtered(lambda p: p.state == 'pending').action_cancel()
     
+    def action_register_receipt(self):
+        """Open the receipt allocation wizard"""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Register Receipt'),
+            'res_model': 'installment.allocation.wizard',
+            'view_mode': 'form',
+            'target': 'new',
+            'context': {
+                'default_installment_schedule_id': self.id,
+                'default_amount': self.remaining_amount,
+            }
+        }
+    
     def action_generate_payments(self):
         """Generate individual payment records"""
         self.ensure_one()
@@ -111,3 +156,254 @@ class InstallmentSchedule(models.Model):
         
         # This will be implemented in the wizard
         pass
+
+    # Allocation Engine
+
+    def _allocate_amount(self, amount, strategy='oldest', paid_date=None):
+        """Allocate a received amount to the open payments of this schedule, return the unallocated rest"""
+        self.ensure_one()
+        return self._allocate_receipts([{
+            'schedule_id': self.id,
+            'amount': amount,
+            'strategy': strategy,
+            'date': paid_date,
+        }])[self.id]
+
+    @api.model
+    def _allocate_receipts(self, receipts):
+        """
+        Allocate a batch of receipts to the open payments of their schedules.
+        Each receipt is a dict with schedule_id, amount and optional strategy and date.
+        Return {schedule_id: unallocated amount}.
+        """
+        Payment = self.env['installment.payment']
+        schedule_ids = list({receipt['schedule_id'] for receipt in receipts})
+        payments = Payment.search([
+            ('installment_schedule_id', 'in', schedule_ids),
+            ('state', 'in', OPEN_PAYMENT_STATES),
+        ], order='installment_schedule_id, due_date, sequence, id')
+
+        payments_by_schedule = defaultdict(list)
+        balances = {}
+        for payment in payments:
+            payments_by_schedule[payment.installment_schedule_id.id].append(payment)
+            balances[payment.id] = [
+                payment.late_fee + payment.interest_amount - payment.charges_paid,
+                payment.amount - payment.principal_paid,
+            ]
+
+        # Allocate every receipt in memory
+        allocated = defaultdict(lambda: [0.0, 0.0])
+        paid_dates = {}
+        unallocated = defaultdict(float)
+        today = fields.Date.context_today(self)
+        for receipt in receipts:
+            schedule = self.browse(receipt['schedule_id'])
+            strategy = receipt.get('strategy') or 'oldest'
+            allocate = getattr(self, f'_allocate_{strategy}', None)
+            if not allocate:
+                raise UserError(_("Unknown allocation strategy: %s", strategy))
+            schedule_payments = payments_by_schedule[schedule.id]
+            rest = allocate(schedule.currency_id, schedule_payments, balances, allocated, receipt['amount'])
+            unallocated[schedule.id] += rest
+            # A payment is paid on the date of the receipt that settles it
+            for payment in schedule_payments:
+                if payment.id in allocated and payment.id not in paid_dates \
+                        and all(schedule.currency_id.is_zero(balance) for balance in balances[payment.id]):
+                    paid_dates[payment.id] = receipt.get('date') or today
+
+        # Write the new balances, closing the fully paid payments; payments
+        # getting the same values (e.g. paid in full by the same receipt) are
+        # written together
+        fully_paid = Payment
+        grouped_updates = defaultdict(lambda: Payment)
+        for payment in payments.filtered(lambda p: p.id in allocated):
+            charges, principal = allocated[payment.id]
+            vals = {
+                'charges_paid': payment.charges_paid + charges,
+                'principal_paid': payment.principal_paid + principal,
+            }
+            if payment.id in paid_dates:
+                vals.update({'state': 'paid', 'paid_date': paid_dates[payment.id]})
+                fully_paid |= payment
+            grouped_updates[tuple(sorted(vals.items()))] |= payment
+        for vals, grouped_payments in grouped_updates.items():
+            grouped_payments.write(dict(vals))
+        if fully_paid:
+            fully_paid._complete_schedules()
+
+        _logger.info(f"Allocated {len(receipts)} receipts to {len(allocated)} payments, "
+                     f"{len(fully_paid)} fully paid")
+        return {schedule_id: unallocated[schedule_id] for schedule_id in schedule_ids}
+
+    @api.model
+    def _allocate_parts(self, currency, payments, balances, allocated, amount, parts):
+        """Pay the given balance parts of the payments in order, return the rest"""
+        for part in parts:
+            for payment in payments:
+                if currency.is_zero(amount) or amount < 0:
+                    return amount
+                share = currency.round(min(amount, balances[payment.id][part]))
+                if share <= 0:
+                    continue
+                balances[payment.id][part] -= share
+                allocated[payment.id][part] += share
+                amount -= share
+        return amount
+
+    @api.model
+    def _allocate_oldest(self, currency, payments, balances, allocated, amount):
+        """Oldest first, the charges then the principal of each payment"""
+        for payment in payments:
+            amount = self._allocate_parts(currency, [payment], balances, allocated, amount, (CHARGES, PRINCIPAL))
+        return amount
+
+    @api.model
+    def _allocate_interest_first(self, currency, payments, balances, allocated, amount):
+        """The charges of every payment first, then the principals oldest first"""
+        amount = self._allocate_parts(currency, payments, balances, allocated, amount, (CHARGES,))
+        return self._allocate_parts(currency, payments, balances, allocated, amount, (PRINCIPAL,))
+
+    @api.model
+    def _allocate_pro_rata(self, currency, payments, balances, allocated, amount):
+        """Spread the amount in proportion to the amount due on each payment"""
+        due = {payment.id: sum(balances[payment.id]) for payment in payments}
+        total_due = sum(due.values())
+        if currency.compare_amounts(amount, total_due) >= 0:
+            return self._allocate_oldest(currency, payments, balances, allocated, amount)
+        rest = amount
+        for payment in payments:
+            if due[payment.id] <= 0:
+                continue
+            share = currency.round(amount * due[payment.id] / total_due)
+            rest -= share - self._allocate_parts(currency, [payment], balances, allocated, share, (CHARGES, PRINCIPAL))
+        # Rounding leftovers go to the oldest payments
+        return self._allocate_oldest(currency, payments, balances, allocated, rest)
+
+    # Rescheduling
+
+    def _reschedule(self, operation, reason, shift_months=0, shift_days=0, installment_count=0,
+                    payment_frequency='monthly', interval_days=30, start_date=None):
+        """
+        Recompute the open payments of the schedules in one pass.
+        'shift' moves every open due date, 'respread' spreads the unpaid principal
+        over installment_count new due dates from start_date.
+        Return the created revisions.
+        """
+        if operation == 'respread' and installment_count <= 0:
+            raise UserError(_("Number of installments must be greater than 0"))
+
+        Payment = self.env['installment.payment']
+        payments = Payment.search([
+            ('installment_schedule_id', 'in', self.ids),
+            ('state', 'in', OPEN_PAYMENT_STATES),
+        ], order='installment_schedule_id, due_date, sequence, id')
+        payments_by_schedule = defaultdict(lambda: Payment)
+        for payment in payments:
+            payments_by_schedule[payment.installment_schedule_id.id] |= payment
+        last_sequences = dict(Payment._read_group(
+            [('installment_schedule_id', 'in', self.ids)], ['installment_schedule_id'], ['sequence:max'],
+        ))
+
+        today = fields.Date.context_today(self)
+        step = FREQUENCY_STEPS.get(payment_frequency, relativedelta(days=interval_days))
+        updates = []        # (payment, vals)
+        to_cancel = Payment
+        paid = Payment
+        to_create = []      # (schedule, vals)
+        changes = defaultdict(list)
+        for schedule in self:
+            open_payments = payments_by_schedule[schedule.id]
+            if not open_payments:
+                continue
+            if operation == 'shift':
+                for payment in open_payments:
+                    due_date = payment.due_date + relativedelta(months=shift_months, days=shift_days)
+                    updates.append((payment, {'due_date': due_date}))
+                    changes[schedule.id].append((payment, payment.due_date, due_date, payment.amount, payment.amount))
+                continue
+
+            # Partially paid payments keep what was paid, the rest is re-spread
+            # along with the charges still owed on the payments closed here
+            currency = schedule.currency_id
+            started = open_payments.filtered(lambda p: not currency.is_zero(p.principal_paid))
+            untouched = open_payments - started
+            closed = started | untouched[installment_count:]
+            remaining = sum(p.amount - p.principal_paid for p in open_payments) \
+                + sum(p.late_fee + p.interest_amount - p.charges_paid for p in closed)
+            base = currency.round(remaining / installment_count)
+            amounts = [base] * (installment_count - 1) + [currency.round(remaining - base * (installment_count - 1))]
+            due_dates = [(start_date or today) + step * index for index in range(installment_count)]
+            # They are closed as paid for what was paid, their charges included
+            for payment in started:
+                updates.append((payment, {
+                    'amount': payment.principal_paid,
+                    'late_fee': payment.charges_paid,
+                    'state': 'paid',
+                    'paid_date': today,
+                }))
+                paid |= payment
+                changes[schedule.id].append((payment, payment.due_date, payment.due_date, payment.amount, payment.principal_paid))
+            for index, (due_date, amount) in enumerate(zip(due_dates, amounts)):
+                if index < len(untouched):
+                    payment = untouched[index]
+                    updates.append((payment, {'due_date': due_date, 'amount': amount}))
+                    changes[schedule.id].append((payment, payment.due_date, due_date, payment.amount, amount))
+                else:
+                    to_create.append((schedule, {
+                        'installment_schedule_id': schedule.id,
+                        'sequence': (last_sequences.get(schedule) or 0) + index - len(untouched) + 1,
+                        'due_date': due_date,
+                        'amount': amount,
+                        'interest_rate': open_payments[0].interest_rate,
+                    }))
+            for payment in untouched[installment_count:]:
+                to_cancel |= payment
+                changes[schedule.id].append((payment, payment.due_date, False, payment.amount, 0.0))
+
+        # Batch writes: rescheduled payments due in the future are pending
+        # again, payments getting the same values are written together
+        grouped_updates = defaultdict(lambda: Payment)
+        for payment, vals in updates:
+            if payment.state == 'overdue' and 'state' not in vals and vals.get('due_date', payment.due_date) >= today:
+                vals['state'] = 'pending'
+            grouped_updates[tuple(sorted(vals.items()))] |= payment
+        for vals, grouped_payments in grouped_updates.items():
+            grouped_payments.write(dict(vals))
+        if to_cancel:
+            to_cancel.write({'state': 'cancelled'})
+        if to_create:
+            created = Payment.create([vals for _schedule, vals in to_create])
+            for (schedule, vals), payment in zip(to_create, created):
+                changes[schedule.id].append((payment, False, vals['due_date'], 0.0, vals['amount']))
+        if paid:
+            paid._complete_schedules()
+
+        return self._create_revisions(operation, reason, changes)
+
+    def _create_revisions(self, operation, reason, changes):
+        """Record one revision per changed schedule with its adjustments and bump the schedule versions"""
+        schedules = self.filtered(lambda s: changes.get(s.id))
+        revisions_vals = []
+        for schedule in schedules:
+            version = schedule.revision + 1
+            schedule.revision = version
+            if operation == 'respread':
+                schedule.installment_count = len(schedule.installment_payment_ids.filtered(lambda p: p.state != 'cancelled'))
+            revisions_vals.append({
+                'schedule_id': schedule.id,
+                'version': version,
+                'operation': operation,
+                'reason': reason,
+                'payment_count': len(changes[schedule.id]),
+            })
+        revisions = self.env['installment.schedule.revision'].create(revisions_vals)
+
+        # One audit row per changed payment, in a single create
+        Adjustment = self.env['installment.payment.adjustment']
+        adjustments_vals = []
+        for schedule, revision in zip(schedules, revisions):
+            adjustments_vals += Adjustment._prepare_adjustments(changes[schedule.id], 'reschedule', reason, revision)
+        Adjustment.create(adjustments_vals)
+        _logger.info(f"Rescheduled {len(revisions)} schedules ({operation}): {reason}")
+        return revisions
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields
+
+
+class InstallmentScheduleRevision(models.Model):
+    _name = 'installment.schedule.revision'
+    _description = 'Installment Schedule Revision'
+    _order = 'schedule_id, version desc'
+    _rec_name = 'version'
+
+    # Revision
+    schedule_id = fields.Many2one('installment.schedule', string='Payment Schedule', required=True, index=True, ondelete='cascade', readonly=True)
+    version = fields.Integer(string='Version', required=True, readonly=True)
+    operation = fields.Selection([
+        ('shift', 'Shift Due Dates'),
+        ('respread', 'Re-spread Remaining Amount'),
+    ], string='Operation', required=True, readonly=True)
+    reason = fields.Char(string='Reason', required=True, readonly=True)
+    user_id = fields.Many2one('res.users', string='Done By', default=lambda self: self.env.user, readonly=True)
+    date = fields.Datetime(string='Date', default=fields.Datetime.now, readonly=True)
+
+    # Changes
+    adjustment_ids = fields.One2many('installment.payment.adjustment', 'revision_id', string='Adjustments', readonly=True)
+    payment_count = fields.Integer(string='Changed Payments', readonly=True)
+
+    _sql_constraints = [
+        ('schedule_version_uniq', 'unique(schedule_id, version)', 'A schedule revision version must be unique.'),
+    ]
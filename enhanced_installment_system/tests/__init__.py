@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from . import test_performance
+from . import test_payment_partition
+from . import test_installment_sync
+from . import test_reschedule
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+
+@tagged('post_install', '-at_install')
+class TestScheduleSync(AccountTestInvoicingCommon):
+
+    def setUp(self):
+        super().setUp()
+        self.invoice = self.env['account.move'].create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner_a.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'product_id': self.product_a.id,
+                'quantity': 1.0,
+                'price_unit': 1000.0,
+                'tax_ids': [],
+            })],
+        })
+        self.invoice.action_post()
+        self.schedule = self.env['installment.schedule'].create({
+            'name': 'Synced Schedule',
+            'invoice_id': self.invoice.id,
+            'total_amount': 1000.0,
+            'installment_count': 2,
+            'payment_frequency': 'monthly',
+            'state': 'active',
+        })
+        self.first = self._create_payment(1)
+        self.second = self._create_payment(2)
+
+    def _create_payment(self, sequence):
+        return self.env['installment.payment'].create({
+            'sequence': sequence,
+            'installment_schedule_id': self.schedule.id,
+            'amount': 500.0,
+            'due_date': fields.Date.today() + timedelta(days=30 * sequence),
+        })
+
+    def _register_payment(self, amount):
+        self.env['account.payment.register'].with_context(
+            active_model='account.move', active_ids=self.invoice.ids,
+        ).create({'amount': amount})._create_payments()
+
+    def test_reconcile_keeps_payments_paid_elsewhere(self):
+        # As the statement import does
+        self.second._mark_paid_batch()
+
+        self._register_payment(200.0)
+        self.assertEqual(self.second.state, 'paid')
+        self.assertEqual(self.first.state, 'pending')
+
+        self._register_payment(300.0)
+        self.assertEqual(self.first.state, 'paid')
+        self.assertEqual(self.second.state, 'paid')
+        self.assertEqual(self.schedule.state, 'completed')
+
+    def test_reconcile_counts_allocated_principal(self):
+        self.schedule._allocate_amount(300.0)
+        self.assertEqual(self.first.principal_paid, 300.0)
+
+        self._register_payment(200.0)
+        self.assertEqual(self.first.state, 'paid')
+        self.assertEqual(self.second.state, 'pending')
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from dateutil.relativedelta import relativedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+
+@tagged('post_install', '-at_install')
+class TestPaymentPartition(AccountTestInvoicingCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        invoice = cls.env['account.move'].create({
+            'move_type': 'out_invoice',
+            'partner_id': cls.partner_a.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'product_id': cls.product_a.id,
+                'quantity': 1.0,
+                'price_unit': 1200.0,
+                'tax_ids': [],
+            })],
+        })
+        invoice.action_post()
+        cls.schedule = cls.env['installment.schedule'].create({
+            'name': 'Partitioned Schedule',
+            'invoice_id': invoice.id,
+            'total_amount': 1200.0,
+            'installment_count': 1,
+            'payment_frequency': 'monthly',
+        })
+        cls.payment = cls.env['installment.payment'].create({
+            'sequence': 1,
+            'installment_schedule_id': cls.schedule.id,
+            'amount': 1200.0,
+            'due_date': fields.Date.today(),
+        })
+        cls.reminder = cls.env['installment.reminder'].create({
+            'installment_payment_id': cls.payment.id,
+            'reminder_type': 'due_soon',
+        })
+        cls.env.cr.execute("CREATE UNIQUE INDEX installment_payment_name_uniq ON installment_payment (name)")
+        cls.env['installment.payment.partition']._convert_to_partitioned('quarter', 4)
+
+    def _get_partition(self, payment):
+        self.env.flush_all()
+        self.env.cr.execute("SELECT tableoid::regclass::text FROM installment_payment WHERE id = %s", [payment.id])
+        return self.env.cr.fetchone()[0]
+
+    def test_move_across_partitions_keeps_references(self):
+        old_due_date = self.payment.due_date
+        new_due_date = old_due_date + relativedelta(months=6)
+        adjustment = self.env['installment.payment.adjustment']._log_adjustments(
+            [(self.payment, old_due_date, new_due_date, self.payment.amount, self.payment.amount)])
+        partition = self._get_partition(self.payment)
+
+        self.payment.due_date = new_due_date
+        self.assertNotEqual(self._get_partition(self.payment), partition)
+
+        self.env.invalidate_all()
+        self.assertTrue(self.reminder.exists())
+        self.assertEqual(self.reminder.installment_payment_id, self.payment)
+        self.assertEqual(adjustment.payment_id, self.payment)
+
+    def test_unlink_applies_ondelete(self):
+        adjustment = self.env['installment.payment.adjustment']._log_adjustments(
+            [(self.payment, self.payment.due_date, self.payment.due_date, self.payment.amount, 0.0)])
+        self.payment.unlink()
+
+        self.env.invalidate_all()
+        self.assertFalse(self.reminder.exists())
+        self.assertTrue(adjustment.exists())
+        self.assertFalse(adjustment.payment_id)
+
+    def test_unique_index_gets_partition_key(self):
+        self.env.cr.execute("SELECT indexdef FROM pg_indexes WHERE indexname = 'installment_payment_name_uniq'")
+        definition = self.env.cr.fetchone()[0]
+        self.assertIn('UNIQUE', definition)
+        self.assertIn('(name, due_date)', definition)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account_invoice_installments.tests.common import InstallmentPerformanceCase
+
+
+@tagged('post_install', '-at_install', 'performance')
+class TestInstallmentSchedulePerformance(InstallmentPerformanceCase):
+
+    # Data
+
+    def _create_invoice(self):
+        invoice = self.env['account.move'].create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner_a.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'product_id': self.product_a.id,
+                'quantity': 1.0,
+                'price_unit': 1200.0,
+                'tax_ids': [],
+            })],
+        })
+        invoice.action_post()
+        return invoice
+
+    def _create_payments(self, count, due_date, state='pending'):
+        # Keep the payments of the previous run out of the crons
+        self.env['installment.payment'].search([('state', 'in', ('pending', 'overdue'))]).state = 'cancelled'
+        schedule = self.env['installment.schedule'].create({
+            'name': 'Performance Schedule',
+            'invoice_id': self._create_invoice().id,
+            'total_amount': 100.0 * count,
+            'installment_count': count,
+            'payment_frequency': 'monthly',
+        })
+        payments = self.env['installment.payment']
+        for sequence in range(1, count + 1):
+            payments |= payments.create({
+                'sequence': sequence,
+                'installment_schedule_id': schedule.id,
+                'amount': 100.0,
+                'due_date': due_date,
+                'state': state,
+            })
+        return payments
+
+    # Schedule generation
+
+    def test_action_generate_installments(self):
+        def setup(size):
+            wizard = self.env['installment.generation.wizard'].create({
+                'invoice_id': self._create_invoice().id,
+                'installment_count': size,
+                'first_payment_type': 'percentage',
+                'first_payment_percentage': 10.0,
+            })
+            wizard._onchange_first_payment()
+            wizard._onchange_generate_preview()
+            return wizard
+
+        # One payment created per previewed row, each numbered from its sequence
+        self.assertScales(setup, lambda wizard: wizard.action_generate_installments(), per_record=8)
+
+    # Crons
+
+    def test_cron_check_overdue_payments(self):
+        yesterday = fields.Date.today() - timedelta(days=1)
+        self.assertScales(
+            lambda size: self._create_payments(size, yesterday),
+            lambda payments: payments._cron_check_overdue_payments(),
+            # The state write recomputes the charges of the payments and
+            # queues the forecast buckets of the changed payments
+            per_record=3,
+        )
+
+    def test_cron_send_payment_reminders(self):
+        in_a_week = fields.Date.today() + timedelta(days=7)
+        self.assertScales(
+            lambda size: self._create_payments(size, in_a_week),
+            lambda payments: self.env['installment.reminder']._cron_send_payment_reminders(),
+            # One reminder per payment: its number, its savepoint and its mail
+            per_record=12,
+        )
+
+    def test_cron_send_overdue_reminders(self):
+        last_week = fields.Date.today() - timedelta(days=7)
+        self.assertScales(
+            lambda size: self._create_payments(size, last_week, state='overdue'),
+            lambda payments: self.env['installment.reminder']._cron_send_overdue_reminders(),
+            # One reminder per payment: its number, its savepoint and its mail
+            per_record=12,
+        )
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+
+@tagged('post_install', '-at_install')
+class TestReschedule(AccountTestInvoicingCommon):
+
+    def setUp(self):
+        super().setUp()
+        invoice = self.env['account.move'].create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner_a.id,
+            'invoice_date': fields.Date.today(),
+        })
+        self.schedule = self.env['installment.schedule'].create({
+            'name': 'Rescheduled Schedule',
+            'invoice_id': invoice.id,
+            'total_amount': 1000.0,
+            'installment_count': 2,
+            'payment_frequency': 'monthly',
+            'state': 'active',
+        })
+        self.first, self.second = self.env['installment.payment'].create([{
+            'sequence': sequence,
+            'installment_schedule_id': self.schedule.id,
+            'amount': 500.0,
+            'due_date': fields.Date.today() + timedelta(days=30 * sequence),
+        } for sequence in (1, 2)])
+
+    def test_respread_carries_unpaid_charges(self):
+        self.schedule._allocate_amount(100.0)
+        self.first.late_fee = 50.0
+
+        self.schedule._reschedule('respread', 'Restructured', installment_count=2)
+        self.assertEqual(self.first.state, 'paid')
+        self.assertEqual(self.first.total_amount, 100.0)
+        open_payments = self.schedule.installment_payment_ids.filtered(lambda p: p.state == 'pending')
+        # 400.0 and 500.0 of principal and the late fee still owed
+        self.assertAlmostEqual(sum(open_payments.mapped('amount')), 950.0)
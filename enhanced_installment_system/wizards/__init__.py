@@ -2,3 +2,6 @@
 
 from . import installment_wizard
 from . import payment_adjustment_wizard
+from . import allocation_wizard
+from . import reschedule_wizard
+from . import partition_wizard
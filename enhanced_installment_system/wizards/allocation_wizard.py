@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, _
+from odoo.exceptions import ValidationError
+from ..models.installment_schedule import ALLOCATION_STRATEGIES
+
+
+class InstallmentAllocationWizard(models.TransientModel):
+    _name = 'installment.allocation.wizard'
+    _description = 'Installment Receipt Allocation Wizard'
+
+    # Basic Information
+    installment_schedule_id = fields.Many2one('installment.schedule', string='Payment Schedule', required=True, readonly=True)
+    remaining_amount = fields.Monetary(string='Remaining Amount', currency_field='currency_id', related='installment_schedule_id.remaining_amount')
+    currency_id = fields.Many2one('res.currency', string='Currency', related='installment_schedule_id.currency_id', readonly=True)
+
+    # Receipt
+    amount = fields.Monetary(string='Received Amount', currency_field='currency_id', required=True)
+    strategy = fields.Selection(ALLOCATION_STRATEGIES, string='Allocation', required=True, default='oldest',
+                                help="Oldest First: settle the oldest payments first.\n"
+                                     "Pro Rata: spread the amount in proportion to what is due on each payment.\n"
+                                     "Interest First: settle late fees and interest of all payments before principal.")
+    paid_date = fields.Date(string='Receipt Date', required=True, default=fields.Date.context_today)
+
+    def action_allocate(self):
+        """Allocate the received amount to the open payments"""
+        self.ensure_one()
+        if self.amount <= 0:
+            raise ValidationError(_("Received amount must be greater than 0"))
+
+        rest = self.installment_schedule_id._allocate_amount(self.amount, self.strategy, self.paid_date)
+        message = _('Receipt allocated to the payment schedule')
+        if not self.currency_id.is_zero(rest):
+            message = _('Receipt allocated, %(rest)s could not be allocated to any open payment',
+                        rest=self.currency_id.format(rest))
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Success'),
+                'message': message,
+                'type': 'success' if self.currency_id.is_zero(rest) else 'warning',
+                'sticky': False,
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
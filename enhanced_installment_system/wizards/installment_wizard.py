@@ -198,7 +198,7 @@ class InstallmentGenerationWizard(models.TransientModel):
             raise UserError(_("Error generating installments: %s") % str(e))
     
     def _create_payment_term(self, schedule):
-        """Create payment term for the invoice"""
+        """Return the payment term matching the schedule, reusing an identical one when it exists"""
         try:
             payment_term_lines = []
             
@@ -214,10 +214,10 @@ class InstallmentGenerationWizard(models.TransientModel):
                     'delay_type': 'days_after',
                 })
             
-            payment_term = self.env['account.payment.term'].create({
-                'name': f"Installment Terms - {schedule.name}",
-                'line_ids': [(0, 0, line) for line in payment_term_lines]
-            })
+            payment_term = self.env['account.payment.term']._get_installment_term(
+                payment_term_lines,
+                name=f"Installment Terms ({len(payment_term_lines)} installments)",
+            )
             
             return payment_term
             
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from ..models.installment_payment_partition import PARTITION_INTERVALS, PERIODS_AHEAD_PARAM, is_payment_table_partitioned
+
+
+class InstallmentPaymentPartitionWizard(models.TransientModel):
+    _name = 'installment.payment.partition.wizard'
+    _description = 'Installment Payment Partitioning Wizard'
+
+    # Setup
+    interval = fields.Selection(PARTITION_INTERVALS, string='Partition By', required=True, default='quarter',
+                                help="One partition of the payments per due date year or quarter")
+    periods_ahead = fields.Integer(string='Periods Ahead', required=True, default=4,
+                                   help="Partitions created in advance for the coming years or quarters")
+
+    # Status
+    is_partitioned = fields.Boolean(string='Partitioned', compute='_compute_status')
+    partition_names = fields.Text(string='Partitions', compute='_compute_status')
+
+    @api.model
+    def default_get(self, fields_list):
+        """Show the current settings once partitioned"""
+        defaults = super().default_get(fields_list)
+        if is_payment_table_partitioned(self.env.cr):
+            interval, periods_ahead = self.env['installment.payment.partition']._get_settings()
+            defaults.update(interval=interval, periods_ahead=periods_ahead)
+        return defaults
+
+    def _compute_status(self):
+        partitioning = self.env['installment.payment.partition']
+        is_partitioned = is_payment_table_partitioned(self.env.cr)
+        partition_names = '\n'.join(partitioning._get_partitions()) if is_partitioned else False
+        for wizard in self:
+            wizard.is_partitioned = is_partitioned
+            wizard.partition_names = partition_names
+
+    def action_partition(self):
+        """Convert the payment table to a partitioned table"""
+        self.ensure_one()
+        partitions = self.env['installment.payment.partition']._convert_to_partitioned(self.interval, self.periods_ahead)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Success'),
+                'message': _('Installment payments are now stored in %s partitions.', len(partitions)),
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+
+    def action_create_future_partitions(self):
+        """Create the partitions of the coming periods now"""
+        self.ensure_one()
+        self.env['ir.config_parameter'].sudo().set_param(PERIODS_AHEAD_PARAM, self.periods_ahead)
+        created = self.env['installment.payment.partition']._cron_create_future_partitions()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Success'),
+                'message': _('%s partitions created.', created),
+                'type': 'success',
+                'sticky': False,
+            }
+        }
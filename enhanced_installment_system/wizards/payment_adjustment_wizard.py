@@ -85,17 +85,17 @@ class PaymentAdjustmentWizard(models.TransientModel):
         if self.adjustment_type in ['date', 'both']:
             update_vals['due_date'] = self.new_due_date
         
-        # Add adjustment note
-        current_notes = payment.notes or ""
-        adjustment_note = f"\n\n[ADJUSTMENT] {fields.Datetime.now().strftime('%Y-%m-%d %H:%M')} - {self.adjustment_reason}"
-        if self.adjustment_type in ['amount', 'both']:
-            adjustment_note += f" | Amount: {self.original_amount} → {self.new_amount}"
-        if self.adjustment_type in ['date', 'both']:
-            adjustment_note += f" | Date: {self.original_due_date} → {self.new_due_date}"
-        
-        update_vals['notes'] = current_notes + adjustment_note
         update_vals['state'] = 'adjusted'
         
+        # Record the adjustment in the audit log
+        self.env['installment.payment.adjustment']._log_adjustments([(
+            payment,
+            payment.due_date,
+            update_vals.get('due_date', payment.due_date),
+            payment.amount,
+            update_vals.get('amount', payment.amount),
+        )], reason=self.adjustment_reason)
+        
         # Apply the changes
         payment.write(update_vals)
         
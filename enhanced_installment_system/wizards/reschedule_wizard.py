@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import ValidationError
+from ..models.installment_schedule import RESCHEDULE_OPERATIONS
+
+
+class InstallmentRescheduleWizard(models.TransientModel):
+    _name = 'installment.reschedule.wizard'
+    _description = 'Installment Reschedule Wizard'
+
+    # Schedules
+    schedule_ids = fields.Many2many('installment.schedule', string='Payment Schedules', required=True)
+    schedule_count = fields.Integer(string='Schedules', compute='_compute_schedule_count')
+
+    # Operation
+    operation = fields.Selection(RESCHEDULE_OPERATIONS, string='Operation', required=True, default='shift')
+    reason = fields.Char(string='Reason', required=True)
+
+    # Shift
+    shift_months = fields.Integer(string='Shift (Months)', default=0)
+    shift_days = fields.Integer(string='Shift (Days)', default=0)
+
+    # Re-spread
+    installment_count = fields.Integer(string='Number of Installments', default=12)
+    payment_frequency = fields.Selection([
+        ('monthly', 'Monthly'),
+        ('quarterly', 'Quarterly'),
+        ('custom', 'Custom Interval')
+    ], string='Payment Frequency', default='monthly')
+    custom_interval_days = fields.Integer(string='Custom Interval (Days)', default=30)
+    start_date = fields.Date(string='First Due Date', default=fields.Date.context_today)
+
+    @api.model
+    def default_get(self, fields_list):
+        """Reschedule the schedules selected in the list view"""
+        defaults = super().default_get(fields_list)
+        if self.env.context.get('active_model') == 'installment.schedule' and self.env.context.get('active_ids'):
+            defaults['schedule_ids'] = [(6, 0, self.env.context['active_ids'])]
+        return defaults
+
+    @api.depends('schedule_ids')
+    def _compute_schedule_count(self):
+        for wizard in self:
+            wizard.schedule_count = len(wizard.schedule_ids)
+
+    def action_apply(self):
+        """Reschedule the open payments of all the selected schedules"""
+        self.ensure_one()
+        if self.operation == 'shift' and not (self.shift_months or self.shift_days):
+            raise ValidationError(_("Please provide a shift in months or days"))
+        if self.operation == 'respread':
+            if self.installment_count <= 0:
+                raise ValidationError(_("Number of installments must be greater than 0"))
+            if not self.start_date:
+                raise ValidationError(_("First due date is required"))
+
+        revisions = self.schedule_ids._reschedule(
+            self.operation,
+            self.reason,
+            shift_months=self.shift_months,
+            shift_days=self.shift_days,
+            installment_count=self.installment_count,
+            payment_frequency=self.payment_frequency,
+            interval_days=self.custom_interval_days,
+            start_date=self.start_date,
+        )
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Success'),
+                'message': _('%(count)s schedules rescheduled', count=len(revisions)),
+                'type': 'success',
+                'sticky': False,
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
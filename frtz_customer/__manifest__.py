@@ -6,6 +6,7 @@
     "depends": ['base','sale'],
     "data": [
         "views/customer_view.xml",
+        "views/sale_order_credit_view.xml",
         # "views/sale_order_view.xml",
     ],
     # "i18n": [
@@ -22,6 +22,8 @@ class ResPartner(models.Model):
 
     # Installment Information - Moved to invoice_installment_extension module
 
+    _credit_snapshot_key = 'frtz_customer.credit_snapshot'
+
     @api.depends('name', 'ref')
     def _compute_display_name(self):
         for partner in self:
@@ -48,3 +50,52 @@ class ResPartner(models.Model):
         records = self.search(domain + args, limit=limit)
         return records.name_get()
 
+    def write(self, vals):
+        result = super().write(vals)
+        if 'status' in vals:
+            self._invalidate_credit_snapshot()
+        return result
+
+    @api.model
+    def _get_credit_snapshot(self, partner_ids):
+        """
+        Return {partner_id: row} with the credit data of the given partners.
+        Rows are cached for the current transaction, so checking a batch of
+        orders only reads each partner once.
+        """
+        cache = self.env.cr.precommit.data.setdefault(self._credit_snapshot_key, {})
+        missing = {pid for pid in partner_ids if pid and pid not in cache}
+        if missing:
+            self.flush_model(['status'])
+            for row in self._read_credit_snapshot(list(missing)):
+                cache[row['partner_id']] = row
+        return {pid: cache[pid] for pid in partner_ids if pid in cache}
+
+    @api.model
+    def _read_credit_snapshot(self, partner_ids):
+        """Read the credit rows of the given partners in one query"""
+        self.env.cr.execute("""
+            SELECT id AS partner_id,
+                   status,
+                   0 AS overdue_count,
+                   0.0 AS exposure
+              FROM res_partner
+             WHERE id = ANY(%s)
+        """, [partner_ids])
+        return self.env.cr.dictfetchall()
+
+    @api.model
+    def _invalidate_credit_snapshot(self):
+        """Drop the cached credit rows of the current transaction"""
+        self.env.cr.precommit.data.pop(self._credit_snapshot_key, None)
+
+    @api.model
+    def _get_credit_hold_reasons(self, row):
+        """
+        Return (blocking, flags) lists of messages for a credit snapshot row.
+        Blocking reasons prevent the order, flags only mark it as on hold.
+        """
+        blocking, flags = [], []
+        if row.get('status') == 'suspended':
+            blocking.append(_("This Customer Is Suspended"))
+        return blocking, flags
@@ -19,28 +19,73 @@ class SaleOrder(models.Model):
         compute='_compute_guarantees_count'
     )
 
+    credit_hold = fields.Boolean(
+        string='Credit Hold',
+        readonly=True,
+        copy=False,
+        help='Set when the customer failed the credit check at order entry or confirmation'
+    )
+    credit_hold_reason = fields.Char(
+        string='Credit Hold Reason',
+        readonly=True,
+        copy=False
+    )
+
     @api.depends('customer_guarantees_ids')
     def _compute_guarantees_count(self):
         for order in self:
             order.guarantees_count = len(order.customer_guarantees_ids)
 
-    # @api.model_create_multi
-    # def create(self, vals_list):
-    #     for vals in vals_list:
-    #         partner_id = vals.get('partner_id')
-    #         if partner_id:
-    #             partner = self.env['res.partner'].browse(partner_id)
-    #             if partner.status == 'suspended':
-    #                 raise UserError(_("This Customer Is Suspended"))
-    #     return super(SaleOrder, self).create(vals_list)
-    #
-    # def write(self, vals):
-    #     """Prevent saving (updating) Sale Orders if customer is suspended."""
-    #     for order in self:
-    #         # Check partner if changed or even if not changed
-    #         partner = self.env['res.partner'].browse(
-    #             vals.get('partner_id', order.partner_id.id)
-    #         )
-    #         if partner.status == 'suspended':
-    #             raise UserError(_("This Customer Is Suspended"))
-    #     return super(SaleOrder, self).write(vals)
\ No newline at end of file
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._check_credit_partners([vals.get('partner_id') for vals in vals_list])
+        orders = super(SaleOrder, self).create(vals_list)
+        orders._update_credit_hold()
+        return orders
+
+    def write(self, vals):
+        """Prevent moving Sale Orders to a suspended customer."""
+        if vals.get('partner_id'):
+            self._check_credit_partners([vals['partner_id']])
+        result = super(SaleOrder, self).write(vals)
+        if 'partner_id' in vals:
+            self._update_credit_hold()
+        return result
+
+    def action_confirm(self):
+        self._check_credit_partners(self.partner_id.ids)
+        self._update_credit_hold()
+        return super(SaleOrder, self).action_confirm()
+
+    @api.model
+    def _check_credit_partners(self, partner_ids):
+        """Raise if any of the given customers is blocked by the credit check"""
+        Partner = self.env['res.partner']
+        snapshot = Partner._get_credit_snapshot([pid for pid in partner_ids if pid])
+        errors = []
+        for partner_id, row in snapshot.items():
+            blocking, _flags = Partner._get_credit_hold_reasons(row)
+            if blocking:
+                errors.append("%s: %s" % (Partner.browse(partner_id).display_name, ", ".join(blocking)))
+        if errors:
+            raise UserError("\n".join(errors))
+
+    def _update_credit_hold(self):
+        """Flag the orders whose customer has non-blocking credit issues"""
+        Partner = self.env['res.partner']
+        snapshot = Partner._get_credit_snapshot(self.partner_id.ids)
+        reasons_by_partner = {}
+        for partner_id, row in snapshot.items():
+            _blocking, flags = Partner._get_credit_hold_reasons(row)
+            reasons_by_partner[partner_id] = ", ".join(flags)
+        orders_by_reason = {}
+        for order in self:
+            reason = reasons_by_partner.get(order.partner_id.id, '')
+            if reason != (order.credit_hold_reason or ''):
+                orders_by_reason.setdefault(reason, self.browse())
+                orders_by_reason[reason] |= order
+        for reason, orders in orders_by_reason.items():
+            orders.write({
+                'credit_hold': bool(reason),
+                'credit_hold_reason': reason or False,
+            })
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+{
+    'name': 'Installment Archive',
+    'summary': 'Move settled installments, payments and reminders to archive tables',
+    'description': """
+        Archive tier for the installment tables:
+        - Daily job moving the settled installments of closed invoices, and the
+          settled payments and reminders of finished schedules, to compact
+          archive tables once older than installment_archive.age_days
+        - Chunked batches of installment_archive.batch_size invoices and
+          schedules, resumed where they stopped
+        - Installment, payment and reminder history views uniting the live and
+          archived rows (Include Archived)
+        - Invoice, schedule and customer totals keep counting the archived rows
+    """,
+    'version': '18.0.1.0.0',
+    'category': 'Accounting/Invoicing',
+    'author': 'Your Company',
+    'website': 'https://www.yourcompany.com',
+    'depends': [
+        'base',
+        'invoice_installment_extension',
+        'enhanced_installment_system',
+    ],
+    'data': [
+        'security/ir.model.access.csv',
+        'data/installment_archive_data.xml',
+        'views/installment_history_views.xml',
+    ],
+    'license': 'LGPL-3',
+    'installable': True,
+    'application': False,
+    'auto_install': False,
+}
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import installment_archive
+from . import installment_history
+from . import installment_models
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+from collections import defaultdict
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+AGE_DAYS_PARAM = 'installment_archive.age_days'
+BATCH_SIZE_PARAM = 'installment_archive.batch_size'
+
+# Invoices whose installments are all settled
+CLOSED_INVOICE = "(am.state = 'cancel' OR am.payment_state IN ('paid', 'reversed'))"
+SETTLED_STATES = ('paid', 'cancelled')
+
+
+class InstallmentArchiveMixin(models.AbstractModel):
+    _name = 'installment.archive.mixin'
+    _description = 'Installment Archive Table'
+
+    # Table the rows are moved from, and the columns kept. Archived rows keep
+    # their id so the history views can union both tables.
+    _source_table = None
+    _archive_columns = ()
+
+    archive_date = fields.Date(string='Archived On', readonly=True)
+
+    @api.model
+    def _copy_rows(self, source_ids):
+        """Copy the source rows into the archive table"""
+        if not source_ids:
+            return 0
+        columns = ', '.join(self._archive_columns)
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table} ({columns}, archive_date)
+            SELECT {columns}, CURRENT_DATE
+              FROM {self._source_table}
+             WHERE id = ANY(%s)
+        """, [list(source_ids)])
+        return self.env.cr.rowcount
+
+    @api.model
+    def _delete_rows(self, source_ids):
+        """Delete the archived rows from the source table"""
+        if source_ids:
+            self.env.cr.execute(f"DELETE FROM {self._source_table} WHERE id = ANY(%s)", [list(source_ids)])
+
+    @api.model
+    def _move_rows(self, source_ids):
+        """Move the source rows into the archive table"""
+        count = self._copy_rows(source_ids)
+        self._delete_rows(source_ids)
+        return count
+
+    @api.model
+    def _get_archived_totals(self, field_name, ids):
+        """Count and amount of the archived rows per parent record, all and paid ones"""
+        totals = defaultdict(lambda: {'count': 0, 'amount': 0.0, 'paid_count': 0, 'paid_amount': 0.0})
+        if not ids:
+            return totals
+        for parent, state, count, amount in self._read_group(
+                [(field_name, 'in', ids)], [field_name, 'state'], ['__count', 'amount:sum']):
+            parent_totals = totals[parent.id]
+            parent_totals['count'] += count
+            parent_totals['amount'] += amount
+            if state == 'paid':
+                parent_totals['paid_count'] += count
+                parent_totals['paid_amount'] += amount
+        return totals
+
+
+class InstallmentListArchive(models.Model):
+    _name = 'installment.list.archive'
+    _inherit = 'installment.archive.mixin'
+    _description = 'Archived Installment'
+    _log_access = False
+    _order = 'due_date, id'
+
+    _source_table = 'installment_list'
+    _archive_columns = (
+        'id', 'name', 'sequence', 'invoice_id', 'partner_id', 'currency_id',
+        'amount', 'due_date', 'paid_date', 'state', 'payment_reference',
+    )
+
+    name = fields.Char(string='Installment Reference', readonly=True)
+    sequence = fields.Integer(string='Sequence', readonly=True)
+    invoice_id = fields.Many2one('account.move', string='Invoice', readonly=True, index=True, ondelete='cascade')
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True, index=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    due_date = fields.Date(string='Due Date', readonly=True)
+    paid_date = fields.Date(string='Paid Date', readonly=True)
+    state = fields.Selection([
+        ('paid', 'Paid'),
+        ('cancelled', 'Cancelled')
+    ], string='Status', readonly=True)
+    payment_reference = fields.Char(string='Payment Reference', readonly=True)
+
+
+class InstallmentPaymentArchive(models.Model):
+    _name = 'installment.payment.archive'
+    _inherit = 'installment.archive.mixin'
+    _description = 'Archived Installment Payment'
+    _log_access = False
+    _order = 'due_date, id'
+
+    _source_table = 'installment_payment'
+    _archive_columns = (
+        'id', 'name', 'sequence', 'installment_schedule_id', 'invoice_id', 'partner_id', 'currency_id',
+        'amount', 'late_fee', 'interest_amount', 'total_amount', 'amount_paid',
+        'due_date', 'paid_date', 'state', 'payment_reference',
+    )
+
+    name = fields.Char(string='Payment Reference', readonly=True)
+    sequence = fields.Integer(string='Sequence', readonly=True)
+    installment_schedule_id = fields.Many2one('installment.schedule', string='Payment Schedule', readonly=True, index=True, ondelete='cascade')
+    invoice_id = fields.Many2one('account.move', string='Invoice', readonly=True, index=True, ondelete='cascade')
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True, index=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    late_fee = fields.Monetary(string='Late Fee', currency_field='currency_id', readonly=True)
+    interest_amount = fields.Monetary(string='Interest Amount', currency_field='currency_id', readonly=True)
+    total_amount = fields.Monetary(string='Total Amount', currency_field='currency_id', readonly=True)
+    amount_paid = fields.Monetary(string='Amount Paid', currency_field='currency_id', readonly=True)
+    due_date = fields.Date(string='Due Date', readonly=True)
+    paid_date = fields.Date(string='Paid Date', readonly=True)
+    state = fields.Selection([
+        ('paid', 'Paid'),
+        ('cancelled', 'Cancelled')
+    ], string='Status', readonly=True)
+    payment_reference = fields.Char(string='Reference', readonly=True)
+
+
+class InstallmentReminderArchive(models.Model):
+    _name = 'installment.reminder.archive'
+    _inherit = 'installment.archive.mixin'
+    _description = 'Archived Installment Reminder'
+    _log_access = False
+    _order = 'reminder_date desc, id desc'
+
+    _source_table = 'installment_reminder'
+    _archive_columns = (
+        'id', 'name', 'installment_payment_id', 'reminder_date', 'reminder_type', 'state',
+        'email_sent', 'sms_sent', 'partner_id', 'due_date', 'amount', 'currency_id',
+    )
+
+    name = fields.Char(string='Reminder Reference', readonly=True)
+    installment_payment_id = fields.Many2one('installment.payment.archive', string='Installment Payment', readonly=True, index=True, ondelete='cascade')
+    reminder_date = fields.Date(string='Reminder Date', readonly=True)
+    reminder_type = fields.Selection([
+        ('due_soon', 'Due Soon'),
+        ('overdue', 'Overdue'),
+        ('final_notice', 'Final Notice')
+    ], string='Reminder Type', readonly=True)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed')
+    ], string='Status', readonly=True)
+    email_sent = fields.Boolean(string='Email Sent', readonly=True)
+    sms_sent = fields.Boolean(string='SMS Sent', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    due_date = fields.Date(string='Due Date', readonly=True)
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+
+
+class InstallmentArchive(models.AbstractModel):
+    _name = 'installment.archive'
+    _description = 'Installment Archiving'
+
+    @api.model
+    def _get_archive_settings(self):
+        """Cutoff date and batch size from the system parameters"""
+        params = self.env['ir.config_parameter'].sudo()
+        age_days = int(params.get_param(AGE_DAYS_PARAM, 730))
+        batch_size = int(params.get_param(BATCH_SIZE_PARAM, 500))
+        return fields.Date.today() - timedelta(days=age_days), batch_size
+
+    @api.model
+    def _get_settled_invoice_ids(self, cutoff, limit):
+        """Closed invoices whose installments are all settled before the cutoff"""
+        self.env.cr.execute(f"""
+            SELECT il.invoice_id
+              FROM installment_list il
+              JOIN account_move am ON am.id = il.invoice_id
+             WHERE {CLOSED_INVOICE}
+             GROUP BY il.invoice_id
+            HAVING bool_and(il.state IN %s)
+               AND MAX(COALESCE(il.paid_date, il.due_date)) < %s
+             ORDER BY il.invoice_id
+             LIMIT %s
+        """, [SETTLED_STATES, cutoff, limit])
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _get_settled_schedule_ids(self, cutoff, limit):
+        """Finished schedules of closed invoices whose payments are all settled before the cutoff"""
+        self.env.cr.execute(f"""
+            SELECT ip.installment_schedule_id
+              FROM installment_payment ip
+              JOIN installment_schedule s ON s.id = ip.installment_schedule_id
+              JOIN account_move am ON am.id = s.invoice_id
+             WHERE s.state IN ('completed', 'cancelled')
+               AND {CLOSED_INVOICE}
+             GROUP BY ip.installment_schedule_id
+            HAVING bool_and(ip.state IN %s)
+               AND MAX(COALESCE(ip.paid_date, ip.due_date)) < %s
+             ORDER BY ip.installment_schedule_id
+             LIMIT %s
+        """, [SETTLED_STATES, cutoff, limit])
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _archive_invoice_installments(self, invoice_ids):
+        """Move the installments of the invoices to the archive"""
+        if not invoice_ids:
+            return 0
+        self.env.cr.execute("SELECT id FROM installment_list WHERE invoice_id = ANY(%s)", [invoice_ids])
+        installment_ids = [row[0] for row in self.env.cr.fetchall()]
+        return self.env['installment.list.archive']._move_rows(installment_ids)
+
+    @api.model
+    def _archive_schedule_payments(self, schedule_ids):
+        """Move the payments of the schedules and their reminders to the archive"""
+        if not schedule_ids:
+            return 0
+        self.env.cr.execute("SELECT id FROM installment_payment WHERE installment_schedule_id = ANY(%s)", [schedule_ids])
+        payment_ids = [row[0] for row in self.env.cr.fetchall()]
+        self.env.cr.execute("SELECT id FROM installment_reminder WHERE installment_payment_id = ANY(%s)", [payment_ids])
+        reminder_ids = [row[0] for row in self.env.cr.fetchall()]
+
+        # Reminders reference the archived payments and go away with the live ones
+        payment_archive = self.env['installment.payment.archive']
+        count = payment_archive._copy_rows(payment_ids)
+        count += self.env['installment.reminder.archive']._move_rows(reminder_ids)
+        # The adjustment log loses its payment link on delete, keep the archived one
+        if payment_ids:
+            self.env.cr.execute("""
+                UPDATE installment_payment_adjustment
+                   SET archived_payment_id = payment_id
+                 WHERE payment_id = ANY(%s)
+            """, [payment_ids])
+        payment_archive._delete_rows(payment_ids)
+        return count
+
+    @api.model
+    def _cron_archive_settled_installments(self):
+        """
+        Cron job moving one batch of settled installments, payments and
+        reminders to the archive tables. The cron runs again while full batches
+        are found; an interrupted run resumes where it stopped since archived
+        rows leave the live tables in the same transaction.
+        """
+        cutoff, batch_size = self._get_archive_settings()
+        # Stored totals of invoices, schedules and customers keep their value:
+        # the rows are moved in SQL and the computes add the archived rows back
+        self.env.flush_all()
+        invoice_ids = self._get_settled_invoice_ids(cutoff, batch_size)
+        schedule_ids = self._get_settled_schedule_ids(cutoff, batch_size)
+        moved = self._archive_invoice_installments(invoice_ids) + self._archive_schedule_payments(schedule_ids)
+        self.env.invalidate_all()
+
+        remaining = int(len(invoice_ids) == batch_size or len(schedule_ids) == batch_size)
+        self.env['ir.cron']._notify_progress(done=moved, remaining=remaining)
+        _logger.info(f"Archived {moved} installment rows of {len(invoice_ids)} invoices and {len(schedule_ids)} schedules")
+        return {'scanned': len(invoice_ids) + len(schedule_ids), 'changed': moved}
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, tools
+
+
+class InstallmentHistoryMixin(models.AbstractModel):
+    _name = 'installment.history.mixin'
+    _description = 'Installment History View'
+
+    # Archive model whose table is united with its live table
+    _archive_model = None
+
+    is_archived = fields.Boolean(string='Archived', readonly=True)
+
+    def init(self):
+        if self._abstract:
+            return
+        archive = self.env[self._archive_model]
+        columns = ', '.join(archive._archive_columns)
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(f"""
+            CREATE OR REPLACE VIEW {self._table} AS (
+                SELECT {columns}, FALSE AS is_archived
+                  FROM {archive._source_table}
+                 UNION ALL
+                SELECT {columns}, TRUE AS is_archived
+                  FROM {archive._table}
+            )
+        """)
+
+
+class InstallmentListHistory(models.Model):
+    _name = 'installment.list.history'
+    _inherit = 'installment.history.mixin'
+    _description = 'Installment History'
+    _auto = False
+    _order = 'due_date desc, id desc'
+
+    _archive_model = 'installment.list.archive'
+
+    name = fields.Char(string='Installment Reference', readonly=True)
+    sequence = fields.Integer(string='Sequence', readonly=True)
+    invoice_id = fields.Many2one('account.move', string='Invoice', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    due_date = fields.Date(string='Due Date', readonly=True)
+    paid_date = fields.Date(string='Paid Date', readonly=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('paid', 'Paid'),
+        ('overdue', 'Overdue'),
+        ('cancelled', 'Cancelled')
+    ], string='Status', readonly=True)
+    payment_reference = fields.Char(string='Payment Reference', readonly=True)
+
+
+class InstallmentPaymentHistory(models.Model):
+    _name = 'installment.payment.history'
+    _inherit = 'installment.history.mixin'
+    _description = 'Installment Payment History'
+    _auto = False
+    _order = 'due_date desc, id desc'
+
+    _archive_model = 'installment.payment.archive'
+
+    name = fields.Char(string='Payment Reference', readonly=True)
+    sequence = fields.Integer(string='Sequence', readonly=True)
+    installment_schedule_id = fields.Many2one('installment.schedule', string='Payment Schedule', readonly=True)
+    invoice_id = fields.Many2one('account.move', string='Invoice', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    late_fee = fields.Monetary(string='Late Fee', currency_field='currency_id', readonly=True)
+    interest_amount = fields.Monetary(string='Interest Amount', currency_field='currency_id', readonly=True)
+    total_amount = fields.Monetary(string='Total Amount', currency_field='currency_id', readonly=True)
+    amount_paid = fields.Monetary(string='Amount Paid', currency_field='currency_id', readonly=True)
+    due_date = fields.Date(string='Due Date', readonly=True)
+    paid_date = fields.Date(string='Paid Date', readonly=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('paid', 'Paid'),
+        ('overdue', 'Overdue'),
+        ('cancelled', 'Cancelled'),
+        ('adjusted', 'Adjusted')
+    ], string='Status', readonly=True)
+    payment_reference = fields.Char(string='Reference', readonly=True)
+
+
+class InstallmentReminderHistory(models.Model):
+    _name = 'installment.reminder.history'
+    _inherit = 'installment.history.mixin'
+    _description = 'Installment Reminder History'
+    _auto = False
+    _order = 'reminder_date desc, id desc'
+
+    _archive_model = 'installment.reminder.archive'
+
+    name = fields.Char(string='Reminder Reference', readonly=True)
+    installment_payment_id = fields.Many2one('installment.payment.history', string='Installment Payment', readonly=True)
+    reminder_date = fields.Date(string='Reminder Date', readonly=True)
+    reminder_type = fields.Selection([
+        ('due_soon', 'Due Soon'),
+        ('overdue', 'Overdue'),
+        ('final_notice', 'Final Notice')
+    ], string='Reminder Type', readonly=True)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed')
+    ], string='Status', readonly=True)
+    email_sent = fields.Boolean(string='Email Sent', readonly=True)
+    sms_sent = fields.Boolean(string='SMS Sent', readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    due_date = fields.Date(string='Due Date', readonly=True)
+    amount = fields.Monetary(string='Amount', currency_field='currency_id', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+
+
+# Include archived: the live models open their history view
+
+class InstallmentList(models.Model):
+    _inherit = 'installment.list'
+
+    @api.model
+    def action_view_history(self):
+        """Open the installments, archived ones included"""
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Installment History'),
+            'res_model': 'installment.list.history',
+            'view_mode': 'list,pivot',
+            'context': {'search_default_group_archived': 1},
+        }
+
+
+class InstallmentPayment(models.Model):
+    _inherit = 'installment.payment'
+
+    @api.model
+    def action_view_history(self):
+        """Open the payments, archived ones included"""
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Payment History'),
+            'res_model': 'installment.payment.history',
+            'view_mode': 'list,pivot',
+            'context': {'search_default_group_archived': 1},
+        }
+
+
+class InstallmentReminder(models.Model):
+    _inherit = 'installment.reminder'
+
+    @api.model
+    def action_view_history(self):
+        """Open the reminders, archived ones included"""
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Reminder History'),
+            'res_model': 'installment.reminder.history',
+            'view_mode': 'list',
+            'context': {'search_default_group_archived': 1},
+        }
+
+
+class InstallmentPaymentAdjustment(models.Model):
+    _inherit = 'installment.payment.adjustment'
+
+    archived_payment_id = fields.Many2one('installment.payment.archive', string='Archived Payment', readonly=True,
+                                          index='btree_not_null', ondelete='set null',
+                                          help="Payment moved to the archive, the live link is emptied when it leaves")
+
+
+# Stored totals count the archived rows
+
+class AccountMove(models.Model):
+    _inherit = 'account.move'
+
+    def _get_archived_installment_totals(self):
+        return self.env['installment.list.archive']._get_archived_totals('invoice_id', self._origin.ids)
+
+    def _compute_has_installments(self):
+        super()._compute_has_installments()
+        totals = self._get_archived_installment_totals()
+        for move in self:
+            move.has_installments = move.has_installments or bool(totals[move._origin.id]['count'])
+
+    def _compute_installment_count(self):
+        super()._compute_installment_count()
+        totals = self._get_archived_installment_totals()
+        for move in self:
+            archived = totals[move._origin.id]
+            move.installment_count += archived['count']
+            move.paid_installment_count += archived['paid_count']
+
+    def _compute_installment_totals(self):
+        super()._compute_installment_totals()
+        totals = self._get_archived_installment_totals()
+        for move in self:
+            move.total_paid_amount += totals[move._origin.id]['paid_amount']
+            move.total_remaining_amount = move.amount_total - move.total_paid_amount
+
+
+class ResPartner(models.Model):
+    _inherit = 'res.partner'
+
+    def _compute_installment_info(self):
+        super()._compute_installment_info()
+        totals = self.env['installment.list.archive']._get_archived_totals('partner_id', self._origin.ids)
+        for partner in self:
+            archived = totals[partner._origin.id]
+            partner.has_installments = partner.has_installments or bool(archived['count'])
+            partner.installment_count += archived['count']
+            partner.paid_installment_count += archived['paid_count']
+            partner.total_installment_amount += archived['amount']
+            partner.total_paid_amount += archived['paid_amount']
+            partner.total_remaining_amount = partner.total_installment_amount - partner.total_paid_amount
+
+
+class InstallmentSchedule(models.Model):
+    _inherit = 'installment.schedule'
+
+    def _get_archived_payment_totals(self):
+        return self.env['installment.payment.archive']._get_archived_totals('installment_schedule_id', self._origin.ids)
+
+    def _compute_paid_amount(self):
+        super()._compute_paid_amount()
+        totals = self._get_archived_payment_totals()
+        for schedule in self:
+            schedule.paid_amount += totals[schedule._origin.id]['paid_amount']
+
+    def _compute_payment_counts(self):
+        super()._compute_payment_counts()
+        totals = self._get_archived_payment_totals()
+        for schedule in self:
+            schedule.paid_count += totals[schedule._origin.id]['paid_count']
@@ -2,10 +2,29 @@
 {
     'name': "installment_details",
 
-    'summary': "Short (1 phrase/line) summary of the module's purpose",
+    'summary': "Installment details API for portal and mobile clients",
 
     'description': """
-Long description of module's purpose
+Installment details
+===================
+
+JSON endpoints over installment.list and installment.payment:
+
+- /installment_details/api/v1/<kind>/customer/<partner_id>
+- /installment_details/api/v1/<kind>/due_soon
+- /installment_details/api/v1/<kind>/overdue
+- /installment_details/api/v1/<kind>/<id>/pay (JSON-RPC)
+
+where <kind> is "installments" or "payments". Lists are ordered by
+(due_date, id) and paginated with the "after" cursor returned as "next".
+Responses carry an ETag and answer 304 to a matching If-None-Match.
+
+Customers see their installments, paid and remaining totals on the
+/my/installments portal page, rendered from a per-customer summary cached
+in installment.portal.summary and invalidated by installment writes.
+
+Bank statements (CSV or CAMT) are imported from Installment Management >
+Import Bank Statement and mark the matched installments as paid in bulk.
     """,
 
     'author': "My Company",
@@ -18,13 +37,14 @@ Long description of module's purpose
     'version': '0.1',
 
     # any module necessary for this one to work correctly
-    'depends': ['base'],
+    'depends': ['base', 'portal', 'invoice_installment_extension', 'enhanced_installment_system'],
 
     # always loaded
     'data': [
-        # 'security/ir.model.access.csv',
+        'security/ir.model.access.csv',
         'views/views.xml',
         'views/templates.xml',
+        'views/statement_import_wizard_views.xml',
     ],
     # only loaded in demonstration mode
     'demo': [
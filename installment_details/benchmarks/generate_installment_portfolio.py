@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Synthetic installment portfolio generator for load testing
+Fills a database with customers (with a customer number and guarantors),
+installment products, confirmed sale orders with installment lines, posted
+invoices and their installment.list / installment.payment rows, spread over
+paid, overdue and pending states. The same seed and reference date always
+produce the same portfolio.
+
+Accounting documents go through the ORM, the installment rows, which only
+the installment modules read, are loaded with COPY. The guarantor exposure,
+portal summaries and cash-flow forecast are rebuilt from them at the end.
+
+Usage:
+    python3 generate_installment_portfolio.py -c /etc/odoo/odoo.conf -d mydb --installments 100000 --seed 42
+"""
+
+import argparse
+import io
+import random
+import time
+from datetime import date, datetime, timedelta
+
+import odoo
+from odoo import api, fields, SUPERUSER_ID
+from odoo.modules.registry import Registry
+
+# (months, extra cost %) of the generated installment.config options
+INSTALLMENT_OPTIONS = [(6, 5.0), (12, 10.0), (18, 15.0), (24, 20.0)]
+
+INSTALLMENT_LIST_COLUMNS = [
+    'name', 'sequence', 'invoice_id', 'payment_term_id', 'amount', 'currency_id', 'due_date',
+    'paid_date', 'state', 'display_name', 'is_late', 'partner_id', 'customer_name',
+    'customer_number', 'due_month', 'due_week', 'paid_month', 'create_uid', 'create_date', 'write_uid', 'write_date',
+]
+INSTALLMENT_PAYMENT_COLUMNS = [
+    'name', 'sequence', 'installment_schedule_id', 'amount', 'currency_id', 'due_date', 'paid_date',
+    'state', 'is_late', 'late_fee', 'interest_rate', 'interest_amount', 'display_name',
+    'total_amount', 'principal_paid', 'charges_paid', 'amount_paid', 'amount_residual',
+    'partner_id', 'invoice_id', 'due_month', 'due_week', 'paid_month', 'create_uid', 'create_date', 'write_uid', 'write_date',
+]
+
+# Stored fields computed from the loaded rows
+MOVE_AGGREGATE_FIELDS = [
+    'has_installments', 'installment_count', 'paid_installment_count', 'pending_installment_count',
+    'overdue_installment_count', 'total_paid_amount', 'total_remaining_amount',
+]
+SCHEDULE_AGGREGATE_FIELDS = [
+    'paid_amount', 'remaining_amount', 'paid_count', 'pending_count', 'overdue_count',
+]
+
+
+def copy_rows(cr, table, columns, rows):
+    """Bulk load rows with COPY FROM STDIN"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(copy_value(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+    cr.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+
+def copy_value(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value)
+
+
+def installment_state(rng, due_date, today):
+    """Return (state, paid_date): mostly paid in the past, some overdue, a few paid early"""
+    if due_date < today:
+        roll = rng.random()
+        if roll < 0.80:
+            return 'paid', min(today, due_date + timedelta(days=rng.randint(-5, 20)))
+        if roll < 0.95:
+            return 'overdue', None
+        return 'pending', None
+    if rng.random() < 0.02:
+        return 'paid', today - timedelta(days=rng.randint(0, 10))
+    return 'pending', None
+
+
+def split_amounts(total, first_payment, count):
+    """First payment, then equal installments, the last one absorbing the rounding"""
+    amounts = [round(first_payment, 2)] if first_payment else []
+    remaining = count - len(amounts)
+    share = round((total - first_payment) / remaining, 2)
+    amounts += [share] * remaining
+    amounts[-1] = round(total - sum(amounts[:-1]), 2)
+    return amounts
+
+
+def create_customers(env, rng, args):
+    """Customers with a customer number, a share of them also acting as guarantors"""
+    tag = f"S{args.seed}"
+    partners = env['res.partner'].create([{
+        'name': f"Customer {tag}-{index:07d}",
+        'ref': f"{tag}{index:07d}",
+        'email': f"customer{index}@{tag.lower()}.example.com",
+        'mobile': f"+1555{rng.randint(1000000, 9999999)}",
+        'customer_rank': 1,
+    } for index in range(args.partners)])
+    guarantors = partners.filtered(lambda p: rng.random() < args.guarantor_ratio)
+    return partners, guarantors or partners[:1]
+
+
+def create_products(env, rng, args):
+    """Installment products, with installment.config options when product installment buying is installed"""
+    product_vals = [{
+        'name': f"Installment Product S{args.seed}-{index:04d}",
+        'type': 'consu',
+        'invoice_policy': 'order',
+        'list_price': rng.randrange(3000, 60000, 100),
+        'taxes_id': [(5, 0, 0)],
+    } for index in range(args.products)]
+    if 'installment.config' in env:
+        configs = env['installment.config'].create([
+            {'months': months, 'emi': emi} for months, emi in INSTALLMENT_OPTIONS
+        ])
+        for vals in product_vals:
+            vals.update({
+                'installment_ok': True,
+                'installment_ids': [(6, 0, configs.ids)],
+            })
+    return env['product.product'].create(product_vals)
+
+
+def create_invoices(env, rng, args, partners, guarantors, products, count, today):
+    """Confirmed orders and their posted invoices, return [(invoice, installment count, first payment)]"""
+    plans = []
+    order_vals = []
+    for _index in range(count):
+        partner = rng.choice(partners)
+        product = rng.choice(products)
+        installment_count = rng.choice(args.installment_counts)
+        first_payment = round(product.list_price * rng.choice([0, 0.1, 0.2, 0.3]), 2)
+        order_date = today - timedelta(days=rng.randint(0, args.history_days))
+        plans.append((partner, product, installment_count, first_payment, order_date))
+        order_vals.append({
+            'partner_id': partner.id,
+            'date_order': order_date,
+            'customer_guarantees_ids': [(6, 0, rng.choice(guarantors).ids)],
+            'order_line': [(0, 0, {
+                'product_id': product.id,
+                'product_uom_qty': 1.0,
+                'price_unit': product.list_price,
+                'installment_num': installment_count,
+                'first_payment': first_payment,
+                'tax_id': [(5, 0, 0)],
+            })],
+        })
+    orders = env['sale.order'].create(order_vals)
+    orders.action_confirm()
+
+    moves = env['account.move'].create([{
+        'move_type': 'out_invoice',
+        'partner_id': partner.id,
+        'invoice_date': order_date,
+        'invoice_origin': order.name,
+        'customer_guarantees_ids': [(6, 0, order.customer_guarantees_ids.ids)],
+        'invoice_line_ids': [(0, 0, {
+            'product_id': product.id,
+            'quantity': 1.0,
+            'price_unit': product.list_price,
+            'tax_ids': [(5, 0, 0)],
+            'sale_line_ids': [(6, 0, order.order_line.ids)],
+        })],
+    } for order, (partner, product, _count, _first, order_date) in zip(orders, plans)])
+    # Installment data is set after posting, the rows are loaded below
+    moves.action_post()
+    env.flush_all()
+    env.cr.execute("""
+        UPDATE account_move
+           SET installment_num = data.installment_num, first_payment = data.first_payment
+          FROM (SELECT unnest(%s::int[]) AS id, unnest(%s::float[]) AS installment_num,
+                       unnest(%s::float[]) AS first_payment) data
+         WHERE account_move.id = data.id
+    """, [moves.ids, [plan[2] for plan in plans], [plan[3] for plan in plans]])
+    moves.invalidate_recordset(['installment_num', 'first_payment'])
+    return [(move, plan[2], plan[3]) for move, plan in zip(moves, plans)]
+
+
+def load_installments(env, rng, invoices, today, counter, prefix):
+    """COPY the installment.list and installment.payment rows of the invoices"""
+    now = fields.Datetime.to_string(datetime.now())
+    has_schedules = 'installment.schedule' in env
+    schedules = {}
+    if has_schedules:
+        schedule_records = env['installment.schedule'].create([{
+            'name': f"Installment Schedule - {move.name}",
+            'invoice_id': move.id,
+            'total_amount': move.amount_total,
+            'installment_count': installment_count,
+            'payment_frequency': 'monthly',
+            'state': 'active',
+        } for move, installment_count, _first in invoices])
+        schedules = dict(zip([move.id for move, _count, _first in invoices], schedule_records.ids))
+
+    list_rows, payment_rows = [], []
+    for move, installment_count, first_payment in invoices:
+        partner = move.partner_id
+        amounts = split_amounts(move.amount_total, first_payment, installment_count)
+        for sequence, amount in enumerate(amounts, start=1):
+            counter[0] += 1
+            due_date = move.invoice_date + timedelta(days=30 * (sequence - 1))
+            state, paid_date = installment_state(rng, due_date, today)
+            is_late = state == 'pending' and due_date < today
+            period_keys = [
+                due_date.strftime('%Y-%m'), due_date.strftime('%G-W%V'),
+                paid_date.strftime('%Y-%m') if paid_date else None,
+            ]
+            list_rows.append([
+                f"{prefix}/{counter[0]:08d}", sequence, move.id, move.invoice_payment_term_id.id or None,
+                amount, move.currency_id.id, due_date, paid_date, state,
+                f"Installment {sequence} - {amount:,.2f} - {due_date}", is_late, partner.id,
+                partner.name, partner.ref, *period_keys, SUPERUSER_ID, now, SUPERUSER_ID, now,
+            ])
+            if has_schedules:
+                # Paid payments are settled in full: principal paid, nothing due
+                paid = amount if state == 'paid' else 0.0
+                payment_rows.append([
+                    f"{prefix}/PAY/{counter[0]:08d}", sequence, schedules[move.id], amount, move.currency_id.id,
+                    due_date, paid_date, state, is_late, 0.0, 0.0, 0.0,
+                    f"Payment {sequence} - {amount:,.2f} - {due_date}", amount, paid, 0.0, paid, amount - paid,
+                    partner.id, move.id, *period_keys, SUPERUSER_ID, now, SUPERUSER_ID, now,
+                ])
+
+    env.flush_all()
+    copy_rows(env.cr, 'installment_list', INSTALLMENT_LIST_COLUMNS, list_rows)
+    if payment_rows:
+        copy_rows(env.cr, 'installment_payment', INSTALLMENT_PAYMENT_COLUMNS, payment_rows)
+    env.invalidate_all()
+
+    # Stored aggregates depending on the loaded rows
+    moves = env['account.move'].browse([move.id for move, _count, _first in invoices])
+    for field_name in MOVE_AGGREGATE_FIELDS:
+        env.add_to_compute(moves._fields[field_name], moves)
+    if has_schedules:
+        schedule_records = env['installment.schedule'].browse(list(schedules.values()))
+        for field_name in SCHEDULE_AGGREGATE_FIELDS:
+            env.add_to_compute(schedule_records._fields[field_name], schedule_records)
+    env.flush_all()
+    return len(list_rows), len(payment_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic installment portfolio")
+    parser.add_argument('-c', '--config', required=True, help="Odoo configuration file")
+    parser.add_argument('-d', '--database', required=True, help="Database name")
+    parser.add_argument('--installments', type=int, default=10000, help="Installments to generate")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    parser.add_argument('--today', type=date.fromisoformat, default=date.today(),
+                        help="Reference date of the paid/overdue/pending split (YYYY-MM-DD)")
+    parser.add_argument('--partners', type=int, help="Customers (default: installments / 50)")
+    parser.add_argument('--guarantor-ratio', type=float, default=0.2, help="Share of customers acting as guarantors")
+    parser.add_argument('--products', type=int, default=20, help="Installment products")
+    parser.add_argument('--installment-counts', type=int, nargs='+', default=[6, 12, 18, 24],
+                        help="Installment counts picked for each invoice")
+    parser.add_argument('--history-days', type=int, default=720, help="Invoice dates span over the last days")
+    parser.add_argument('--batch', type=int, default=500, help="Invoices per transaction")
+    args = parser.parse_args()
+    args.partners = args.partners or max(1, args.installments // 50)
+
+    odoo.tools.config.parse_config(['-c', args.config, '-d', args.database])
+    registry = Registry(args.database)
+    rng = random.Random(args.seed)
+    average_count = sum(args.installment_counts) / len(args.installment_counts)
+    invoice_count = max(1, round(args.installments / average_count))
+
+    print(f"🔍 ~{args.installments} installments: {invoice_count} invoices, {args.partners} customers, "
+          f"seed {args.seed}")
+    start = time.perf_counter()
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {'tracking_disable': True, 'mail_notrack': True})
+        partners, guarantors = create_customers(env, rng, args)
+        products = create_products(env, rng, args)
+        partner_ids, guarantor_ids, product_ids = partners.ids, guarantors.ids, products.ids
+
+    counter = [0]
+    totals = [0, 0]
+    done = 0
+    while done < invoice_count:
+        size = min(args.batch, invoice_count - done)
+        with registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {'tracking_disable': True, 'mail_notrack': True})
+            invoices = create_invoices(
+                env, rng, args,
+                env['res.partner'].browse(partner_ids), env['res.partner'].browse(guarantor_ids),
+                env['product.product'].browse(product_ids), size, args.today,
+            )
+            for index, loaded in enumerate(load_installments(env, rng, invoices, args.today, counter, f"GEN{args.seed}")):
+                totals[index] += loaded
+        done += size
+        print(f"   {done}/{invoice_count} invoices, {totals[0]} installments ({time.perf_counter() - start:.0f}s)")
+
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        if 'installment.guarantor.exposure' in env:
+            env['installment.guarantor.exposure']._cron_rebuild_exposure()
+        if 'installment.portal.summary' in env:
+            env['installment.portal.summary']._invalidate(partner_ids)
+        if 'installment.forecast' in env:
+            # Also refreshes the on-time ratios of the customers
+            env['installment.forecast']._cron_rebuild_forecast()
+        cr.execute("ANALYZE installment_list")
+        if totals[1]:
+            cr.execute("ANALYZE installment_payment")
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ {totals[0]} installments and {totals[1]} schedule payments in {elapsed:.1f}s "
+          f"({totals[0] / elapsed:.0f} installments/s)")
+
+
+if __name__ == '__main__':
+    main()
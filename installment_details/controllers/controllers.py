@@ -1,22 +1,138 @@
 # -*- coding: utf-8 -*-
-# from odoo import http
+import hashlib
+import json
+from datetime import timedelta
 
+from werkzeug.exceptions import BadRequest, NotFound
 
-# class InstallmentDetails(http.Controller):
-#     @http.route('/installment_details/installment_details', auth='public')
-#     def index(self, **kw):
-#         return "Hello, world"
+from odoo import http, fields
+from odoo.http import request
 
-#     @http.route('/installment_details/installment_details/objects', auth='public')
-#     def list(self, **kw):
-#         return http.request.render('installment_details.listing', {
-#             'root': '/installment_details/installment_details',
-#             'objects': http.request.env['installment_details.installment_details'].search([]),
-#         })
+API_ROOT = '/installment_details/api/v1'
 
-#     @http.route('/installment_details/installment_details/objects/<model("installment_details.installment_details"):obj>', auth='public')
-#     def object(self, obj, **kw):
-#         return http.request.render('installment_details.object', {
-#             'object': obj
-#         })
+# Endpoint kind -> (model, compact field projection)
+API_MODELS = {
+    'installments': ('installment.list', [
+        'name', 'sequence', 'invoice_id', 'partner_id', 'amount', 'currency_id',
+        'due_date', 'paid_date', 'state',
+    ]),
+    'payments': ('installment.payment', [
+        'name', 'sequence', 'installment_schedule_id', 'invoice_id', 'partner_id', 'amount',
+        'currency_id', 'due_date', 'paid_date', 'state',
+    ]),
+}
 
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+MAX_DUE_SOON_DAYS = 90
+
+
+class InstallmentDetails(http.Controller):
+
+    # Helpers
+
+    def _get_model(self, kind):
+        """Return the model and field projection of an endpoint kind"""
+        if kind not in API_MODELS:
+            raise NotFound()
+        model_name, field_names = API_MODELS[kind]
+        return request.env[model_name], field_names
+
+    def _parse_limit(self, limit):
+        try:
+            limit = int(limit or DEFAULT_LIMIT)
+        except ValueError:
+            raise BadRequest("limit must be an integer")
+        return max(1, min(limit, MAX_LIMIT))
+
+    def _parse_cursor(self, after):
+        """Decode a 'YYYY-MM-DD,id' keyset cursor into a domain"""
+        if not after:
+            return []
+        try:
+            due_date, record_id = after.split(',')
+            due_date = fields.Date.to_date(due_date)
+            record_id = int(record_id)
+        except ValueError:
+            raise BadRequest("after must be formatted as 'YYYY-MM-DD,id'")
+        return ['|', ('due_date', '>', due_date), '&', ('due_date', '=', due_date), ('id', '>', record_id)]
+
+    def _page(self, kind, domain, after=None, limit=None):
+        """Return one keyset page of records ordered by (due_date, id)"""
+        Model, field_names = self._get_model(kind)
+        limit = self._parse_limit(limit)
+        records = Model.search_read(
+            domain + self._parse_cursor(after),
+            field_names,
+            limit=limit + 1,
+            order='due_date, id',
+            load=None,
+        )
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = f"{records[-1]['due_date']},{records[-1]['id']}"
+        return {'records': records, 'next': next_cursor}
+
+    def _json_response(self, payload):
+        """Serialize a payload, answering 304 when the client copy is current"""
+        body = json.dumps(payload, default=str, separators=(',', ':'))
+        etag = hashlib.sha1(body.encode()).hexdigest()
+        headers = [
+            ('ETag', f'"{etag}"'),
+            ('Cache-Control', 'private, no-cache'),
+        ]
+        if request.httprequest.if_none_match.contains(etag):
+            return request.make_response('', headers=headers, status=304)
+        return request.make_response(body, headers=headers + [('Content-Type', 'application/json')])
+
+    # Endpoints
+
+    @http.route(f'{API_ROOT}/<string:kind>/customer/<int:partner_id>', type='http', auth='user',
+                methods=['GET'], readonly=True)
+    def customer_installments(self, kind, partner_id, after=None, limit=None, state=None, **kw):
+        """Installments of one customer"""
+        domain = [('partner_id', '=', partner_id)]
+        if state:
+            domain.append(('state', 'in', state.split(',')))
+        return self._json_response(self._page(kind, domain, after, limit))
+
+    @http.route(f'{API_ROOT}/<string:kind>/due_soon', type='http', auth='user',
+                methods=['GET'], readonly=True)
+    def due_soon(self, kind, days=7, after=None, limit=None, **kw):
+        """Pending installments falling due within the next days"""
+        try:
+            days = max(0, min(int(days), MAX_DUE_SOON_DAYS))
+        except ValueError:
+            raise BadRequest("days must be an integer")
+        today = fields.Date.context_today(request.env.user)
+        domain = [
+            ('state', '=', 'pending'),
+            ('due_date', '>=', today),
+            ('due_date', '<=', today + timedelta(days=days)),
+        ]
+        return self._json_response(self._page(kind, domain, after, limit))
+
+    @http.route(f'{API_ROOT}/<string:kind>/overdue', type='http', auth='user',
+                methods=['GET'], readonly=True)
+    def overdue(self, kind, after=None, limit=None, **kw):
+        """Overdue installments, including pending ones the cron has not flagged yet"""
+        today = fields.Date.context_today(request.env.user)
+        domain = [
+            '|', ('state', '=', 'overdue'),
+            '&', ('state', '=', 'pending'), ('due_date', '<', today),
+        ]
+        return self._json_response(self._page(kind, domain, after, limit))
+
+    @http.route(f'{API_ROOT}/<string:kind>/<int:record_id>/pay', type='json', auth='user',
+                methods=['POST'])
+    def pay(self, kind, record_id, payment_reference=None, **kw):
+        """Record the payment of one installment"""
+        Model = self._get_model(kind)[0]
+        record = Model.browse(record_id).exists()
+        if not record:
+            raise NotFound()
+        if payment_reference:
+            record.payment_reference = payment_reference
+        record.action_mark_paid()
+        return record.read(['state', 'paid_date', 'payment_reference'], load=None)[0]
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from odoo import http, fields
+from odoo.http import request
+
+from odoo.addons.portal.controllers.portal import CustomerPortal
+
+
+class InstallmentPortal(CustomerPortal):
+
+    def _get_installment_summary(self):
+        """Cached installment summary of the logged-in customer"""
+        partner = request.env.user.partner_id.commercial_partner_id
+        return request.env['installment.portal.summary'].sudo()._get_summary(partner)
+
+    def _prepare_home_portal_values(self, counters):
+        values = super()._prepare_home_portal_values(counters)
+        if 'installment_count' in counters:
+            values['installment_count'] = self._get_installment_summary()['open_count']
+        return values
+
+    @http.route(['/my/installments'], type='http', auth='user', website=True)
+    def portal_my_installments(self, **kw):
+        summary = self._get_installment_summary()
+        today = fields.Date.to_string(fields.Date.context_today(request.env.user))
+        upcoming = [
+            installment for installment in summary['installments']
+            if installment['state'] == 'pending' and installment['due_date'] >= today
+        ][:5]
+        currency = request.env['res.currency'].browse(summary['currency_id']) if summary['currency_id'] \
+            else request.env.company.currency_id
+
+        values = self._prepare_portal_layout_values()
+        values.update({
+            'page_name': 'installments',
+            'summary': summary,
+            'upcoming': upcoming,
+            'currency': currency,
+            'today': today,
+        })
+        return request.render('installment_details.portal_my_installments', values)
@@ -1,3 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from . import models
+from . import installment_portal_summary
+from . import installment_list
+from . import statement_import
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api
+
+PORTAL_FIELDS = {'name', 'sequence', 'invoice_id', 'partner_id', 'amount', 'due_date', 'paid_date', 'state'}
+
+
+class InstallmentList(models.Model):
+    _inherit = 'installment.list'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        installments = super().create(vals_list)
+        self.env['installment.portal.summary']._invalidate(installments.partner_id.ids)
+        return installments
+
+    def write(self, vals):
+        if not PORTAL_FIELDS & set(vals):
+            return super().write(vals)
+        partner_ids = self.partner_id.ids
+        result = super().write(vals)
+        self.env['installment.portal.summary']._invalidate(partner_ids + self.partner_id.ids)
+        return result
+
+    def unlink(self):
+        partner_ids = self.partner_id.ids
+        result = super().unlink()
+        self.env['installment.portal.summary']._invalidate(partner_ids)
+        return result
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from odoo import models, fields, api
+
+
+class InstallmentPortalSummary(models.Model):
+    _name = 'installment.portal.summary'
+    _description = 'Installment Portal Summary Cache'
+    _rec_name = 'partner_id'
+
+    partner_id = fields.Many2one('res.partner', string='Customer', required=True, index=True, ondelete='cascade')
+    version = fields.Integer(string='Version', default=0)
+    data = fields.Json(string='Summary')
+
+    _sql_constraints = [
+        ('partner_uniq', 'unique(partner_id)', 'Only one portal summary is allowed per customer.'),
+    ]
+
+    @api.model
+    def _get_summary(self, partner):
+        """Return the installment summary of a commercial partner, computing it on a cache miss"""
+        self.env.cr.execute("""
+            SELECT version, data
+              FROM installment_portal_summary
+             WHERE partner_id = %s
+        """, [partner.id])
+        row = self.env.cr.fetchone()
+        if row and row[1] is not None:
+            return row[1]
+
+        data = self._compute_summary(partner)
+        if row:
+            # Only fill the version we read, a newer invalidation wins
+            self.env.cr.execute("""
+                UPDATE installment_portal_summary
+                   SET data = %s
+                 WHERE partner_id = %s
+                   AND version = %s
+            """, [json.dumps(data), partner.id, row[0]])
+        else:
+            self.env.cr.execute("""
+                INSERT INTO installment_portal_summary (partner_id, version, data,
+                                                        create_uid, create_date, write_uid, write_date)
+                VALUES (%(partner_id)s, 0, %(data)s,
+                        %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC')
+                ON CONFLICT (partner_id) DO NOTHING
+            """, {'partner_id': partner.id, 'data': json.dumps(data), 'uid': self.env.uid})
+        return data
+
+    @api.model
+    def _compute_summary(self, partner):
+        """Aggregate the installments of a commercial partner in one query"""
+        self.env['installment.list'].flush_model()
+        self.env.cr.execute("""
+            SELECT COALESCE(SUM(il.amount) FILTER (WHERE il.state = 'paid'), 0)::float,
+                   COALESCE(SUM(il.amount) FILTER (WHERE il.state IN ('pending', 'overdue')), 0)::float,
+                   COUNT(il.id) FILTER (WHERE il.state IN ('pending', 'overdue')),
+                   MIN(il.due_date) FILTER (WHERE il.state IN ('pending', 'overdue')),
+                   MAX(il.currency_id),
+                   COALESCE(json_agg(json_build_object(
+                       'id', il.id,
+                       'name', il.name,
+                       'sequence', il.sequence,
+                       'invoice_name', am.name,
+                       'due_date', il.due_date,
+                       'paid_date', il.paid_date,
+                       'amount', il.amount,
+                       'state', il.state
+                   ) ORDER BY il.due_date, il.id) FILTER (WHERE il.id IS NOT NULL), '[]')
+              FROM installment_list il
+              JOIN res_partner p ON p.id = il.partner_id
+              JOIN account_move am ON am.id = il.invoice_id
+             WHERE p.commercial_partner_id = %s
+               AND il.state != 'cancelled'
+        """, [partner.id])
+        paid, remaining, open_count, next_due_date, currency_id, installments = self.env.cr.fetchone()
+        return {
+            'paid_amount': paid,
+            'remaining_amount': remaining,
+            'open_count': open_count,
+            'next_due_date': next_due_date and fields.Date.to_string(next_due_date),
+            'currency_id': currency_id,
+            'installments': installments,
+        }
+
+    @api.model
+    def _invalidate(self, partner_ids):
+        """Drop the cached summaries of the commercial partners of these partners"""
+        partner_ids = list({pid for pid in partner_ids if pid})
+        if not partner_ids:
+            return
+        self.env['res.partner'].flush_model(['commercial_partner_id'])
+        # Bump the version so a summary computed concurrently is never stored
+        self.env.cr.execute("""
+            INSERT INTO installment_portal_summary (partner_id, version, data,
+                                                    create_uid, create_date, write_uid, write_date)
+            SELECT DISTINCT p.commercial_partner_id, 1, NULL,
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+              FROM res_partner p
+             WHERE p.id = ANY(%(partner_ids)s)
+               AND p.commercial_partner_id IS NOT NULL
+            ON CONFLICT (partner_id) DO UPDATE
+               SET version = installment_portal_summary.version + 1,
+                   data = NULL,
+                   write_date = EXCLUDED.write_date
+        """, {'partner_ids': partner_ids, 'uid': self.env.uid})
+        self.invalidate_model()
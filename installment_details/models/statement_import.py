@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, tools
+
+
+# The statement import matches its upper-cased keys against these columns,
+# whatever the case they were stored with
+
+class InstallmentList(models.Model):
+    _inherit = 'installment.list'
+
+    def init(self):
+        super().init()
+        for column in ('name', 'payment_reference'):
+            tools.create_index(self.env.cr, f'{self._table}_upper_{column}_open_index', self._table,
+                               [f'upper({column})'], where="state IN ('pending', 'overdue')")
+
+
+class InstallmentPayment(models.Model):
+    _inherit = 'installment.payment'
+
+    def init(self):
+        super().init()
+        for column in ('name', 'payment_reference'):
+            tools.create_index(self.env.cr, f'{self._table}_upper_{column}_open_index', self._table,
+                               [f'upper({column})'], where="state IN ('pending', 'overdue')")
+
+
+class ResPartner(models.Model):
+    _inherit = 'res.partner'
+
+    def init(self):
+        super().init()
+        tools.create_index(self.env.cr, 'res_partner_upper_ref_index', self._table,
+                           ['upper(ref)'], where='ref IS NOT NULL')
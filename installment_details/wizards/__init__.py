@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+
+from . import statement_import_wizard
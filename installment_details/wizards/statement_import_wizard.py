@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import csv
+import io
+import logging
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+from odoo.tools import float_round
+
+_logger = logging.getLogger(__name__)
+
+# Accepted CSV headers for each statement column
+CSV_COLUMNS = {
+    'reference': ('reference', 'ref', 'payment_reference', 'communication', 'description'),
+    'amount': ('amount', 'credit'),
+    'partner_ref': ('partner_ref', 'customer_number', 'customer_ref', 'partner'),
+    'date': ('date', 'value_date', 'booking_date'),
+}
+
+# Statement lines matched and marked paid per round
+IMPORT_CHUNK_SIZE = 2000
+
+# Import target -> model
+TARGET_MODELS = {
+    'installments': 'installment.list',
+    'payments': 'installment.payment',
+}
+
+
+def _local_tag(element):
+    """Tag name without its XML namespace"""
+    return element.tag.rsplit('}', 1)[-1]
+
+
+def _parse_amount(text):
+    """Parse '1,234.50', '1.234,50' or '1234,50' into a float"""
+    text = text.replace(' ', '').replace('\xa0', '')
+    if ',' in text and '.' in text:
+        # The last separator is the decimal one
+        thousands = ',' if text.rfind(',') < text.rfind('.') else '.'
+        text = text.replace(thousands, '')
+    return float(text.replace(',', '.'))
+
+
+class StatementImportWizard(models.TransientModel):
+    _name = 'installment.statement.import.wizard'
+    _description = 'Installment Statement Import Wizard'
+
+    # File
+    data_file = fields.Binary(string='Statement File', required=True)
+    filename = fields.Char(string='File Name')
+    file_format = fields.Selection([
+        ('csv', 'CSV'),
+        ('camt', 'CAMT.053 / CAMT.054'),
+    ], string='Format', compute='_compute_file_format', store=True, readonly=False, required=True)
+    target = fields.Selection([
+        ('installments', 'Invoice Installments'),
+        ('payments', 'Schedule Payments'),
+        ('both', 'Both'),
+    ], string='Match Against', default='both', required=True)
+
+    # Result
+    state = fields.Selection([
+        ('upload', 'Upload'),
+        ('done', 'Done'),
+    ], default='upload')
+    line_count = fields.Integer(string='Statement Lines', readonly=True)
+    matched_count = fields.Integer(string='Matched', readonly=True)
+    unmatched_count = fields.Integer(string='Unmatched', readonly=True)
+    completed_schedule_count = fields.Integer(string='Completed Schedules', readonly=True)
+    unmatched_lines = fields.Text(string='Unmatched Lines', readonly=True)
+
+    @api.depends('filename')
+    def _compute_file_format(self):
+        for wizard in self:
+            name = (wizard.filename or '').lower()
+            wizard.file_format = 'camt' if name.endswith('.xml') else 'csv'
+
+    # Parsing
+
+    def _iter_csv_rows(self, raw):
+        """Yield (line, reference, amount, partner_ref, date) from a CSV statement"""
+        text = io.TextIOWrapper(io.BytesIO(raw), encoding='utf-8-sig', newline='')
+        try:
+            dialect = csv.Sniffer().sniff(text.read(4096), delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        text.seek(0)
+        reader = csv.DictReader(text, dialect=dialect)
+        headers = {(name or '').strip().lower(): name for name in reader.fieldnames or []}
+        columns = {
+            key: next((headers[alias] for alias in aliases if alias in headers), None)
+            for key, aliases in CSV_COLUMNS.items()
+        }
+        if not columns['amount']:
+            raise UserError(_("The CSV file must have an amount column."))
+
+        for line, row in enumerate(reader, start=2):
+            values = {key: (row.get(column) or '').strip() if column else '' for key, column in columns.items()}
+            yield line, values['reference'], values['amount'], values['partner_ref'], values['date']
+
+    def _iter_camt_rows(self, raw):
+        """Yield (line, reference, amount, partner_ref, date) from the credit entries of a CAMT statement"""
+        entry = 0
+        for _event, element in ET.iterparse(io.BytesIO(raw), events=('end',)):
+            if _local_tag(element) != 'Ntry':
+                continue
+            entry += 1
+            values = {}
+            in_debtor = False
+            for child in element.iter():
+                tag = _local_tag(child)
+                if tag in ('Dbtr', 'UltmtDbtr'):
+                    in_debtor = True
+                elif tag in ('DbtrAcct', 'Cdtr', 'CdtrAcct'):
+                    in_debtor = False
+                text = (child.text or '').strip()
+                if not text or text == 'NOTPROVIDED':
+                    continue
+                if tag == 'Id' and in_debtor:
+                    tag = 'DbtrId'
+                values.setdefault(tag, text)
+            # Free the parsed entry, the statement is processed entry by entry
+            element.clear()
+            if values.get('CdtDbtInd') == 'DBIT':
+                continue
+            reference = values.get('Ref') or values.get('Ustrd') or values.get('EndToEndId') or ''
+            yield entry, reference, values.get('Amt', ''), values.get('DbtrId', ''), values.get('Dt', '')
+
+    def _read_statement(self, invalid):
+        """Parse the statement into lists of at most IMPORT_CHUNK_SIZE row dicts, collecting invalid lines"""
+        raw = base64.b64decode(self.data_file)
+        parser = self._iter_camt_rows if self.file_format == 'camt' else self._iter_csv_rows
+        rows = []
+        try:
+            for line, reference, amount, partner_ref, date in parser(raw):
+                try:
+                    amount = _parse_amount(amount)
+                except ValueError:
+                    invalid.append(_("Line %(line)s: invalid amount '%(amount)s'", line=line, amount=amount))
+                    continue
+                try:
+                    date = fields.Date.to_date(date[:10]) if date else None
+                except ValueError:
+                    date = None
+                rows.append({
+                    'line': line,
+                    'reference': reference.upper(),
+                    'amount': float_round(amount, precision_digits=2),
+                    'partner_ref': partner_ref.upper(),
+                    'date': date,
+                })
+                if len(rows) >= IMPORT_CHUNK_SIZE:
+                    yield rows
+                    rows = []
+        except (ET.ParseError, csv.Error, UnicodeDecodeError) as e:
+            raise UserError(_("The statement file could not be read: %s", e))
+        if rows:
+            yield rows
+
+    # Matching
+
+    def _build_indexes(self, rows):
+        """Load the open records the statement may refer to and index them once"""
+        references = list({row['reference'] for row in rows if row['reference']})
+        partner_refs = list({row['partner_ref'] for row in rows if row['partner_ref']})
+        targets = TARGET_MODELS if self.target == 'both' else {self.target: TARGET_MODELS[self.target]}
+
+        by_reference = {}
+        by_partner_amount = defaultdict(list)
+        if not references and not partner_refs:
+            return by_reference, by_partner_amount
+        self.env['res.partner'].flush_model(['ref'])
+        for target, model_name in targets.items():
+            Model = self.env[model_name]
+            Model.flush_model(['name', 'payment_reference', 'partner_id', 'state'])
+            # Statement keys are upper-cased: match the stored values whatever their case
+            self.env.cr.execute(f"""
+                SELECT id
+                  FROM {Model._table}
+                 WHERE state IN ('pending', 'overdue')
+                   AND (upper(name) = ANY(%(references)s::varchar[])
+                        OR upper(payment_reference) = ANY(%(references)s::varchar[])
+                        OR partner_id IN (SELECT id FROM res_partner WHERE upper(ref) = ANY(%(partner_refs)s::varchar[])))
+            """, {'references': references, 'partner_refs': partner_refs})
+            record_ids = [row[0] for row in self.env.cr.fetchall()]
+            if not record_ids:
+                continue
+            records = Model.search_read(
+                [('id', 'in', record_ids)],
+                ['name', 'payment_reference', 'amount', 'partner_id', 'due_date'],
+                order='due_date, id',
+                load=None,
+            )
+            # Partner references in one read
+            partner_ids = {record['partner_id'] for record in records}
+            partner_refs_by_id = {
+                partner['id']: (partner['ref'] or '').upper()
+                for partner in self.env['res.partner'].search_read([('id', 'in', list(partner_ids))], ['ref'])
+            }
+            for record in records:
+                key = (target, record['id'])
+                amount = float_round(record['amount'], precision_digits=2)
+                entry = (key, amount)
+                by_reference.setdefault(record['name'].upper(), entry)
+                if record['payment_reference']:
+                    by_reference.setdefault(record['payment_reference'].upper(), entry)
+                partner_ref = partner_refs_by_id.get(record['partner_id'])
+                if partner_ref:
+                    by_partner_amount[(partner_ref, amount)].append(key)
+        return by_reference, by_partner_amount
+
+    def _match_rows(self, rows, by_reference, by_partner_amount):
+        """Return ({(target, paid_date): [ids]}, unmatched messages)"""
+        matched = defaultdict(list)
+        unmatched = []
+        used = set()
+        today = fields.Date.context_today(self)
+        for row in rows:
+            key = None
+            entry = by_reference.get(row['reference']) if row['reference'] else None
+            if entry and entry[0] not in used:
+                if entry[1] == row['amount']:
+                    key = entry[0]
+                else:
+                    unmatched.append(_(
+                        "Line %(line)s: %(reference)s amount %(amount)s does not match %(expected)s",
+                        line=row['line'], reference=row['reference'], amount=row['amount'], expected=entry[1],
+                    ))
+                    continue
+            elif row['partner_ref']:
+                # Oldest open installment of the customer with this exact amount
+                candidates = by_partner_amount.get((row['partner_ref'], row['amount']), [])
+                while candidates and candidates[0] in used:
+                    candidates.pop(0)
+                key = candidates.pop(0) if candidates else None
+            if not key:
+                unmatched.append(_(
+                    "Line %(line)s: no open installment for reference '%(reference)s', customer '%(partner)s', amount %(amount)s",
+                    line=row['line'], reference=row['reference'], partner=row['partner_ref'], amount=row['amount'],
+                ))
+                continue
+            used.add(key)
+            target, record_id = key
+            matched[(target, row['date'] or today)].append(record_id)
+        return matched, unmatched
+
+    # Actions
+
+    def _import_rows(self, rows):
+        """Match one chunk of statement lines and mark the matched installments as paid.
+        Return (matched count, completed schedule count, unmatched messages)"""
+        by_reference, by_partner_amount = self._build_indexes(rows)
+        matched, unmatched = self._match_rows(rows, by_reference, by_partner_amount)
+
+        matched_count = 0
+        payment_ids = [rid for (target, _date), ids in matched.items() if target == 'payments' for rid in ids]
+        schedules = self.env['installment.payment'].browse(payment_ids).installment_schedule_id
+        completed_before = schedules.filtered(lambda s: s.state == 'completed')
+        for (target, paid_date), record_ids in matched.items():
+            model_name = TARGET_MODELS[target]
+            matched_count += len(self.env[model_name].browse(record_ids)._mark_paid_batch(paid_date))
+        completed_count = len(schedules.filtered(lambda s: s.state == 'completed') - completed_before)
+        return matched_count, completed_count, unmatched
+
+    def action_import(self):
+        """Match the statement lines chunk by chunk and mark the matched installments as paid"""
+        self.ensure_one()
+        unmatched = []
+        line_count = matched_count = completed_count = 0
+        # Installments paid by a chunk are no longer open for the next ones
+        for rows in self._read_statement(unmatched):
+            line_count += len(rows)
+            chunk_matched, chunk_completed, chunk_unmatched = self._import_rows(rows)
+            matched_count += chunk_matched
+            completed_count += chunk_completed
+            unmatched += chunk_unmatched
+
+        _logger.info(f"Statement {self.filename}: {matched_count} matched, {len(unmatched)} unmatched")
+        self.write({
+            'state': 'done',
+            'line_count': line_count,
+            'matched_count': matched_count,
+            'unmatched_count': len(unmatched),
+            'completed_schedule_count': completed_count,
+            'unmatched_lines': '\n'.join(unmatched),
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
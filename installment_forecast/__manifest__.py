@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+{
+    'name': 'Installment Cash-Flow Forecast',
+    'summary': 'Expected installment receipts per day from pre-aggregated buckets',
+    'description': """
+        Cash-flow forecast of the open installments and schedule payments:
+        - Daily buckets of the expected receipts per customer and currency,
+          kept up to date at the end of each transaction creating, paying,
+          adjusting or cancelling installments
+        - Amounts weighted by the historical on-time ratio of each customer
+        - Graph and pivot views per day, week or month over any horizon
+        - Daily job refreshing the on-time ratios and rebuilding the buckets
+    """,
+    'version': '18.0.1.0.0',
+    'category': 'Accounting/Invoicing',
+    'author': 'Your Company',
+    'website': 'https://www.yourcompany.com',
+    'depends': [
+        'base',
+        'invoice_installment_extension',
+        'enhanced_installment_system',
+    ],
+    'data': [
+        'security/ir.model.access.csv',
+        'data/installment_forecast_data.xml',
+        'views/installment_forecast_views.xml',
+    ],
+    'license': 'LGPL-3',
+    'installable': True,
+    'application': False,
+    'auto_install': False,
+}
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import installment_forecast
+from . import installment_models
+from . import res_partner
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+from collections import defaultdict
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Source of the buckets: model, table, open states, the amount still to
+# collect with the join it reads from and the fields to flush before reading it
+FORECAST_SOURCES = {
+    # Installments of partly reconciled invoices expect the residual of their receivable line
+    'installment': (
+        'installment.list', 'installment_list', ('pending', 'overdue'),
+        'COALESCE(aml.amount_residual_currency, src.amount)',
+        'LEFT JOIN account_move_line aml ON aml.id = src.move_line_id',
+        {'installment.list': ['amount', 'move_line_id'], 'account.move.line': ['amount_residual_currency']},
+    ),
+    'payment': (
+        'installment.payment', 'installment_payment', ('pending', 'overdue', 'adjusted'),
+        'src.amount_residual', '',
+        {'installment.payment': ['amount_residual']},
+    ),
+}
+
+class InstallmentForecast(models.Model):
+    _name = 'installment.forecast'
+    _description = 'Installment Cash-Flow Forecast'
+    _order = 'date, partner_id'
+    _rec_name = 'date'
+
+    # Bucket
+    date = fields.Date(string='Expected On', required=True, readonly=True, index=True)
+    source = fields.Selection([
+        ('installment', 'Invoice Installments'),
+        ('payment', 'Schedule Payments')
+    ], string='Source', required=True, readonly=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', required=True, readonly=True, index=True, ondelete='cascade')
+    currency_id = fields.Many2one('res.currency', string='Currency', required=True, readonly=True)
+
+    # Expected receipts
+    expected_count = fields.Integer(string='Open Installments', readonly=True)
+    amount = fields.Monetary(string='Expected Amount', currency_field='currency_id', readonly=True)
+    weighted_amount = fields.Monetary(string='Weighted Amount', currency_field='currency_id', readonly=True,
+                                      help="Expected amount weighted by the on-time payment ratio of the customer")
+
+    _sql_constraints = [
+        ('bucket_uniq', 'unique(date, source, partner_id, currency_id)', 'Only one forecast bucket is allowed per day, source, customer and currency.'),
+    ]
+
+    # Buckets are refreshed at the end of the transaction, writes only collect
+    # the (source, customer, day) keys whose open rows changed
+    _dirty_key = 'installment_forecast.dirty_buckets'
+
+    @api.model
+    def _mark_dirty(self, source, records):
+        """Queue the buckets of these installments for a refresh before the transaction commits"""
+        keys = {(source, record.partner_id.id, record.due_date) for record in records if record.partner_id and record.due_date}
+        if not keys:
+            return
+        precommit = self.env.cr.precommit
+        dirty_keys = precommit.data.get(self._dirty_key)
+        if dirty_keys is None:
+            dirty_keys = precommit.data[self._dirty_key] = set()
+            precommit.add(self._refresh_dirty_buckets)
+        dirty_keys.update(keys)
+
+    def _refresh_dirty_buckets(self):
+        """Refresh the buckets queued during the transaction"""
+        dirty_keys = self.env.cr.precommit.data.pop(self._dirty_key, None) or set()
+        keys_by_source = defaultdict(list)
+        for source, partner_id, date in dirty_keys:
+            keys_by_source[source].append((partner_id, date))
+        for source, keys in keys_by_source.items():
+            self._refresh(source, keys)
+
+    @api.model
+    def _refresh(self, source, keys=None):
+        """
+        Recompute the buckets of one source in one statement, for the given
+        (customer, day) keys or for the whole source when no keys are given.
+        """
+        if keys is not None and not keys:
+            return
+        model_name, table, open_states, amount_sql, amount_join, amount_fields = FORECAST_SOURCES[source]
+        self.env[model_name].flush_model(['partner_id', 'currency_id', 'due_date', 'state'])
+        for amount_model, fnames in amount_fields.items():
+            self.env[amount_model].flush_model(fnames)
+        self.env['res.partner'].flush_model(['installment_on_time_ratio'])
+
+        params = {
+            'source': source,
+            'open_states': open_states,
+            'uid': self.env.uid,
+        }
+        if keys is None:
+            key_join = ''
+            removed_filter = ''
+        else:
+            key_join = 'JOIN keys k ON k.partner_id = src.partner_id AND k.date = src.due_date'
+            removed_filter = 'AND (f.partner_id, f.date) IN (SELECT partner_id, date FROM keys)'
+            partner_ids, dates = zip(*keys)
+            params.update(partner_ids=list(partner_ids), dates=list(dates))
+
+        self.env.cr.execute(f"""
+            WITH keys AS (
+                SELECT DISTINCT * FROM unnest(%(partner_ids)s::int[], %(dates)s::date[]) AS k(partner_id, date)
+            ), buckets AS (
+                SELECT src.due_date AS date, src.partner_id, src.currency_id,
+                       COUNT(*) AS expected_count,
+                       SUM({amount_sql}) AS amount
+                  FROM {table} src
+                  {amount_join}
+                  {key_join}
+                 WHERE src.state IN %(open_states)s
+                   AND src.currency_id IS NOT NULL
+              GROUP BY src.due_date, src.partner_id, src.currency_id
+            ), removed AS (
+                DELETE FROM installment_forecast f
+                 WHERE f.source = %(source)s
+                   {removed_filter}
+                   AND NOT EXISTS (SELECT 1 FROM buckets b
+                                    WHERE b.date = f.date
+                                      AND b.partner_id = f.partner_id
+                                      AND b.currency_id = f.currency_id)
+            )
+            INSERT INTO installment_forecast (
+                date, source, partner_id, currency_id,
+                expected_count, amount, weighted_amount,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT b.date, %(source)s, b.partner_id, b.currency_id,
+                   b.expected_count, b.amount, b.amount * COALESCE(p.installment_on_time_ratio, 1.0),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+              FROM buckets b
+              JOIN res_partner p ON p.id = b.partner_id
+            ON CONFLICT (date, source, partner_id, currency_id) DO UPDATE
+               SET expected_count = EXCLUDED.expected_count,
+                   amount = EXCLUDED.amount,
+                   weighted_amount = EXCLUDED.weighted_amount,
+                   write_uid = EXCLUDED.write_uid,
+                   write_date = EXCLUDED.write_date
+        """, {'partner_ids': [], 'dates': [], **params})
+        self.invalidate_model()
+
+    @api.model
+    def _cron_rebuild_forecast(self):
+        """
+        Cron job refreshing the on-time ratios of the customers and rebuilding
+        all the buckets. Buckets are kept up to date between runs; the rebuild
+        applies the new ratios and picks up changes made outside the ORM.
+        """
+        updated = self.env['res.partner']._update_installment_on_time_ratio()
+        for source in FORECAST_SOURCES:
+            self._refresh(source)
+        self.env.cr.execute("SELECT COUNT(*) FROM installment_forecast")
+        bucket_count = self.env.cr.fetchone()[0]
+        _logger.info(f"Rebuilt {bucket_count} forecast buckets, {updated} customer on-time ratios changed")
+        return {'scanned': bucket_count, 'changed': updated}
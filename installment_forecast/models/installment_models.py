@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api
+
+
+# Installment changes queue their forecast buckets, old and new day
+
+class InstallmentList(models.Model):
+    _inherit = 'installment.list'
+
+    # Linked installments expect the residual of their receivable line
+    _forecast_trigger_fields = {'state', 'amount', 'due_date', 'partner_id', 'invoice_id', 'move_line_id'}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        installments = super().create(vals_list)
+        self.env['installment.forecast']._mark_dirty('installment', installments)
+        return installments
+
+    def write(self, vals):
+        if self._forecast_trigger_fields.isdisjoint(vals):
+            return super().write(vals)
+        forecast = self.env['installment.forecast']
+        forecast._mark_dirty('installment', self)
+        result = super().write(vals)
+        forecast._mark_dirty('installment', self)
+        return result
+
+    def unlink(self):
+        self.env['installment.forecast']._mark_dirty('installment', self)
+        return super().unlink()
+
+
+class InstallmentPayment(models.Model):
+    _inherit = 'installment.payment'
+
+    # amount_residual follows the principal and charges paid and the late charges
+    _forecast_trigger_fields = {
+        'state', 'amount', 'due_date', 'installment_schedule_id',
+        'principal_paid', 'charges_paid', 'late_fee', 'interest_rate',
+    }
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        payments = super().create(vals_list)
+        self.env['installment.forecast']._mark_dirty('payment', payments)
+        return payments
+
+    def write(self, vals):
+        if self._forecast_trigger_fields.isdisjoint(vals):
+            return super().write(vals)
+        forecast = self.env['installment.forecast']
+        forecast._mark_dirty('payment', self)
+        result = super().write(vals)
+        forecast._mark_dirty('payment', self)
+        return result
+
+    def unlink(self):
+        self.env['installment.forecast']._mark_dirty('payment', self)
+        return super().unlink()
+
+
+class AccountPartialReconcile(models.Model):
+    _inherit = 'account.partial.reconcile'
+
+    # Reconciling changes the residual of the receivable lines without
+    # writing the installments generated from them
+
+    def _mark_installments_dirty(self):
+        lines = self.debit_move_id | self.credit_move_id
+        installments = self.env['installment.list'].search([('move_line_id', 'in', lines.ids)])
+        self.env['installment.forecast']._mark_dirty('installment', installments)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        partials = super().create(vals_list)
+        partials._mark_installments_dirty()
+        return partials
+
+    def unlink(self):
+        self._mark_installments_dirty()
+        return super().unlink()
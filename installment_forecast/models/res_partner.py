@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api
+
+
+class ResPartner(models.Model):
+    _inherit = 'res.partner'
+
+    installment_on_time_ratio = fields.Float(
+        string='On-Time Payment Ratio', readonly=True, digits=(16, 4), default=1.0, copy=False,
+        help="Share of the paid installments and payments of the customer paid by their due date, "
+             "refreshed daily. Customers without payment history are expected to pay on time.")
+
+    @api.model
+    def _update_installment_on_time_ratio(self):
+        """Recompute the on-time ratio of the customers from their paid installments and payments"""
+        self.env['installment.list'].flush_model(['partner_id', 'state', 'due_date', 'paid_date'])
+        self.env['installment.payment'].flush_model(['partner_id', 'state', 'due_date', 'paid_date'])
+        self.env.cr.execute("""
+            WITH paid AS (
+                SELECT partner_id, paid_date <= due_date AS on_time
+                  FROM installment_list
+                 WHERE state = 'paid' AND paid_date IS NOT NULL
+                 UNION ALL
+                SELECT partner_id, paid_date <= due_date AS on_time
+                  FROM installment_payment
+                 WHERE state = 'paid' AND paid_date IS NOT NULL AND partner_id IS NOT NULL
+            ), ratios AS (
+                SELECT partner_id, ROUND(AVG(on_time::int), 4)::float AS ratio
+                  FROM paid
+              GROUP BY partner_id
+            )
+            UPDATE res_partner p
+               SET installment_on_time_ratio = r.ratio
+              FROM ratios r
+             WHERE p.id = r.partner_id
+               AND p.installment_on_time_ratio IS DISTINCT FROM r.ratio
+        """)
+        updated = self.env.cr.rowcount
+        self.invalidate_model(['installment_on_time_ratio'])
+        return updated
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+{
+    'name': 'Installment Metrics',
+    'summary': 'Timings, SQL query and row counts of the installment hot paths',
+    'description': """
+        Lightweight instrumentation of the installment modules:
+        - Invoicing, installment and payment term generation, pricelist expressions,
+          generation wizards and crons are measured per operation
+        - Calls, errors, time, SQL queries and rows aggregated in memory per worker
+        - Prometheus text endpoint: /installment_metrics/metrics
+          (bearer token in the installment_metrics.token system parameter)
+        - Performance Metrics dashboard summing every worker
+        - Sampling through the installment_metrics.sample_rate system parameter,
+          0 turns the instrumentation off
+        - Cron run history: duration, rows scanned and changed, queries, errors,
+          moving-average throughput and slow run alerts
+    """,
+    'version': '18.0.1.0.0',
+    'category': 'Accounting/Invoicing',
+    'author': 'Your Company',
+    'website': 'https://www.yourcompany.com',
+    'depends': [
+        'base',
+        'invoice_installment_extension',
+        'enhanced_installment_system',
+    ],
+    'data': [
+        'security/ir.model.access.csv',
+        'data/installment_metrics_data.xml',
+        'views/installment_metric_views.xml',
+        'views/installment_cron_run_views.xml',
+    ],
+    'license': 'LGPL-3',
+    'installable': True,
+    'application': False,
+    'auto_install': False,
+}
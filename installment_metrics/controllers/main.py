@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import os
+
+from werkzeug.exceptions import Forbidden
+
+from odoo import http
+from odoo.http import request
+from odoo.tools import consteq
+
+from .. import metrics
+
+TOKEN_PARAM = 'installment_metrics.token'
+
+# Prometheus metric -> (type, help, counter key)
+PROMETHEUS_METRICS = [
+    ('installment_operation_calls_total', 'counter', 'Measured calls', 'calls'),
+    ('installment_operation_errors_total', 'counter', 'Measured calls that raised', 'errors'),
+    ('installment_operation_duration_seconds_total', 'counter', 'Time spent in the operation', 'duration'),
+    ('installment_operation_queries_total', 'counter', 'SQL queries run by the operation', 'queries'),
+    ('installment_operation_rows_total', 'counter', 'Rows processed by the operation', 'rows'),
+    ('installment_operation_duration_seconds_max', 'gauge', 'Slowest measured call', 'max_duration'),
+]
+
+
+class InstallmentMetrics(http.Controller):
+
+    def _check_access(self):
+        """Scrapers authenticate with the configured bearer token, users must be administrators"""
+        token = request.env['ir.config_parameter'].sudo().get_param(TOKEN_PARAM)
+        authorization = request.httprequest.headers.get('Authorization', '')
+        if token and consteq(authorization, f'Bearer {token}'):
+            return
+        if not request.env.user._is_public() and request.env.user.has_group('base.group_system'):
+            return
+        raise Forbidden()
+
+    @http.route('/installment_metrics/metrics', type='http', auth='public', methods=['GET'], readonly=True)
+    def prometheus(self, **kw):
+        """Counters of the worker serving the request, in the Prometheus text format"""
+        self._check_access()
+        pid = os.getpid()
+        counters_by_operation = metrics.snapshot()
+        lines = [
+            '# HELP installment_metrics_sample_rate Share of the calls measured',
+            '# TYPE installment_metrics_sample_rate gauge',
+            f'installment_metrics_sample_rate{{pid="{pid}"}} {metrics.get_sample_rate(request.env)}',
+        ]
+        for name, metric_type, description, key in PROMETHEUS_METRICS:
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for operation, counters in sorted(counters_by_operation.items()):
+                lines.append(f'{name}{{operation="{operation}",pid="{pid}"}} {counters[key]}')
+        return request.make_response(
+            '\n'.join(lines) + '\n',
+            headers=[('Content-Type', 'text/plain; version=0.0.4; charset=utf-8'), ('Cache-Control', 'no-store')],
+        )
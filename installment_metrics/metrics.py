@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+In-memory metrics of the installment hot paths.
+
+Each worker process aggregates, per operation, the number of calls, errors,
+time, SQL queries and rows processed. The counters are read by the
+Prometheus endpoint and pushed to the installment.metric dashboard table.
+Only a configurable share of the calls is measured
+(installment_metrics.sample_rate), a rate of 0 turns the layer off.
+"""
+import functools
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from odoo import api, SUPERUSER_ID
+
+_logger = logging.getLogger(__name__)
+
+SAMPLE_RATE_PARAM = 'installment_metrics.sample_rate'
+FLUSH_KEY = 'installment_metrics.flush'
+# Seconds between two reads of the sample rate, and between two pushes to the dashboard
+SAMPLE_RATE_TTL = 60
+FLUSH_INTERVAL = 300
+
+COUNTERS = ('calls', 'errors', 'duration', 'queries', 'rows')
+
+_lock = threading.Lock()
+# operation -> counters since the worker started (Prometheus)
+_totals = {}
+# operation -> counters not pushed to the dashboard yet
+_pending = {}
+_last_flush = time.monotonic()
+# dbname -> (sample rate, monotonic time it was read)
+_sample_rates = {}
+
+
+def _new_counters():
+    return dict.fromkeys(COUNTERS, 0) | {'max_duration': 0.0}
+
+
+def get_sample_rate(env):
+    """Share of the calls to measure, cached for SAMPLE_RATE_TTL seconds"""
+    dbname = env.cr.dbname
+    rate, read_at = _sample_rates.get(dbname, (None, 0.0))
+    now = time.monotonic()
+    if rate is None or now - read_at > SAMPLE_RATE_TTL:
+        try:
+            rate = float(env['ir.config_parameter'].sudo().get_param(SAMPLE_RATE_PARAM, '1.0'))
+        except ValueError:
+            rate = 1.0
+        _sample_rates[dbname] = (rate, now)
+    return rate
+
+
+def record(operation, duration, queries=0, rows=0, error=False):
+    """Add one measured call to the worker counters"""
+    with _lock:
+        for counters in (_totals.setdefault(operation, _new_counters()),
+                         _pending.setdefault(operation, _new_counters())):
+            counters['calls'] += 1
+            counters['errors'] += int(error)
+            counters['duration'] += duration
+            counters['queries'] += queries
+            counters['rows'] += rows
+            counters['max_duration'] = max(counters['max_duration'], duration)
+
+
+def snapshot():
+    """Copy of the worker counters since it started"""
+    with _lock:
+        return {operation: dict(counters) for operation, counters in _totals.items()}
+
+
+def take_pending(force=False):
+    """Return and reset the counters not pushed yet, or None before FLUSH_INTERVAL"""
+    global _last_flush
+    with _lock:
+        if not _pending or (not force and time.monotonic() - _last_flush < FLUSH_INTERVAL):
+            return None
+        pending = {operation: dict(counters) for operation, counters in _pending.items()}
+        _pending.clear()
+        _last_flush = time.monotonic()
+        return pending
+
+
+class Probe:
+    """Handle of a measured call, the caller may set the processed row count"""
+    __slots__ = ('rows',)
+
+    def __init__(self, rows=0):
+        self.rows = rows
+
+
+@contextmanager
+def measure(env, operation, rows=0):
+    """Measure the block when the call is sampled"""
+    rate = get_sample_rate(env)
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        yield Probe(rows)
+        return
+
+    probe = Probe(rows)
+    cr = env.cr
+    queries = cr.sql_log_count
+    start = time.perf_counter()
+    error = False
+    try:
+        yield probe
+    except Exception:
+        error = True
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        record(operation, duration, cr.sql_log_count - queries, probe.rows, error)
+        # Push the counters to the dashboard once the transaction is over
+        if not cr.postcommit.data.get(FLUSH_KEY) and time.monotonic() - _last_flush >= FLUSH_INTERVAL:
+            cr.postcommit.data[FLUSH_KEY] = True
+            cr.postcommit.add(functools.partial(_flush_to_dashboard, env.registry))
+
+
+def instrumented(operation, rows=None):
+    """
+    Decorator measuring a model method as `operation`.
+    `rows(records, result)` gives the processed row count, the size of the
+    recordset by default.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with measure(self.env, operation) as probe:
+                result = method(self, *args, **kwargs)
+                probe.rows = rows(self, result) if rows else len(self)
+                return result
+        return wrapper
+    return decorator
+
+
+def _flush_to_dashboard(registry):
+    """Postcommit hook: add the pending counters to the installment.metric table"""
+    pending = take_pending()
+    if not pending:
+        return
+    try:
+        with registry.cursor() as cr:
+            api.Environment(cr, SUPERUSER_ID, {})['installment.metric']._add_counters(pending)
+    except Exception as e:
+        _logger.warning(f"Could not push installment metrics to the dashboard: {e}")
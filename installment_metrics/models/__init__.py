@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import installment_metric
+from . import installment_cron_run
+from . import instrumentation
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import functools
+import logging
+import time
+import traceback
+from datetime import timedelta
+
+_logger = logging.getLogger(__name__)
+
+
+def tracked_cron(operation):
+    """Decorator recording each run of a cron method in installment.cron.run"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return self.env['installment.cron.run']._track(operation, method, self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class InstallmentCronRun(models.Model):
+    _name = 'installment.cron.run'
+    _description = 'Installment Cron Run'
+    _order = 'start_date desc, id desc'
+    _rec_name = 'operation'
+
+    # Runs used for the moving averages
+    _moving_average_window = 10
+    # A run is flagged when it lasts this many times the average of the previous runs
+    _alert_factor = 2.0
+    # Runs shorter than this (seconds) are never flagged
+    _alert_min_duration = 1.0
+    # Previous runs needed before flagging
+    _alert_min_runs = 3
+    # Runs older than this (days) are removed
+    _history_days = 365
+
+    # Run
+    operation = fields.Char(string='Cron', required=True, readonly=True, index=True)
+    start_date = fields.Datetime(string='Start', required=True, readonly=True)
+    end_date = fields.Datetime(string='End', readonly=True)
+    duration = fields.Float(string='Duration (s)', readonly=True, digits=(16, 3))
+    state = fields.Selection([
+        ('done', 'Done'),
+        ('failed', 'Failed')
+    ], string='Status', required=True, readonly=True, default='done')
+    error_message = fields.Text(string='Error', readonly=True)
+
+    # Work done
+    rows_scanned = fields.Integer(string='Rows Scanned', readonly=True)
+    rows_changed = fields.Integer(string='Rows Changed', readonly=True)
+    query_count = fields.Integer(string='SQL Queries', readonly=True)
+    error_count = fields.Integer(string='Errors', readonly=True)
+
+    # Statistics
+    throughput = fields.Float(string='Rows per Second', readonly=True, digits=(16, 1))
+    avg_throughput = fields.Float(string='Average Rows per Second', readonly=True, digits=(16, 1),
+                                  help="Moving average over the last successful runs of the cron, this one included")
+    avg_duration = fields.Float(string='Average Duration (s)', readonly=True, digits=(16, 3),
+                                help="Moving average over the previous successful runs of the cron")
+    duration_alert = fields.Boolean(string='Slow Run', readonly=True, index=True,
+                                    help="The run lasted much longer than the previous runs of the cron")
+
+    @api.model
+    def _track(self, operation, method, records, *args, **kwargs):
+        """
+        Run the cron method and record the run. Cron methods may return a dict
+        with the `scanned`, `changed` and `errors` row counts, or a row count.
+        """
+        cr = self.env.cr
+        start_date = fields.Datetime.now()
+        queries = cr.sql_log_count
+        start = time.perf_counter()
+        try:
+            result = method(records, *args, **kwargs)
+        except Exception:
+            # The cron transaction is rolled back, keep the run in a cursor of its own
+            vals = self._prepare_run_vals(operation, start_date, start, cr.sql_log_count - queries, None)
+            vals.update(state='failed', error_count=vals['error_count'] + 1, error_message=traceback.format_exc())
+            with self.env.registry.cursor() as run_cr:
+                self.with_env(self.env(cr=run_cr))._record_run(vals)
+            raise
+        self._record_run(self._prepare_run_vals(operation, start_date, start, cr.sql_log_count - queries, result))
+        return result
+
+    @api.model
+    def _prepare_run_vals(self, operation, start_date, start, queries, result):
+        """Values of a run from the counts returned by the cron"""
+        duration = time.perf_counter() - start
+        if isinstance(result, dict):
+            scanned = result.get('scanned', 0)
+            changed = result.get('changed', 0)
+            errors = result.get('errors', 0)
+        elif isinstance(result, int) and not isinstance(result, bool):
+            scanned = changed = result
+            errors = 0
+        else:
+            scanned = changed = errors = 0
+        return {
+            'operation': operation,
+            'start_date': start_date,
+            'end_date': start_date + timedelta(seconds=duration),
+            'duration': duration,
+            'rows_scanned': scanned,
+            'rows_changed': changed,
+            'error_count': errors,
+            'query_count': queries,
+            'throughput': scanned / duration if duration else 0.0,
+        }
+
+    @api.model
+    def _record_run(self, vals):
+        """Create the run with the moving averages of the previous runs, alert on a duration jump"""
+        previous_runs = self.sudo().search_read([
+            ('operation', '=', vals['operation']),
+            ('state', '=', 'done'),
+        ], ['duration', 'throughput'], limit=self._moving_average_window, order='start_date desc, id desc')
+
+        if previous_runs:
+            vals['avg_duration'] = sum(run['duration'] for run in previous_runs) / len(previous_runs)
+        if vals.get('state', 'done') == 'done':
+            window = previous_runs[:self._moving_average_window - 1]
+            throughputs = [vals['throughput']] + [run['throughput'] for run in window]
+        else:
+            throughputs = [run['throughput'] for run in previous_runs]
+        if throughputs:
+            vals['avg_throughput'] = sum(throughputs) / len(throughputs)
+        vals['duration_alert'] = (
+            len(previous_runs) >= self._alert_min_runs
+            and vals['duration'] >= self._alert_min_duration
+            and vals['duration'] > self._alert_factor * vals.get('avg_duration', 0.0)
+        )
+
+        run = self.sudo().create(vals)
+        if run.duration_alert:
+            run._alert_slow_run()
+        return run
+
+    def _alert_slow_run(self):
+        """Warn the administrators that a cron run lasted much longer than usual"""
+        self.ensure_one()
+        message = _("%(cron)s took %(duration).1fs, the previous runs took %(average).1fs on average.",
+                    cron=self.operation, duration=self.duration, average=self.avg_duration)
+        _logger.warning(message)
+        self.env.ref('base.group_system').sudo().users._bus_send('simple_notification', {
+            'type': 'warning',
+            'title': _('Slow Cron Run'),
+            'message': message,
+            'sticky': True,
+        })
+
+    @api.autovacuum
+    def _gc_cron_runs(self):
+        """Remove the runs older than the history"""
+        limit_date = fields.Datetime.now() - timedelta(days=self._history_days)
+        self.sudo().search([('start_date', '<', limit_date)]).unlink()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+
+from .. import metrics
+
+_logger = logging.getLogger(__name__)
+
+
+class InstallmentMetric(models.Model):
+    _name = 'installment.metric'
+    _description = 'Installment Operation Metrics'
+    _order = 'total_duration desc'
+    _rec_name = 'operation'
+
+    # Operation
+    operation = fields.Char(string='Operation', required=True, readonly=True, index=True)
+
+    # Counters, summed over every worker
+    call_count = fields.Integer(string='Calls', readonly=True)
+    error_count = fields.Integer(string='Errors', readonly=True)
+    total_duration = fields.Float(string='Total Time (s)', readonly=True, digits=(16, 3))
+    max_duration = fields.Float(string='Slowest Call (s)', readonly=True, digits=(16, 3))
+    query_count = fields.Integer(string='SQL Queries', readonly=True)
+    row_count = fields.Integer(string='Rows', readonly=True)
+    last_update = fields.Datetime(string='Last Update', readonly=True)
+
+    # Averages
+    avg_duration = fields.Float(string='Average Time (s)', compute='_compute_averages', digits=(16, 4))
+    avg_queries = fields.Float(string='Queries per Call', compute='_compute_averages', digits=(16, 1))
+    avg_row_duration = fields.Float(string='Time per Row (ms)', compute='_compute_averages', digits=(16, 3))
+
+    _sql_constraints = [
+        ('operation_uniq', 'unique(operation)', 'Only one metric record is allowed per operation.'),
+    ]
+
+    @api.depends('call_count', 'total_duration', 'query_count', 'row_count')
+    def _compute_averages(self):
+        for metric in self:
+            calls = metric.call_count or 1
+            metric.avg_duration = metric.total_duration / calls
+            metric.avg_queries = metric.query_count / calls
+            metric.avg_row_duration = metric.total_duration * 1000 / metric.row_count if metric.row_count else 0.0
+
+    @api.model
+    def _add_counters(self, counters_by_operation):
+        """Add the counters of one worker, one upsert per operation"""
+        for operation, counters in counters_by_operation.items():
+            self.env.cr.execute("""
+                INSERT INTO installment_metric (operation, call_count, error_count, total_duration, max_duration,
+                                                query_count, row_count, last_update,
+                                                create_uid, create_date, write_uid, write_date)
+                VALUES (%(operation)s, %(calls)s, %(errors)s, %(duration)s, %(max_duration)s,
+                        %(queries)s, %(rows)s, now() AT TIME ZONE 'UTC',
+                        %(uid)s, now() AT TIME ZONE 'UTC', %(uid)s, now() AT TIME ZONE 'UTC')
+                ON CONFLICT (operation) DO UPDATE
+                   SET call_count = installment_metric.call_count + EXCLUDED.call_count,
+                       error_count = installment_metric.error_count + EXCLUDED.error_count,
+                       total_duration = installment_metric.total_duration + EXCLUDED.total_duration,
+                       max_duration = GREATEST(installment_metric.max_duration, EXCLUDED.max_duration),
+                       query_count = installment_metric.query_count + EXCLUDED.query_count,
+                       row_count = installment_metric.row_count + EXCLUDED.row_count,
+                       last_update = EXCLUDED.last_update,
+                       write_date = EXCLUDED.write_date
+            """, dict(counters, operation=operation, uid=self.env.uid))
+        self.invalidate_model()
+
+    @api.model
+    def _cron_flush_metrics(self):
+        """Cron job pushing the counters of the cron worker to the dashboard"""
+        pending = metrics.take_pending(force=True)
+        if pending:
+            self._add_counters(pending)
+
+    def action_reset(self):
+        """Reset the selected metrics"""
+        self.unlink()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Success'),
+                'message': _('The metrics have been reset.'),
+                'type': 'success',
+                'sticky': False,
+                'next': {'type': 'ir.actions.client', 'tag': 'soft_reload'},
+            }
+        }
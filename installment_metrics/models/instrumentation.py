@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api
+
+from ..metrics import instrumented
+from .installment_cron_run import tracked_cron
+
+
+def _returned_rows(records, result):
+    """Crons report the rows they processed as a count or a dict of counts"""
+    if isinstance(result, dict):
+        return result.get('scanned', 0)
+    return result if isinstance(result, int) and not isinstance(result, bool) else 0
+
+
+# Invoicing and installment generation
+
+class SaleOrder(models.Model):
+    _inherit = 'sale.order'
+
+    @instrumented('sale.order._create_invoices')
+    def _create_invoices(self, *args, **kwargs):
+        return super()._create_invoices(*args, **kwargs)
+
+
+class AccountMove(models.Model):
+    _inherit = 'account.move'
+
+    @instrumented('account.move._auto_generate_installments')
+    def _auto_generate_installments(self):
+        return super()._auto_generate_installments()
+
+    @instrumented('account.move._auto_generate_payment_terms')
+    def _auto_generate_payment_terms(self):
+        return super()._auto_generate_payment_terms()
+
+
+class ProductPricelistItem(models.Model):
+    _inherit = 'product.pricelist.item'
+
+    @instrumented('product.pricelist.item._compute_price')
+    def _compute_price(self, *args, **kwargs):
+        return super()._compute_price(*args, **kwargs)
+
+
+# Wizard generators
+
+class PaymentTermGenerationWizard(models.TransientModel):
+    _inherit = 'payment.term.generation.wizard'
+
+    @instrumented('payment.term.generation.wizard.action_generate_payment_term')
+    def action_generate_payment_term(self):
+        return super().action_generate_payment_term()
+
+
+class InstallmentGenerationWizard(models.TransientModel):
+    _inherit = 'installment.generation.wizard'
+
+    @instrumented('installment.generation.wizard.action_generate_installments',
+                  rows=lambda wizard, result: len(wizard.payment_schedule_ids))
+    def action_generate_installments(self):
+        return super().action_generate_installments()
+
+
+# Crons
+
+class InstallmentList(models.Model):
+    _inherit = 'installment.list'
+
+    @api.model
+    @instrumented('installment.list._cron_check_overdue_installments', rows=_returned_rows)
+    @tracked_cron('installment.list._cron_check_overdue_installments')
+    def _cron_check_overdue_installments(self):
+        return super()._cron_check_overdue_installments()
+
+
+class InstallmentPayment(models.Model):
+    _inherit = 'installment.payment'
+
+    @api.model
+    @instrumented('installment.payment._cron_check_overdue_payments', rows=_returned_rows)
+    @tracked_cron('installment.payment._cron_check_overdue_payments')
+    def _cron_check_overdue_payments(self):
+        return super()._cron_check_overdue_payments()
+
+    @api.model
+    @instrumented('installment.payment._cron_send_payment_reminders', rows=_returned_rows)
+    @tracked_cron('installment.payment._cron_send_payment_reminders')
+    def _cron_send_payment_reminders(self):
+        return super()._cron_send_payment_reminders()
+
+
+class InstallmentReminder(models.Model):
+    _inherit = 'installment.reminder'
+
+    @api.model
+    @instrumented('installment.reminder._cron_send_payment_reminders', rows=_returned_rows)
+    @tracked_cron('installment.reminder._cron_send_payment_reminders')
+    def _cron_send_payment_reminders(self):
+        return super()._cron_send_payment_reminders()
+
+    @api.model
+    @instrumented('installment.reminder._cron_send_overdue_reminders', rows=_returned_rows)
+    @tracked_cron('installment.reminder._cron_send_overdue_reminders')
+    def _cron_send_overdue_reminders(self):
+        return super()._cron_send_overdue_reminders()
+
+
+class GuarantorExposure(models.Model):
+    _inherit = 'installment.guarantor.exposure'
+
+    @api.model
+    @instrumented('installment.guarantor.exposure._cron_rebuild_exposure', rows=_returned_rows)
+    def _cron_rebuild_exposure(self):
+        return super()._cron_rebuild_exposure()
+
+
+class AccountPaymentTerm(models.Model):
+    _inherit = 'account.payment.term'
+
+    @api.model
+    @instrumented('account.payment.term._cron_archive_unused_installment_terms', rows=_returned_rows)
+    def _cron_archive_unused_installment_terms(self):
+        return super()._cron_archive_unused_installment_terms()
@@ -31,6 +31,7 @@
         'views/payment_term_wizard_views.xml',
         'views/installment_list_views.xml',
         'views/res_partner_installment_views.xml',
+        'views/guarantor_exposure_views.xml',
         'views/menu_views.xml',
     ],
     'i18n': [
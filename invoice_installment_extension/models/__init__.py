@@ -5,3 +5,5 @@ from . import account_payment_term
 from . import payment_term_wizard
 from . import installment_list
 from . import res_partner
+from . import guarantor_exposure
+from . import sale_order
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
+from collections import defaultdict
+
 from odoo import models, fields, api, _
+from odoo.exceptions import UserError
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -22,51 +25,72 @@ class AccountMove(models.Model):
     view_generate = fields.Boolean(string='View generate', default=False, groups="base.group_allow_export" )
 
 
-    @api.model
-    def create(self, vals):
-        move = super().create(vals)
-        
-        # Auto-generate payment terms if installment data is present
-        if move.installment_num > 0:
-            move._auto_generate_payment_terms()
-            
-        return move
+    # Payment term generation is deferred to the end of the transaction,
+    # writes only collect the ids of the moves to process
+    _payment_term_dirty_key = 'invoice_installment_extension.payment_term_dirty'
+    _payment_term_trigger_fields = {'installment_num', 'first_payment', 'invoice_payment_term_id', 'invoice_line_ids', 'line_ids'}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        moves = super().create(vals_list)
+        moves.filtered(lambda m: m.installment_num > 0)._mark_payment_terms_dirty()
+        return moves
 
     def write(self, vals):
         result = super().write(vals)
-        
-        # Auto-generate payment terms if installment data is updated
-        for move in self:
-            if move.installment_num > 0 and not move.invoice_payment_term_id:
-                move._auto_generate_payment_terms()
-                
+        if not self._payment_term_trigger_fields.isdisjoint(vals):
+            self._mark_payment_terms_dirty()
         return result
 
+    def _mark_payment_terms_dirty(self):
+        """Queue the moves for payment term generation before the transaction commits"""
+        if not self:
+            return
+        precommit = self.env.cr.precommit
+        dirty_ids = precommit.data.get(self._payment_term_dirty_key)
+        if dirty_ids is None:
+            dirty_ids = precommit.data[self._payment_term_dirty_key] = set()
+            precommit.add(self._generate_dirty_payment_terms)
+        dirty_ids.update(self.ids)
+
+    def _pop_dirty_payment_terms(self, move_ids=None):
+        """Remove moves from the dirty set and return the ones still needing a payment term"""
+        dirty_ids = self.env.cr.precommit.data.get(self._payment_term_dirty_key) or set()
+        move_ids = dirty_ids & set(move_ids) if move_ids is not None else set(dirty_ids)
+        dirty_ids -= move_ids
+        return self.browse(move_ids).exists().filtered(
+            lambda m: m.state == 'draft' and m.installment_num > 0 and not m.invoice_payment_term_id
+        )
+
+    def _generate_dirty_payment_terms(self):
+        """Precommit hook: generate the payment terms of every move marked dirty in the transaction"""
+        moves = self._pop_dirty_payment_terms()
+        self.env.cr.precommit.data.pop(self._payment_term_dirty_key, None)
+        if moves:
+            moves._auto_generate_payment_terms()
+            self.env.flush_all()
+
     def _auto_generate_payment_terms(self):
         """Automatically generate payment terms based on installment data"""
+        # Moves with the same installment data share one payment term
+        moves_by_key = defaultdict(lambda: self.browse())
         for move in self:
-            if move.installment_num <= 0:
+            if move.installment_num <= 0 or move.amount_total <= 0:
                 continue
-                
+            moves_by_key[(move.installment_num, move.first_payment, move.amount_total)] |= move
+
+        for (installment_num, first_payment, total_amount), moves in moves_by_key.items():
             try:
-                # Calculate total amount
-                total_amount = move.amount_total
-                if total_amount <= 0:
-                    continue
-                
-                # Create installment payment term
                 payment_term = self.env['account.payment.term'].create_installment_term(
-                    installment_num=move.installment_num,
-                    first_payment=move.first_payment,
+                    installment_num=installment_num,
+                    first_payment=first_payment,
                     total_amount=total_amount
                 )
-                
                 if payment_term:
-                    move.invoice_payment_term_id = payment_term.id
-                    _logger.info(f"Auto-generated payment term {payment_term.name} for invoice {move.name}")
-                    
+                    moves.invoice_payment_term_id = payment_term.id
+                    _logger.info(f"Assigned payment term {payment_term.name} to {len(moves)} invoices")
             except Exception as e:
-                _logger.error(f"Error auto-generating payment terms for invoice {move.name}: {e}")
+                _logger.error(f"Error auto-generating payment terms for invoices {moves.ids}: {e}")
 
     def action_generate_payment_term(self):
         """Open wizard to generate payment term manually"""
@@ -88,78 +112,113 @@ class AccountMove(models.Model):
             }
         }
 
-    def action_post(self):
-        """Override action_post to automatically generate installments after confirmation"""
-        result = super().action_post()
-        
-        # Auto-generate installments after invoice confirmation
-        for move in self:
-            if move.installment_num > 0 and not move.installment_list_ids:
-                move._auto_generate_installments()
-                
-        return result
+    def _post(self, soft=True):
+        """Generate the installment lists of the posted invoices in one batch"""
+        # Payment terms of moves edited in this transaction are needed to post
+        self._pop_dirty_payment_terms(self.ids)._auto_generate_payment_terms()
+        posted = super()._post(soft=soft)
+
+        to_generate = posted.filtered(lambda m: m.installment_num > 0 and not m.installment_list_ids)
+        failures = to_generate._auto_generate_installments()
+        if failures:
+            to_generate._report_installment_failures(failures)
+        return posted
 
     def _auto_generate_installments(self):
-        """Automatically generate installment list from payment terms after invoice confirmation"""
-        for move in self:
-            if move.installment_num <= 0:
-                continue
-                
+        """
+        Generate the installment lists of the moves in one batch.
+        Return {move: error message} for the moves that could not be processed.
+        """
+        moves = self.filtered(lambda m: m.installment_num > 0)
+        # Clear existing installment lists if any
+        moves.installment_list_ids.unlink()
+
+        # Receivable lines of all the moves in one query
+        receivable_rows = moves._generate_from_receivable_lines()
+
+        vals_by_move = {}
+        failures = {}
+        for move in moves:
             try:
-                # Clear existing installment list if any
-                if move.installment_list_ids:
-                    move.installment_list_ids.unlink()
-                
-                installment_list = []
-                
-                # Method 1: Generate from payment terms if they exist
-                if move.invoice_payment_term_id and move.invoice_payment_term_id.line_ids:
-                    installment_list = self._generate_from_payment_terms(move)
+                # From the receivable lines of the payment terms, otherwise from installment_num
+                if move.invoice_payment_term_id and receivable_rows.get(move.id):
+                    installment_list = receivable_rows[move.id]
                 else:
-                    # Method 2: Generate from installment_num field
                     installment_list = self._generate_from_installment_num(move)
-                
-                # Create installment records
-                if installment_list:
-                    self.env['installment.list'].create(installment_list)
-                    _logger.info(f"Auto-generated {len(installment_list)} installments for invoice {move.name}")
-                else:
-                    _logger.warning(f"No installments could be generated for invoice {move.name}")
-                    
             except Exception as e:
                 _logger.error(f"Error auto-generating installments for invoice {move.name}: {e}")
-
-    def _generate_from_payment_terms(self, move):
-        """Generate installments from payment term lines"""
-        installment_list = []
-        sequence = 1
-        
-        for line in move.invoice_payment_term_id.line_ids:
-            if line.value == 'percent':
-                amount = move.amount_total * line.value_amount / 100
-            elif line.value == 'fixed':
-                amount = line.value_amount
-            else:
+                failures[move] = str(e)
                 continue
-            
-            # Calculate due date
-            due_date = fields.Date.today()
-            if line.nb_days > 0:
-                from datetime import timedelta
-                due_date = due_date + timedelta(days=line.nb_days)
-            
-            installment_list.append({
+            if installment_list:
+                vals_by_move[move] = installment_list
+            else:
+                failures[move] = _("No installments could be generated.")
+
+        if not vals_by_move:
+            return failures
+        try:
+            with self.env.cr.savepoint():
+                self.env['installment.list'].create([vals for vals_list in vals_by_move.values() for vals in vals_list])
+        except Exception as e:
+            # Isolate the faulty invoices
+            _logger.warning(f"Batch installment generation failed, retrying invoice by invoice: {e}")
+            for move, vals_list in vals_by_move.items():
+                try:
+                    with self.env.cr.savepoint():
+                        self.env['installment.list'].create(vals_list)
+                except Exception as e:
+                    _logger.error(f"Error auto-generating installments for invoice {move.name}: {e}")
+                    failures[move] = str(e)
+        generated = [move for move in vals_by_move if move not in failures]
+        _logger.info(f"Auto-generated installments for {len(generated)} invoices")
+        return failures
+
+    def _report_installment_failures(self, failures):
+        """Log the generation errors on the invoices and notify the current user"""
+        for move, message in failures.items():
+            move.message_post(body=_("Installments could not be generated: %s", message))
+        self.env.user._bus_send('simple_notification', {
+            'type': 'warning',
+            'title': _('Installments'),
+            'message': _(
+                "Installments could not be generated for %(count)s invoice(s): %(names)s",
+                count=len(failures),
+                names=', '.join(move.name for move in failures),
+            ),
+            'sticky': True,
+        })
+
+    def _generate_from_receivable_lines(self):
+        """
+        Return {move_id: [installment vals]} built from the receivable lines
+        accounting computed from the payment terms, one installment per line.
+        """
+        lines = self.env['account.move.line'].search_read(
+            [
+                ('move_id', 'in', self.ids),
+                ('display_type', '=', 'payment_term'),
+                ('account_id.account_type', '=', 'asset_receivable'),
+            ],
+            ['move_id', 'date_maturity', 'amount_currency'],
+            order='move_id, date_maturity, id',
+            load=None,
+        )
+        partner_ids = {move.id: move.partner_id.id for move in self}
+        installments = defaultdict(list)
+        for line in lines:
+            move_installments = installments[line['move_id']]
+            sequence = len(move_installments) + 1
+            move_installments.append({
                 'name': f"Installment {sequence}",
                 'sequence': sequence,
-                'invoice_id': move.id,
-                'partner_id': move.partner_id.id,
-                'amount': amount,
-                'due_date': due_date,
+                'invoice_id': line['move_id'],
+                'move_line_id': line['id'],
+                'partner_id': partner_ids[line['move_id']],
+                'amount': abs(line['amount_currency']),
+                'due_date': line['date_maturity'],
                 'state': 'pending',
             })
-            sequence += 1
-        
-        return installment_list
+        return installments
 
     def _generate_from_installment_num(self, move):
         """Generate installments from installment_num field when payment terms don't exist"""
@@ -222,33 +281,31 @@ class AccountMoveLine(models.Model):
         help="First payment amount for installment calculations"
     )
 
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to transfer installment data from sale order line"""
-        line = super().create(vals)
-        
-        # Transfer installment data from sale order line if available
-        if line.sale_line_ids and len(line.sale_line_ids) == 1:
-            sale_line = line.sale_line_ids[0]
-            if hasattr(sale_line, 'installment_num') and hasattr(sale_line, 'first_payment'):
-                line.installment_num = sale_line.installment_num
-                line.first_payment = sale_line.first_payment
-                _logger.info(f"Transferred installment data from sale line {sale_line.id} to move line {line.id}")
-        
-        return line
+        lines = super().create(vals_list)
+        lines.filtered('sale_line_ids')._sync_installment_data_from_sale_line()
+        return lines
 
     def write(self, vals):
         """Override write to handle installment data updates"""
         result = super().write(vals)
-        
-        # Update installment data if sale line is updated
-        for line in self:
-            if line.sale_line_ids and len(line.sale_line_ids) == 1:
-                sale_line = line.sale_line_ids[0]
-                if hasattr(sale_line, 'installment_num') and hasattr(sale_line, 'first_payment'):
-                    if line.installment_num != sale_line.installment_num or line.first_payment != sale_line.first_payment:
-                        line.installment_num = sale_line.installment_num
-                        line.first_payment = sale_line.first_payment
-                        _logger.info(f"Updated installment data for move line {line.id}")
-        
+        if 'sale_line_ids' in vals:
+            self._sync_installment_data_from_sale_line()
         return result
+
+    def _sync_installment_data_from_sale_line(self):
+        """Copy the installment data of the sale order line to lines invoicing a single one"""
+        sale_fields = self.env['sale.order.line']._fields
+        if 'installment_num' not in sale_fields or 'first_payment' not in sale_fields:
+            return
+        for line in self:
+            if len(line.sale_line_ids) != 1:
+                continue
+            sale_line = line.sale_line_ids
+            if line.installment_num != sale_line.installment_num or line.first_payment != sale_line.first_payment:
+                line.write({
+                    'installment_num': sale_line.installment_num,
+                    'first_payment': sale_line.first_payment,
+                })
@@ -28,7 +28,7 @@ class AccountPaymentTerm(models.Model):
 
     @api.model
     def create_installment_term(self, installment_num, first_payment=0, total_amount=0, payment_interval=30):
-        """Create a payment term for installments"""
+        """Return the payment term for these installments, reusing an identical one when it exists"""
         try:
             payment_term_lines = []
 
@@ -58,16 +58,18 @@ class AccountPaymentTerm(models.Model):
                         'delay_type': 'days_after',
                     })
 
-            # Create payment term
-            payment_term = self.create({
-                'name': f'Installment Terms ({installment_num} installments)',
-                'is_installment_term': True,
-                'installment_count': int(installment_num),
-                'first_payment_percentage': (first_payment / total_amount) * 100 if total_amount > 0 else 0,
-                'line_ids': [(0, 0, line) for line in payment_term_lines]
-            })
+            # Reuse the payment term with the same lines, if any
+            payment_term = self._get_installment_term(
+                payment_term_lines,
+                name=f'Installment Terms ({installment_num} installments)',
+                vals={
+                    'is_installment_term': True,
+                    'installment_count': int(installment_num),
+                    'first_payment_percentage': (first_payment / total_amount) * 100 if total_amount > 0 else 0,
+                },
+            )
 
-            _logger.info(f"Created installment payment term with {len(payment_term_lines)} lines")
+            _logger.info(f"Using installment payment term {payment_term.id} with {len(payment_term_lines)} lines")
             return payment_term
 
         except Exception as e:
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class GuarantorExposure(models.Model):
+    _name = 'installment.guarantor.exposure'
+    _description = 'Guarantor Exposure'
+    _order = 'total_exposure desc'
+    _rec_name = 'partner_id'
+
+    # Guarantor
+    partner_id = fields.Many2one('res.partner', string='Guarantor', required=True, index=True, readonly=True, ondelete='cascade')
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True, default=lambda self: self.env.company.currency_id)
+
+    # Guaranteed invoices (open installments)
+    invoice_count = fields.Integer(string='Guaranteed Invoices', readonly=True)
+    installment_count = fields.Integer(string='Open Installments', readonly=True)
+    invoice_exposure = fields.Monetary(string='Open Installment Amount', currency_field='currency_id', readonly=True)
+
+    # Guaranteed sale orders (confirmed, not yet invoiced)
+    order_count = fields.Integer(string='Guaranteed Orders', readonly=True)
+    order_exposure = fields.Monetary(string='Uninvoiced Order Amount', currency_field='currency_id', readonly=True)
+
+    total_exposure = fields.Monetary(string='Total Exposure', currency_field='currency_id', readonly=True)
+
+    _sql_constraints = [
+        ('partner_uniq', 'unique(partner_id)', 'Only one exposure record is allowed per guarantor.'),
+    ]
+
+    @api.model
+    def _refresh(self, partner_ids):
+        """Recompute the exposure rows of the given guarantors in one statement"""
+        partner_ids = sorted({pid for pid in partner_ids if pid})
+        if not partner_ids:
+            return
+
+        self.env['installment.list'].flush_model(['invoice_id', 'amount', 'state'])
+        self.env['account.move'].flush_model(['customer_guarantees_ids'])
+        self.env['sale.order'].flush_model(['customer_guarantees_ids', 'state', 'invoice_status', 'amount_total'])
+
+        params = {
+            'partner_ids': partner_ids,
+            'currency_id': self.env.company.currency_id.id,
+            'uid': self.env.uid,
+        }
+        self.env.cr.execute("""
+            WITH invoice_side AS (
+                SELECT rel.partner_id,
+                       COUNT(DISTINCT il.invoice_id) AS invoice_count,
+                       COUNT(il.id) AS installment_count,
+                       SUM(il.amount) AS amount
+                  FROM account_move_customer_guarantees_rel rel
+                  JOIN installment_list il ON il.invoice_id = rel.account_move_id
+                 WHERE rel.partner_id = ANY(%(partner_ids)s)
+                   AND il.state IN ('pending', 'overdue')
+              GROUP BY rel.partner_id
+            ), order_side AS (
+                SELECT rel.partner_id,
+                       COUNT(so.id) AS order_count,
+                       SUM(so.amount_total) AS amount
+                  FROM sale_order_customer_guarantees_rel rel
+                  JOIN sale_order so ON so.id = rel.sale_order_id
+                 WHERE rel.partner_id = ANY(%(partner_ids)s)
+                   AND so.state = 'sale'
+                   AND so.invoice_status = 'to invoice'
+              GROUP BY rel.partner_id
+            ), removed AS (
+                DELETE FROM installment_guarantor_exposure
+                 WHERE partner_id = ANY(%(partner_ids)s)
+                   AND partner_id NOT IN (SELECT partner_id FROM invoice_side
+                                          UNION ALL
+                                          SELECT partner_id FROM order_side)
+            )
+            INSERT INTO installment_guarantor_exposure (
+                partner_id, currency_id,
+                invoice_count, installment_count, invoice_exposure,
+                order_count, order_exposure, total_exposure,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT p.partner_id, %(currency_id)s,
+                   COALESCE(i.invoice_count, 0), COALESCE(i.installment_count, 0), COALESCE(i.amount, 0),
+                   COALESCE(o.order_count, 0), COALESCE(o.amount, 0),
+                   COALESCE(i.amount, 0) + COALESCE(o.amount, 0),
+                   %(uid)s, NOW() AT TIME ZONE 'UTC', %(uid)s, NOW() AT TIME ZONE 'UTC'
+              FROM (SELECT partner_id FROM invoice_side
+                    UNION
+                    SELECT partner_id FROM order_side) p
+         LEFT JOIN invoice_side i ON i.partner_id = p.partner_id
+         LEFT JOIN order_side o ON o.partner_id = p.partner_id
+            ON CONFLICT (partner_id) DO UPDATE
+               SET invoice_count = EXCLUDED.invoice_count,
+                   installment_count = EXCLUDED.installment_count,
+                   invoice_exposure = EXCLUDED.invoice_exposure,
+                   order_count = EXCLUDED.order_count,
+                   order_exposure = EXCLUDED.order_exposure,
+                   total_exposure = EXCLUDED.total_exposure,
+                   write_uid = EXCLUDED.write_uid,
+                   write_date = EXCLUDED.write_date
+        """, params)
+        self.invalidate_model()
+        self.env['res.partner']._invalidate_credit_snapshot()
+
+    @api.model
+    def _get_exposure_by_partner(self, partner_ids):
+        """Return {partner_id: total_exposure} for the given guarantors"""
+        if not partner_ids:
+            return {}
+        self.flush_model(['partner_id', 'total_exposure'])
+        self.env.cr.execute("""
+            SELECT partner_id, total_exposure
+              FROM installment_guarantor_exposure
+             WHERE partner_id = ANY(%s)
+        """, [list(partner_ids)])
+        return dict(self.env.cr.fetchall())
+
+    @api.model
+    def _cron_rebuild_exposure(self):
+        """Cron job to rebuild the exposure index from the guarantee tables"""
+        self.env.cr.execute("""
+            SELECT partner_id FROM account_move_customer_guarantees_rel
+             UNION
+            SELECT partner_id FROM sale_order_customer_guarantees_rel
+             UNION
+            SELECT partner_id FROM installment_guarantor_exposure
+        """)
+        partner_ids = [row[0] for row in self.env.cr.fetchall()]
+        self._refresh(partner_ids)
+        _logger.info(f"Rebuilt guarantor exposure for {len(partner_ids)} partners")
+
+    def action_view_guaranteed_installments(self):
+        """Open the open installments guaranteed by this partner"""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Guaranteed Installments'),
+            'res_model': 'installment.list',
+            'view_mode': 'list,form',
+            'domain': [
+                ('invoice_id.customer_guarantees_ids', 'in', self.partner_id.ids),
+                ('state', 'in', ('pending', 'overdue')),
+            ],
+        }
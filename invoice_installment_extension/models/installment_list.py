@@ -6,9 +6,9 @@ import logging
 
 _logger = logging.getLogger(__name__)
 
-
 class InstallmentList(models.Model):
     _name = 'installment.list'
+    _inherit = ['installment.period.mixin']
     _description = 'Installment Payment List'
     _order = 'sequence, due_date'
     _rec_name = 'display_name'
@@ -16,14 +16,18 @@ class InstallmentList(models.Model):
     # Basic Information
     name = fields.Char(string='Installment Reference', required=True, copy=False, readonly=True, default=lambda self: _('New'))
     sequence = fields.Integer(string='Sequence', default=1, help="Installment sequence number")
-    invoice_id = fields.Many2one('account.move', string='Invoice', required=True, ondelete='cascade')
+    invoice_id = fields.Many2one('account.move', string='Invoice', required=True, index=True, ondelete='cascade')
     payment_term_id = fields.Many2one('account.payment.term', string='Payment Term', related='invoice_id.invoice_payment_term_id', store=True)
+    move_line_id = fields.Many2one('account.move.line', string='Journal Item', index='btree_not_null', ondelete='set null', readonly=True, copy=False, help="Receivable line this installment was generated from")
     
     # Payment Details
     amount = fields.Monetary(string='Amount', currency_field='currency_id', required=True)
     currency_id = fields.Many2one('res.currency', string='Currency', related='invoice_id.currency_id', store=True, readonly=True)
     due_date = fields.Date(string='Due Date', required=True)
     paid_date = fields.Date(string='Paid Date', readonly=True)
+    paid_by_reconciliation = fields.Boolean(string='Paid by Reconciliation', readonly=True, copy=False,
+                                            help="Settled by the payments reconciled with the invoice, reopened if they are unreconciled")
+    amount_residual = fields.Monetary(string='Amount Due', currency_field='currency_id', related='move_line_id.amount_residual_currency')
     
     # Status and Tracking
     state = fields.Selection([
@@ -44,12 +48,12 @@ class InstallmentList(models.Model):
     days_overdue = fields.Integer(string='Days Overdue', compute='_compute_days_overdue')
     
     # Related Information
-    partner_id = fields.Many2one('res.partner', string='Customer', required=True)
+    partner_id = fields.Many2one('res.partner', string='Customer', required=True, index=True)
     customer_name = fields.Char(string='Customer Name', related='partner_id.name', store=True)
     customer_number = fields.Char(string='Customer Number', related='partner_id.ref', store=True)
-    customer_guarantees_names = fields.Char(string='Customer Guarantees', compute='_compute_customer_guarantees_names', store=True)
+    customer_guarantees_names = fields.Char(string='Customer Guarantees', compute='_compute_customer_guarantees_names', search='_search_customer_guarantees_names')
     
-    @api.depends('invoice_id.customer_guarantees_ids.name')
+    @api.depends('invoice_id.customer_guarantees_ids')
     def _compute_customer_guarantees_names(self):
         for installment in self:
             if installment.invoice_id and installment.invoice_id.customer_guarantees_ids:
@@ -58,6 +62,10 @@ class InstallmentList(models.Model):
             else:
                 installment.customer_guarantees_names = ''
     
+    def _search_customer_guarantees_names(self, operator, value):
+        """Search through the guarantors of the invoice (trigram index on partner name)"""
+        return [('invoice_id.customer_guarantees_ids.name', operator, value)]
+    
     @api.depends('sequence', 'amount', 'due_date')
     def _compute_display_name(self):
         for installment in self:
@@ -82,11 +90,41 @@ class InstallmentList(models.Model):
             else:
                 installment.days_overdue = 0
     
-    @api.model
-    def create(self, vals):
-        if vals.get('name', _('New')) == _('New'):
-            vals['name'] = self.env['ir.sequence'].next_by_code('installment.list') or _('New')
-        return super().create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        to_name = [vals for vals in vals_list if vals.get('name', _('New')) == _('New')]
+        names = self.env['ir.sequence'].next_batch_by_code('installment.list', len(to_name))
+        for vals, name in zip(to_name, names):
+            vals['name'] = name or _('New')
+        installments = super().create(vals_list)
+        installments._refresh_guarantor_exposure()
+        return installments
+
+    def write(self, vals):
+        tracked = {'state', 'amount', 'invoice_id'} & set(vals)
+        guarantor_ids = self._get_guarantor_ids() if tracked else []
+        result = super().write(vals)
+        if tracked or 'due_date' in vals or 'partner_id' in vals:
+            self.env['res.partner']._invalidate_credit_snapshot()
+        if tracked:
+            self.env['installment.guarantor.exposure']._refresh(guarantor_ids + self._get_guarantor_ids())
+        return result
+
+    def unlink(self):
+        guarantor_ids = self._get_guarantor_ids()
+        result = super().unlink()
+        self.env['res.partner']._invalidate_credit_snapshot()
+        self.env['installment.guarantor.exposure']._refresh(guarantor_ids)
+        return result
+
+    def _get_guarantor_ids(self):
+        """Return the guarantors of the invoices of these installments"""
+        return self.invoice_id.customer_guarantees_ids.ids
+
+    def _refresh_guarantor_exposure(self):
+        """Update the guarantor exposure index for these installments"""
+        self.env['res.partner']._invalidate_credit_snapshot()
+        self.env['installment.guarantor.exposure']._refresh(self._get_guarantor_ids())
     
     def action_mark_paid(self):
         """Mark installment as paid"""
@@ -94,14 +132,38 @@ class InstallmentList(models.Model):
         if self.state != 'pending':
             raise UserError(_("Only pending installments can be marked as paid"))
         
-        self.write({
+        self._mark_paid_batch()
+
+    def _get_reconciled_coverage(self, available):
+        """Return whether the reconciled amount available on the invoice covers
+        this installment, and how much of it the installment takes"""
+        currency = self.invoice_id.currency_id
+        if self.move_line_id:
+            # The receivable line of the installment tells what is left to pay
+            return currency.is_zero(self.amount_residual), self.amount - self.amount_residual
+        covered = currency.compare_amounts(available, self.amount) >= 0
+        # Oldest first: an uncovered installment absorbs what is left
+        return covered, self.amount if covered else available
+
+    def _mark_paid_batch(self, paid_date=None):
+        """Mark the payable installments of the recordset as paid in one write"""
+        installments = self.filtered(lambda i: i.state in ('pending', 'overdue'))
+        if not installments:
+            return installments
+        installments.write({
             'state': 'paid',
-            'paid_date': fields.Date.today(),
+            'paid_date': paid_date or fields.Date.today(),
         })
-        
-        # Check if all installments are paid
-        if all(i.state == 'paid' for i in self.invoice_id.installment_list_ids):
-            _logger.info(f"All installments paid for invoice {self.invoice_id.name}")
+
+        # Invoices left without any unpaid installment
+        invoices = installments.invoice_id
+        unpaid = self._read_group(
+            [('invoice_id', 'in', invoices.ids), ('state', '!=', 'paid')],
+            ['invoice_id'],
+        )
+        for invoice in invoices - self.env['account.move'].union(*(invoice for invoice, in unpaid)):
+            _logger.info(f"All installments paid for invoice {invoice.name}")
+        return installments
     
     def action_mark_overdue(self):
         """Mark installment as overdue"""
@@ -121,16 +183,16 @@ class InstallmentList(models.Model):
     
     @api.model
     def _cron_check_overdue_installments(self):
-        """Cron job to check for overdue installments"""
+        """Cron job to check for overdue installments, returns the scanned and changed row counts"""
         today = fields.Date.today()
         overdue_installments = self.search([
             ('state', '=', 'pending'),
             ('due_date', '<', today)
         ])
         
-        for installment in overdue_installments:
-            installment.action_mark_overdue()
-            _logger.info(f"Installment {installment.name} marked as overdue")
+        overdue_installments.write({'state': 'overdue'})
+        _logger.info(f"{len(overdue_installments)} installments marked as overdue")
+        return {'scanned': len(overdue_installments), 'changed': len(overdue_installments)}
 
 
 class AccountMove(models.Model):
@@ -171,6 +233,31 @@ class AccountMove(models.Model):
             # Calculate remaining amount
             move.total_remaining_amount = move.amount_total - move.total_paid_amount
     
+    @api.model_create_multi
+    def create(self, vals_list):
+        moves = super().create(vals_list)
+        if any('customer_guarantees_ids' in vals for vals in vals_list):
+            self.env['installment.guarantor.exposure']._refresh(moves.customer_guarantees_ids.ids)
+        return moves
+
+    def write(self, vals):
+        if 'customer_guarantees_ids' not in vals:
+            return super().write(vals)
+        guarantor_ids = self.customer_guarantees_ids.ids
+        result = super().write(vals)
+        self.env['installment.guarantor.exposure']._refresh(guarantor_ids + self.customer_guarantees_ids.ids)
+        return result
+
+    def unlink(self):
+        guarantor_ids = self.customer_guarantees_ids.ids
+        result = super().unlink()
+        self.env['installment.guarantor.exposure']._refresh(guarantor_ids)
+        return result
+
+    def _sync_installments_from_payments(self):
+        super()._sync_installments_from_payments()
+        self._sync_installment_records_from_payments('installment.list')
+
     def action_view_installment_list(self):
         """Open installment list view"""
         self.ensure_one()
@@ -197,6 +284,8 @@ class AccountMove(models.Model):
             raise UserError(_("Installment list already exists for this invoice"))
         
         # Use the automatic generation method
-        self._auto_generate_installments()
+        failures = self._auto_generate_installments()
+        if failures:
+            raise UserError(_("Installments could not be generated: %s", failures[self]))
         
         return self.action_view_installment_list()
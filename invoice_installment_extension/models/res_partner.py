@@ -7,6 +7,9 @@ from odoo import models, fields, api, _
 class ResPartner(models.Model):
     _inherit = 'res.partner'
 
+    # Trigram index so guarantor name searches on installments stay indexed
+    name = fields.Char(index='trigram')
+
     # Installment Information
     installment_list_ids = fields.One2many('installment.list', 'partner_id', string='Installment List')
     has_installments = fields.Boolean(string='Has Installments', compute='_compute_installment_info', store=True)
@@ -18,6 +21,12 @@ class ResPartner(models.Model):
     total_installment_amount = fields.Monetary(string='Total Installment Amount', currency_field='currency_id', compute='_compute_installment_info', store=True)
     total_paid_amount = fields.Monetary(string='Total Paid Amount', currency_field='currency_id', compute='_compute_installment_info', store=True)
     total_remaining_amount = fields.Monetary(string='Remaining Amount', currency_field='currency_id', compute='_compute_installment_info', store=True)
+    guaranteed_exposure = fields.Monetary(string='Guaranteed Exposure', currency_field='currency_id', compute='_compute_guaranteed_exposure')
+
+    def _compute_guaranteed_exposure(self):
+        exposure = self.env['installment.guarantor.exposure']._get_exposure_by_partner(self._origin.ids)
+        for partner in self:
+            partner.guaranteed_exposure = exposure.get(partner._origin.id, 0.0)
     
     @api.depends('installment_list_ids', 'installment_list_ids.state', 'installment_list_ids.amount')
     def _compute_installment_info(self):
@@ -35,6 +44,41 @@ class ResPartner(models.Model):
             partner.total_paid_amount = sum(paid_installments.mapped('amount'))
             partner.total_remaining_amount = partner.total_installment_amount - partner.total_paid_amount
     
+    @api.model
+    def _read_credit_snapshot(self, partner_ids):
+        """Read status, overdue installments and guaranteed exposure in one query"""
+        self.flush_model(['status'])
+        self.env['installment.list'].flush_model(['partner_id', 'state', 'due_date'])
+        self.env['installment.guarantor.exposure'].flush_model(['partner_id', 'total_exposure'])
+        self.env.cr.execute("""
+            SELECT p.id AS partner_id,
+                   p.status,
+                   COALESCE(ov.overdue_count, 0) AS overdue_count,
+                   COALESCE(ge.total_exposure, 0.0) AS exposure
+              FROM res_partner p
+         LEFT JOIN LATERAL (
+                       SELECT COUNT(*) AS overdue_count
+                         FROM installment_list il
+                        WHERE il.partner_id = p.id
+                          AND (il.state = 'overdue'
+                               OR (il.state = 'pending' AND il.due_date < CURRENT_DATE))
+                   ) ov ON TRUE
+         LEFT JOIN installment_guarantor_exposure ge ON ge.partner_id = p.id
+             WHERE p.id = ANY(%s)
+        """, [partner_ids])
+        return self.env.cr.dictfetchall()
+
+    @api.model
+    def _get_credit_hold_reasons(self, row):
+        blocking, flags = super()._get_credit_hold_reasons(row)
+        if row.get('overdue_count'):
+            flags.append(_("%s overdue installment(s)") % row['overdue_count'])
+        max_exposure = float(self.env['ir.config_parameter'].sudo().get_param(
+            'invoice_installment_extension.max_guaranteed_exposure', 0.0) or 0.0)
+        if max_exposure and row.get('exposure', 0.0) > max_exposure:
+            flags.append(_("Guaranteed exposure %.2f exceeds %.2f") % (row['exposure'], max_exposure))
+        return blocking, flags
+
     def action_view_installments(self):
         """Open installment list view for this customer"""
         self.ensure_one()
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class SaleOrder(models.Model):
+    _inherit = 'sale.order'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        orders = super().create(vals_list)
+        if any('customer_guarantees_ids' in vals for vals in vals_list):
+            self.env['installment.guarantor.exposure']._refresh(orders.customer_guarantees_ids.ids)
+        return orders
+
+    def write(self, vals):
+        if not {'customer_guarantees_ids', 'state'} & set(vals):
+            return super().write(vals)
+        guarantor_ids = self.customer_guarantees_ids.ids
+        result = super().write(vals)
+        self.env['installment.guarantor.exposure']._refresh(guarantor_ids + self.customer_guarantees_ids.ids)
+        return result
+
+    def _create_invoices(self, *args, **kwargs):
+        """Refresh guarantor exposure once invoicing moved amounts off the orders"""
+        moves = super()._create_invoices(*args, **kwargs)
+        self.env['installment.guarantor.exposure']._refresh(self.customer_guarantees_ids.ids)
+        return moves
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import test_performance
+from . import test_installment_sync
+from . import test_payment_term
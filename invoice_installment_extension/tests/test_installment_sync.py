@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+
+@tagged('post_install', '-at_install')
+class TestInstallmentSync(AccountTestInvoicingCommon):
+
+    def setUp(self):
+        super().setUp()
+        self.invoice = self.env['account.move'].create({
+            'move_type': 'out_invoice',
+            'partner_id': self.partner_a.id,
+            'invoice_date': fields.Date.today(),
+            'invoice_line_ids': [(0, 0, {
+                'product_id': self.product_a.id,
+                'quantity': 1.0,
+                'price_unit': 1000.0,
+                'tax_ids': [],
+            })],
+        })
+        self.invoice.action_post()
+        self.invoice.installment_list_ids.unlink()
+        self.first, self.second = self.env['installment.list'].create([{
+            'sequence': sequence,
+            'invoice_id': self.invoice.id,
+            'partner_id': self.invoice.partner_id.id,
+            'amount': 500.0,
+            'due_date': fields.Date.today() + timedelta(days=30 * sequence),
+        } for sequence in (1, 2)])
+
+    def _register_payment(self, amount):
+        self.env['account.payment.register'].with_context(
+            active_model='account.move', active_ids=self.invoice.ids,
+        ).create({'amount': amount})._create_payments()
+
+    def test_reconcile_keeps_installments_paid_elsewhere(self):
+        # As the statement import does
+        self.second._mark_paid_batch()
+
+        self._register_payment(200.0)
+        self.assertEqual(self.second.state, 'paid')
+        self.assertEqual(self.first.state, 'pending')
+
+        self._register_payment(300.0)
+        self.assertEqual(self.first.state, 'paid')
+        self.assertTrue(self.first.paid_by_reconciliation)
+        self.assertEqual(self.second.state, 'paid')
+        self.assertFalse(self.second.paid_by_reconciliation)
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from odoo.tests import tagged
+
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
+
+@tagged('post_install', '-at_install')
+class TestInstallmentPaymentTerm(AccountTestInvoicingCommon):
+
+    def test_terms_differing_on_installment_values_are_not_shared(self):
+        PaymentTerm = self.env['account.payment.term']
+        lines = [{
+            'value': 'percent',
+            'value_amount': 100.0 / 3,
+            'nb_days': 30 * (i + 1),
+            'delay_type': 'days_after',
+        } for i in range(3)]
+        # Same lines as the extension builds, created without its values
+        generic = PaymentTerm._get_installment_term(lines, name="Installment Terms (3 installments)")
+
+        term = PaymentTerm.create_installment_term(3, total_amount=900.0)
+        self.assertNotEqual(term, generic)
+        self.assertTrue(term.is_installment_term)
+        self.assertFalse(generic.is_installment_term)
+
+        term.action_archive()
+        self.assertEqual(PaymentTerm.create_installment_term(3, total_amount=900.0), term)
+        self.assertTrue(term.active)
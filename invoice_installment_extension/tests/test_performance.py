@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import tagged
+
+from odoo.addons.account_invoice_installments.tests.common import InstallmentPerformanceCase
+
+
+@tagged('post_install', '-at_install', 'performance')
+class TestInstallmentPerformance(InstallmentPerformanceCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.product_a.invoice_policy = 'order'
+        cls.installment_term = cls.env['account.payment.term'].create_installment_term(
+            installment_num=3, first_payment=0, total_amount=1000.0,
+        )
+
+    # Data
+
+    def _create_orders(self, count, lines_per_order=1, **order_vals):
+        orders = self.env['sale.order'].create([{
+            'partner_id': self.partner_a.id,
+            'order_line': [(0, 0, {
+                'product_id': self.product_a.id,
+                'product_uom_qty': 1.0,
+                'price_unit': 1000.0,
+            }) for _line in range(lines_per_order)],
+            **order_vals,
+        } for _order in range(count)])
+        orders.action_confirm()
+        return orders
+
+    def _create_invoices(self, count, **invoice_vals):
+        return self.env['account.move'].create([{
+            'move_type': 'out_invoice',
+            'partner_id': self.partner_a.id,
+            'invoice_date': fields.Date.today(),
+            'installment_num': 3,
+            'invoice_payment_term_id': self.installment_term.id,
+            'invoice_line_ids': [(0, 0, {
+                'product_id': self.product_a.id,
+                'quantity': 1.0,
+                'price_unit': 1000.0,
+                'tax_ids': [],
+            })],
+            **invoice_vals,
+        } for _invoice in range(count)])
+
+    def _create_installments(self, count, **installment_vals):
+        invoice = self._create_invoices(1)
+        invoice.action_post()
+        invoice.installment_list_ids.unlink()
+        return self.env['installment.list'].create([{
+            'sequence': sequence,
+            'invoice_id': invoice.id,
+            'partner_id': invoice.partner_id.id,
+            'amount': 100.0,
+            'due_date': fields.Date.today() - timedelta(days=10),
+            'state': 'pending',
+            **installment_vals,
+        } for sequence in range(1, count + 1)])
+
+    # Sale order invoicing
+
+    def test_create_invoices(self):
+        """Standard invoicing, one invoice per order"""
+        self.assertScales(
+            lambda size: self._create_orders(size),
+            lambda orders: orders._create_invoices(),
+            # Each invoice syncs its own dynamic lines (receivable, taxes) and
+            # links its sale lines; the installment lists are generated in batch
+            per_record=60,
+            time_budget=30.0,
+        )
+
+    def test_create_invoices_per_line(self):
+        """One invoice per order line, the cost must stay linear in the lines"""
+        self.assertScales(
+            lambda size: self._create_orders(1, lines_per_order=size, invoice_per_line=True),
+            lambda orders: orders._create_invoices(),
+            # Each invoice syncs its own dynamic lines (receivable, taxes) and
+            # links its sale line; the installment lists are generated in batch
+            per_record=80,
+            time_budget=30.0,
+        )
+
+    # Pricing
+
+    def test_compute_price_expression(self):
+        """Expression rules are evaluated without extra queries per product"""
+        pricelist = self.env['product.pricelist'].create({
+            'name': 'Installment Pricelist',
+            'item_ids': [(0, 0, {
+                'applied_on': '3_global',
+                'compute_price': 'expression',
+                'price_expression': 'round(price * (1 + installment_num / 100), 2) - first_payment / qty',
+            })],
+        })
+
+        def setup(size):
+            return self.env['product.product'].create([{
+                'name': f'Installment Product {index}',
+                'list_price': 100.0 + index,
+                'standard_price': 50.0,
+            } for index in range(size)])
+
+        self.assertScales(
+            setup,
+            lambda products: pricelist.with_context(installment_num=12, first_payment=10.0)._get_products_price(products, 1.0),
+        )
+
+    # Installment generation
+
+    def test_auto_generate_installments(self):
+        """Installment lists of a batch of posted invoices are inserted at once"""
+        def setup(size):
+            moves = self._create_invoices(size)
+            moves.action_post()
+            return moves
+
+        self.assertScales(setup, lambda moves: moves._auto_generate_installments())
+
+    def test_post_invoices(self):
+        """Posting generates the installment lists of all the invoices in one batch"""
+        self.assertScales(
+            lambda size: self._create_invoices(size),
+            lambda moves: moves.action_post(),
+            # Each invoice takes its number from the journal sequence and is
+            # checked and hashed on its own; its installments are inserted in batch
+            per_record=40,
+            time_budget=20.0,
+        )
+
+    # Crons
+
+    def test_cron_check_overdue_installments(self):
+        self.assertScales(
+            lambda size: self._create_installments(size),
+            lambda installments: installments._cron_check_overdue_installments(),
+            # The state write refreshes the guarantor exposure, the portal
+            # summaries and the forecast buckets of the changed installments
+            per_record=3,
+        )
+
+    # Customers
+
+    def test_partner_name_search(self):
+        """Searching customers by number does not read the partners one by one"""
+        def setup(size):
+            return self.env['res.partner'].create([{
+                'name': f'Customer {size}-{index}',
+                'ref': f'PERF{size}-{index:05d}',
+            } for index in range(size)])
+
+        self.assertScales(
+            setup,
+            lambda partners: self.env['res.partner'].name_search(partners[0].ref.split('-')[0]),
+        )